@@ -21,11 +21,191 @@ limitations under the License.
 
 """
 
-import numpy as np
+import os
 import copy
+import glob
+import json
+import hashlib
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 
 # from scipy.interpolate import RectBivariateSpline
 
+# directory of the parsed-polar cache of Airfoil.initFromAerodynFile and Airfoil.dataGridFromAerodynFile.
+# The cache is disabled (empty string) unless the CCBLADE_POLAR_CACHE environment variable, or this
+# variable, names a directory.
+polar_cache_dir = os.environ.get("CCBLADE_POLAR_CACHE", "")
+
+# version of the cached data, to be increased whenever the parser or createDataGrid changes what
+# is stored, so that older cache files are not used
+_polar_cache_version = 2
+
+
+def _polarCachePath(aerodynFile, suffix, options=()):
+    """path of the cache file of an AeroDyn file, or None if the cache is disabled.  The name
+    is "<file hash>-<options hash>-v<cache version>-<mtime>-<size><suffix>": the file and the
+    options the data were produced with identify the entry, and editing the file or changing
+    the cache version invalidates it."""
+
+    if not polar_cache_dir:
+        return None
+
+    aerodynFile = os.path.abspath(aerodynFile)
+    stat = os.stat(aerodynFile)
+    prefix = hashlib.blake2b(aerodynFile.encode(), digest_size=12).hexdigest()
+    key = hashlib.blake2b(repr(tuple(options)).encode(), digest_size=6).hexdigest()
+    name = f"{prefix}-{key}-v{_polar_cache_version}-{stat.st_mtime_ns}-{stat.st_size}{suffix}"
+    return os.path.join(polar_cache_dir, name)
+
+
+def _writePolarCache(path, suffix, save, data):
+    """write a cache file atomically and remove stale versions of it (same file and options, but
+    another cache version, mtime or size).  The cache is best-effort: errors (e.g. read-only
+    directory) are ignored."""
+
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            save(f, data)
+        os.replace(tmp, path)
+
+        prefix, key = os.path.basename(path).split("-")[:2]
+        for stale in glob.glob(os.path.join(directory, f"{prefix}-{key}-v*{suffix}")):
+            if stale != path:
+                os.remove(stale)
+    except OSError:
+        pass
+
+
+def _packGrid(alpha, Re, cl, cd, cm):
+    """store a data grid (see Airfoil.createDataGrid) as one (1 + nalpha) x (1 + 3 nRe) array:
+    Re in the first row, then rows of (alpha, cl[nRe], cd[nRe], cm[nRe])"""
+
+    grid = np.zeros((1 + len(alpha), 1 + 3 * len(Re)))
+    grid[0, 1 : len(Re) + 1] = Re
+    grid[1:] = np.c_[alpha, cl, cd, cm]
+    return grid
+
+
+def _unpackGrid(grid):
+    """alpha, Re, cl, cd, cm views of an array stored by _packGrid"""
+
+    nRe = (grid.shape[1] - 1) // 3
+    alpha = grid[1:, 0]
+    Re = grid[0, 1 : nRe + 1]
+    cl, cd, cm = (grid[1:, 1 + k * nRe : 1 + (k + 1) * nRe] for k in range(3))
+    return alpha, Re, cl, cd, cm
+
+
+def _readAerodynTables(aerodynFile):
+    """parse the tables of an AeroDyn airfoil file, v13 (tables ended by EOT) or v15
+    (AirfoilInfo: keyword lines, NumAlf rows per table).  Each table block is located first
+    and converted in bulk.
+
+    Returns
+    -------
+    tables : list
+        (Re, data) of each table, data a read-only (nalpha, 4) array of alpha, cl, cd, cm
+    """
+
+    with open(aerodynFile, "r") as f:
+        text = f.read()
+    lines = text.splitlines()
+
+    # v15 files are keyword based: "value  Keyword  ! description"
+    def keywordLines(key):
+        return [j for j in _matchLines(key, text) if lines[j].split()[1:2] == [key]]
+
+    tables = []
+    if keywordLines("NumTabs"):
+        Re = keywordLines("Re")
+        NumAlf = keywordLines("NumAlf")
+        for i, j in zip(Re, NumAlf):
+            nalpha = int(lines[j].split()[0])
+            j += 1
+            while j < len(lines) and (not lines[j].strip() or lines[j].lstrip().startswith("!")):
+                j += 1  # column names and units
+            tables.append((float(lines[i].split()[0]) * 1e6, _parseTable(lines[j : j + nalpha], 3)))
+
+    else:
+        numTables = int(lines[3].split()[0])
+        EOT = _matchLines("EOT", text)
+        k = 4
+        for i in range(numTables):
+            end = min(j for j in EOT if j > k + 8)
+            tables.append((float(lines[k].split()[0]) * 1e6, _parseTable(lines[k + 9 : end], 4)))
+            k = end + 1  # the table starts after the Reynolds number and 8 parameter lines
+
+    return tables
+
+
+def _matchLines(word, text):
+    """numbers of the lines containing a string in text"""
+
+    lines = []
+    line = 0
+    start = 0
+    pos = text.find(word)
+    while pos >= 0:
+        line += text.count("\n", start, pos)
+        lines.append(line)
+        start = text.find("\n", pos)  # continue on the next line
+        if start < 0:
+            break
+        pos = text.find(word, start)
+
+    return lines
+
+
+def _parseTable(rows, mincols):
+    """(nrows, 4) read-only array of alpha, cl, cd, cm from the text rows of a table (cm is zero
+    if there are only 3 columns, which needs mincols = 3)"""
+
+    values = " ".join(rows).split()
+    ncols = len(rows[0].split()) if rows else 4
+    if ncols >= mincols and len(values) == ncols * len(rows):
+        data = np.array(values, dtype=float).reshape(len(rows), ncols)
+    else:
+        data = [[float(x) for x in row.split()] for row in rows]
+        for row in data:
+            if len(row) < mincols:
+                raise ValueError(f"Error: Expected {mincols} columns of data but found, {row}")
+        ncols = min(len(row) for row in data)
+        data = np.array([row[:ncols] for row in data])
+
+    table = np.zeros((len(rows), 4))
+    table[:, : min(ncols, 4)] = data[:, :4]
+    table.flags.writeable = False
+    return table
+
+
+def _readOnly(x):
+    """x as a read-only array, copied only if it is a writable array owned by the caller"""
+
+    a = np.asarray(x)
+    if a is x and a.flags.writeable:
+        a = a.copy()
+    a.flags.writeable = False
+    return a
+
+
+def _interpColumns(x, xp, fp):
+    """np.interp(x, xp, fp[:, k]) for all columns k of fp, with the same operations"""
+
+    j = np.clip(np.searchsorted(xp, x, side="right") - 1, 0, len(xp) - 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = (fp[j + 1] - fp[j]) / (xp[j + 1] - xp[j])[:, np.newaxis]
+        f = slope * (x - xp[j])[:, np.newaxis] + fp[j]
+        f = np.where(np.isnan(f), slope * (x - xp[j + 1])[:, np.newaxis] + fp[j + 1], f)
+    f = np.where(np.isnan(f) & (fp[j] == fp[j + 1]), fp[j], f)
+    f = np.where((xp[j] == x)[:, np.newaxis], fp[j], f)
+    f = np.where((x >= xp[-1])[:, np.newaxis], fp[-1], f)
+    return np.where((x < xp[0])[:, np.newaxis], fp[0], f)
+
 
 class Polar(object):
     """
@@ -49,13 +229,18 @@ class Polar(object):
             drag coefficient
         cm : ndarray
             moment coefficient
+
+        Notes
+        -----
+        The arrays are stored read-only, so polars can be shared instead of copied.  Read-only
+        inputs (e.g. from another polar) are used without a copy.
         """
 
         self.Re = Re
-        self.alpha = np.array(alpha)
-        self.cl = np.array(cl)
-        self.cd = np.array(cd)
-        self.cm = np.array(cm)
+        self.alpha = _readOnly(alpha)
+        self.cl = _readOnly(cl)
+        self.cd = _readOnly(cd)
+        self.cm = _readOnly(cm)
 
     def blend(self, other, weight):
         """Blend this polar with another one with the specified weighting
@@ -206,196 +391,231 @@ class Polar(object):
         If the current polar already supplies data beyond 90 degrees then
         this method cannot be used in its current form and will just return itself.
 
+        This polar is not modified.  The Viterna parameters (cdmax, A, B and, with moment
+        coefficients, cm0) are attributes of the returned polar.
+
         If AR is provided, then the maximum drag coefficient is estimated as
 
         >>> cdmax = 1.11 + 0.018*AR
 
+        Polar.extrapolateArrays extrapolates many polars on a common grid at once.
 
         """
 
+        alpha, cl, cd, cm, params = self.__extrapolate(self.alpha, self.cl, self.cd, self.cm, cdmax, AR, cdmin, nalpha)
+        polar = type(self)(self.Re, alpha, cl[:, 0], cd[:, 0], cm[:, 0])
+
+        # the model parameters go on the new polar: this one may be shared (see Airfoil.getPolar)
+        polar.cdmax, polar.A, polar.B = (x[0] for x in params[:3])
+        if params[3] is not None:
+            polar.cm0 = params[3][0]
+
+        return polar
+
+    @staticmethod
+    def extrapolateArrays(alpha, cl, cd, cm, cdmax, AR=None, cdmin=0.001, nalpha=15):
+        """Polar.extrapolate for many polars on a common angle of attack grid at once, e.g. the
+        tables of all stations and Reynolds numbers of a blade.  Each polar gives the same
+        result as Polar.extrapolate.
+
+        Parameters
+        ----------
+        alpha : ndarray (deg)
+            angle of attack, shape (n_alpha,)
+        cl, cd, cm : ndarray
+            lift, drag and moment coefficients, with shape (n_alpha, ...).  cm may be None
+            (no moment coefficients).
+        cdmax, AR, cdmin, nalpha :
+            see Polar.extrapolate
+
+        Returns
+        -------
+        alpha : ndarray (deg)
+            angle of attack from -180 to 180 deg, shape (n_ext,)
+        cl, cd, cm : ndarray
+            extrapolated coefficients, shape (n_ext, ...)
+        """
+
+        alpha = np.asarray(alpha, dtype=float)
+        shape = np.shape(cl)[1:]
+        cl, cd = (np.asarray(x, dtype=float).reshape(len(alpha), -1) for x in (cl, cd))
+        cm = np.zeros_like(cl) if cm is None else np.asarray(cm, dtype=float).reshape(len(alpha), -1)
+
+        alpha, cl, cd, cm, _ = Polar.__extrapolate(alpha, cl, cd, cm, cdmax, AR, cdmin, nalpha)
+        return (alpha,) + tuple(x.reshape((len(alpha),) + shape) for x in (cl, cd, cm))
+
+    @staticmethod
+    def __extrapolate(alpha, cl, cd, cm, cdmax, AR, cdmin, nalpha):
+        """private method: extrapolate the columns of cl, cd, cm (polars on the grid alpha).
+        Returns alpha (deg), cl, cd, cm and the model parameters (cdmax, A, B, cm0)."""
+
         if cdmin < 0:
             raise Exception("cdmin cannot be < 0")
 
+        alpha = np.asarray(alpha, dtype=float)
+        cl, cd, cm = (np.asarray(x, dtype=float).reshape(len(alpha), -1) for x in (cl, cd, cm))
+
         # lift coefficient adjustment to account for assymetry
         cl_adj = 0.7
 
         # estimate CD max
         if AR is not None:
             cdmax = 1.11 + 0.018 * AR
-        self.cdmax = max(max(self.cd), cdmax)
+        cdmax = np.maximum(np.max(cd, axis=0), cdmax)
 
         # extract matching info from ends
-        alpha_high = np.radians(self.alpha[-1])
-        cl_high = self.cl[-1]
-        cd_high = self.cd[-1]
-        cm_high = self.cm[-1]
+        alpha_high = np.radians(alpha[-1])
+        cl_high = cl[-1]
+        cd_high = cd[-1]
+        cm_high = cm[-1]
 
-        alpha_low = np.radians(self.alpha[0])
-        cl_low = self.cl[0]
-        cd_low = self.cd[0]
+        alpha_low = np.radians(alpha[0])
+        cl_low = cl[0]
+        cd_low = cd[0]
 
         if alpha_high > np.pi / 2:
             raise Exception("alpha[-1] > pi/2")
-            return self
         if alpha_low < -np.pi / 2:
             raise Exception("alpha[0] < -pi/2")
-            return self
 
         # parameters used in model
         sa = np.sin(alpha_high)
         ca = np.cos(alpha_high)
-        self.A = (cl_high - self.cdmax * sa * ca) * sa / ca ** 2
-        self.B = (cd_high - self.cdmax * sa * sa) / ca
+        A = (cl_high - cdmax * sa * ca) * sa / ca**2
+        B = (cd_high - cdmax * sa * sa) / ca
+
+        def viterna(alpha, cl_adj):
+            return Polar.__Viterna(alpha, cl_adj, cdmax, A, B)
 
         # alpha_high <-> 90
         alpha1 = np.linspace(alpha_high, np.pi / 2, nalpha)
         alpha1 = alpha1[1:]  # remove first element so as not to duplicate when concatenating
-        cl1, cd1 = self.__Viterna(alpha1, 1.0)
+        cl1, cd1 = viterna(alpha1, 1.0)
 
         # 90 <-> 180-alpha_high
         alpha2 = np.linspace(np.pi / 2, np.pi - alpha_high, nalpha)
         alpha2 = alpha2[1:]
-        cl2, cd2 = self.__Viterna(np.pi - alpha2, -cl_adj)
+        cl2, cd2 = viterna(np.pi - alpha2, -cl_adj)
 
         # 180-alpha_high <-> 180
         alpha3 = np.linspace(np.pi - alpha_high, np.pi, nalpha)
         alpha3 = alpha3[1:]
-        cl3, cd3 = self.__Viterna(np.pi - alpha3, 1.0)
-        cl3 = (alpha3 - np.pi) / alpha_high * cl_high * cl_adj  # override with linear variation
+        cl3, cd3 = viterna(np.pi - alpha3, 1.0)
+        cl3 = ((alpha3 - np.pi) / alpha_high)[:, np.newaxis] * cl_high * cl_adj  # override with linear variation
 
         if alpha_low <= -alpha_high:
             alpha4 = []
-            cl4 = []
-            cd4 = []
+            cl4 = np.zeros((0, cl.shape[1]))
+            cd4 = np.zeros((0, cl.shape[1]))
             alpha5max = alpha_low
         else:
             # -alpha_high <-> alpha_low
             # Note: this is done slightly differently than AirfoilPrep for better continuity
             alpha4 = np.linspace(-alpha_high, alpha_low, nalpha)
             alpha4 = alpha4[1:-2]  # also remove last element for concatenation for this case
-            cl4 = -cl_high * cl_adj + (alpha4 + alpha_high) / (alpha_low + alpha_high) * (cl_low + cl_high * cl_adj)
-            cd4 = cd_low + (alpha4 - alpha_low) / (-alpha_high - alpha_low) * (cd_high - cd_low)
+            a4 = alpha4[:, np.newaxis]
+            cl4 = -cl_high * cl_adj + (a4 + alpha_high) / (alpha_low + alpha_high) * (cl_low + cl_high * cl_adj)
+            cd4 = cd_low + (a4 - alpha_low) / (-alpha_high - alpha_low) * (cd_high - cd_low)
             alpha5max = -alpha_high
 
         # -90 <-> -alpha_high
         alpha5 = np.linspace(-np.pi / 2, alpha5max, nalpha)
         alpha5 = alpha5[1:]
-        cl5, cd5 = self.__Viterna(-alpha5, -cl_adj)
+        cl5, cd5 = viterna(-alpha5, -cl_adj)
 
         # -180+alpha_high <-> -90
         alpha6 = np.linspace(-np.pi + alpha_high, -np.pi / 2, nalpha)
         alpha6 = alpha6[1:]
-        cl6, cd6 = self.__Viterna(alpha6 + np.pi, cl_adj)
+        cl6, cd6 = viterna(alpha6 + np.pi, cl_adj)
 
         # -180 <-> -180 + alpha_high
         alpha7 = np.linspace(-np.pi, -np.pi + alpha_high, nalpha)
-        cl7, cd7 = self.__Viterna(alpha7 + np.pi, 1.0)
-        cl7 = (alpha7 + np.pi) / alpha_high * cl_high * cl_adj  # linear variation
+        cl7, cd7 = viterna(alpha7 + np.pi, 1.0)
+        cl7 = ((alpha7 + np.pi) / alpha_high)[:, np.newaxis] * cl_high * cl_adj  # linear variation
 
-        alpha = np.concatenate((alpha7, alpha6, alpha5, alpha4, np.radians(self.alpha), alpha1, alpha2, alpha3))
-        cl = np.concatenate((cl7, cl6, cl5, cl4, self.cl, cl1, cl2, cl3))
-        cd = np.concatenate((cd7, cd6, cd5, cd4, self.cd, cd1, cd2, cd3))
+        alpha_ext = np.degrees(
+            np.concatenate((alpha7, alpha6, alpha5, alpha4, np.radians(alpha), alpha1, alpha2, alpha3))
+        )
+        cl_ext = np.concatenate((cl7, cl6, cl5, cl4, cl, cl1, cl2, cl3))
+        cd_ext = np.concatenate((cd7, cd6, cd5, cd4, cd, cd1, cd2, cd3))
 
-        cd = np.maximum(cd, cdmin)  # don't allow negative drag coefficients
+        cd_ext = np.maximum(cd_ext, cdmin)  # don't allow negative drag coefficients
 
         # Setup alpha and cm to be used in extrapolation
-        cm1_alpha = np.floor(self.alpha[0] / 10.0) * 10.0
-        cm2_alpha = np.ceil(self.alpha[-1] / 10.0) * 10.0
+        cm1_alpha = np.floor(alpha[0] / 10.0) * 10.0
+        cm2_alpha = np.ceil(alpha[-1] / 10.0) * 10.0
         alpha_num = abs(int((-180.0 - cm1_alpha) / 10.0 - 1))
         alpha_cm1 = np.linspace(-180.0, cm1_alpha, alpha_num)
         alpha_cm2 = np.linspace(cm2_alpha, 180.0, int((180.0 - cm2_alpha) / 10.0 + 1))
         alpha_cm = np.concatenate(
-            (alpha_cm1, self.alpha, alpha_cm2)
+            (alpha_cm1, alpha, alpha_cm2)
         )  # Specific alpha values are needed for cm function to work
-        cm1 = np.zeros(len(alpha_cm1))
-        cm2 = np.zeros(len(alpha_cm2))
-        cm_ext = np.concatenate((cm1, self.cm, cm2))
-        if np.count_nonzero(self.cm) > 0:
-            cmCoef = self.__CMCoeff(cl_high, cd_high, cm_high)  # get cm coefficient
-            cl_cm = np.interp(alpha_cm, np.degrees(alpha), cl)  # get cl for applicable alphas
-            cd_cm = np.interp(alpha_cm, np.degrees(alpha), cd)  # get cd for applicable alphas
-            alpha_low_deg = self.alpha[0]
-            alpha_high_deg = self.alpha[-1]
-            for i in range(len(alpha_cm)):
-                cm_new = self.__getCM(i, cmCoef, alpha_cm, cl_cm, cd_cm, alpha_low_deg, alpha_high_deg)
-                if cm_new is None:
-                    pass  # For when it reaches the range of cm's that the user provides
-                else:
-                    cm_ext[i] = cm_new
-        cm = np.interp(np.degrees(alpha), alpha_cm, cm_ext)
-        return type(self)(self.Re, np.degrees(alpha), cl, cd, cm)
-
-    def __Viterna(self, alpha, cl_adj):
-        """private method to perform Viterna extrapolation"""
-
-        alpha = np.maximum(alpha, 0.0001)  # prevent divide by zero
-
-        cl = self.cdmax / 2 * np.sin(2 * alpha) + self.A * np.cos(alpha) ** 2 / np.sin(alpha)
+        cm1 = np.zeros((len(alpha_cm1), cm.shape[1]))
+        cm2 = np.zeros((len(alpha_cm2), cm.shape[1]))
+        cm_ext = np.concatenate((cm1, cm, cm2))
+        cm0 = None
+        j = np.flatnonzero(np.count_nonzero(cm, axis=0) > 0)  # polars with moment coefficients
+        if j.size > 0:
+            cm0, cmCoef = Polar.__CMCoeff(alpha, cl[:, j], cm[:, j], cl_high[j], cd_high[j], cm_high[j])
+            cl_cm = _interpColumns(alpha_cm, alpha_ext, cl_ext[:, j])  # get cl for applicable alphas
+            cd_cm = _interpColumns(alpha_cm, alpha_ext, cd_ext[:, j])  # get cd for applicable alphas
+            i = np.flatnonzero((alpha_cm < alpha[0]) | (alpha_cm > alpha[-1]))  # outside the provided cm's
+            cm_ext[np.ix_(i, j)] = Polar.__getCM(alpha_cm[i], cl_cm[i], cd_cm[i], cm0, cmCoef)
+        cm_ext = _interpColumns(alpha_ext, alpha_cm, cm_ext)
+
+        return alpha_ext, cl_ext, cd_ext, cm_ext, (cdmax, A, B, cm0)
+
+    @staticmethod
+    def __Viterna(alpha, cl_adj, cdmax, A, B):
+        """private method to perform Viterna extrapolation (rows: alpha, columns: polars)"""
+
+        alpha = np.maximum(alpha, 0.0001)[:, np.newaxis]  # prevent divide by zero
+
+        cl = cdmax / 2 * np.sin(2 * alpha) + A * np.cos(alpha) ** 2 / np.sin(alpha)
         cl = cl * cl_adj
 
-        cd = self.cdmax * np.sin(alpha) ** 2 + self.B * np.cos(alpha)
+        cd = cdmax * np.sin(alpha) ** 2 + B * np.cos(alpha)
 
         return cl, cd
 
-    def __CMCoeff(self, cl_high, cd_high, cm_high):
-        """private method to obtain CM0 and CMCoeff"""
-
-        found_zero_lift = False
+    @staticmethod
+    def __CMCoeff(alpha, cl, cm, cl_high, cd_high, cm_high):
+        """private method to obtain CM0 and CMCoeff of each polar (column)"""
 
-        for i in range(len(self.cm) - 1):
-            if abs(self.alpha[i]) < 20.0 and self.cl[i] <= 0 and self.cl[i + 1] >= 0:
-                p = -self.cl[i] / (self.cl[i + 1] - self.cl[i])
-                cm0 = self.cm[i] + p * (self.cm[i + 1] - self.cm[i])
-                found_zero_lift = True
-                break
+        # first zero lift crossing within +/-20 deg, else extrapolated from the first two points
+        i = np.arange(len(alpha) - 1)
+        crossing = (np.abs(alpha[i]) < 20.0)[:, np.newaxis] & (cl[i] <= 0) & (cl[i + 1] >= 0)
+        i = np.where(crossing.any(axis=0), np.argmax(crossing, axis=0), 0)
+        k = np.arange(cl.shape[1])
 
-        if not found_zero_lift:
-            p = -self.cl[0] / (self.cl[1] - self.cl[0])
-            cm0 = self.cm[0] + p * (self.cm[1] - self.cm[0])
-        self.cm0 = cm0
-        alpha_high = np.radians(self.alpha[-1])
+        p = -cl[i, k] / (cl[i + 1, k] - cl[i, k])
+        cm0 = cm[i, k] + p * (cm[i + 1, k] - cm[i, k])
+        alpha_high = np.radians(alpha[-1])
         XM = (-cm_high + cm0) / (cl_high * np.cos(alpha_high) + cd_high * np.sin(alpha_high))
         cmCoef = (XM - 0.25) / np.tan((alpha_high - np.pi / 2))
-        return cmCoef
-
-    def __getCM(self, i, cmCoef, alpha, cl_ext, cd_ext, alpha_low_deg, alpha_high_deg):
-        """private method to extrapolate Cm"""
-
-        cm_new = 0
-        if alpha[i] >= alpha_low_deg and alpha[i] <= alpha_high_deg:
-            return
-        if alpha[i] > -165 and alpha[i] < 165:
-            if abs(alpha[i]) < 0.01:
-                cm_new = self.cm0
-            else:
-                if alpha[i] > 0:
-                    x = cmCoef * np.tan(np.radians(alpha[i]) - np.pi / 2) + 0.25
-                    cm_new = self.cm0 - x * (cl_ext[i] * np.cos(np.radians(alpha[i])) + cd_ext[i] * np.sin(np.radians(alpha[i])))
-                else:
-                    x = cmCoef * np.tan(-np.radians(alpha[i]) - np.pi / 2) + 0.25
-                    cm_new = -(
-                        self.cm0 - x * (-cl_ext[i] * np.cos(-np.radians(alpha[i])) + cd_ext[i] * np.sin(-np.radians(alpha[i])))
-                    )
-        else:
-            if alpha[i] == 165:
-                cm_new = -0.4
-            elif alpha[i] == 170:
-                cm_new = -0.5
-            elif alpha[i] == 175:
-                cm_new = -0.25
-            elif alpha[i] == 180:
-                cm_new = 0
-            elif alpha[i] == -165:
-                cm_new = 0.35
-            elif alpha[i] == -170:
-                cm_new = 0.4
-            elif alpha[i] == -175:
-                cm_new = 0.2
-            elif alpha[i] == -180:
-                cm_new = 0
-            else:
-                print("Angle encountered for which there is no CM table value " "(near +/-180 deg). Program will stop.")
-        return cm_new
+        return cm0, cmCoef
+
+    @staticmethod
+    def __getCM(alpha, cl_ext, cd_ext, cm0, cmCoef):
+        """private method to extrapolate Cm (rows: alpha (deg), columns: polars)"""
+
+        # -165 < alpha < 165, mirrored for negative alpha
+        a = np.abs(np.radians(alpha))[:, np.newaxis]
+        sign = np.sign(alpha)[:, np.newaxis]
+        x = cmCoef * np.tan(a - np.pi / 2) + 0.25
+        cm_new = sign * (cm0 - x * (sign * cl_ext * np.cos(a) + cd_ext * np.sin(a)))
+        cm_new = np.where(np.abs(alpha)[:, np.newaxis] < 0.01, cm0, cm_new)
+
+        # table values near +/-180 deg
+        table_alpha = np.array([165.0, 170.0, 175.0, 180.0, -165.0, -170.0, -175.0, -180.0])
+        table_cm = np.array([-0.4, -0.5, -0.25, 0.0, 0.35, 0.4, 0.2, 0.0])
+        tail = (alpha <= -165) | (alpha >= 165)
+        match = alpha[:, np.newaxis] == table_alpha
+        if np.any(tail & ~match.any(axis=1)):
+            print("Angle encountered for which there is no CM table value " "(near +/-180 deg). Program will stop.")
+        cm_table = np.where(match.any(axis=1), table_cm[np.argmax(match, axis=1)], 0.0)
+
+        return np.where(tail[:, np.newaxis], cm_table[:, np.newaxis], cm_new)
 
     def unsteadyparam(self, alpha_linear_min=-5, alpha_linear_max=5):
         """compute unsteady aero parameters used in AeroDyn input file
@@ -466,7 +686,16 @@ class Polar(object):
 
         # return: control setting, stall angle, alpha for 0 cn, cn slope,
         #         cn at stall+, cn at stall-, alpha for min CD, min(CD)
-        return (0.0, np.degrees(alphaU), np.degrees(alpha0), m, cnStallUpper, cnStallLower, alpha[minIdx], cd[minIdx])
+        return (
+            0.0,
+            np.degrees(alphaU),
+            np.degrees(alpha0),
+            m,
+            cnStallUpper,
+            cnStallLower,
+            np.degrees(alpha[minIdx]),
+            cd[minIdx],
+        )
 
     def plot(self):
         """plot cl/cd/cm polar
@@ -527,71 +756,83 @@ class Airfoil(object):
 
         # sort by Reynolds number
         self.polars = sorted(polars, key=lambda p: p.Re)
+        self.Re = np.array([p.Re for p in self.polars])
 
         # save type of polar we are using
         self.polar_type = polars[0].__class__
 
     @classmethod
-    def initFromAerodynFile(cls, aerodynFile, polarType=Polar):
+    def initFromAerodynFile(cls, aerodynFile, polarType=Polar, cache=True):
         """Construct Airfoil object from AeroDyn file
 
         Parameters
         ----------
         aerodynFile : str
-            path/name of a properly formatted Aerodyn file
+            path/name of a properly formatted Aerodyn file (AeroDyn v13 or v15 format)
+        cache : bool, optional
+            use the parsed-polar cache in ``polar_cache_dir`` (if set), which is memory-mapped
+            on later calls until the file is modified
 
         Returns
         -------
         obj : Airfoil
 
         """
-        # initialize
-        polars = []
 
-        # open aerodyn file
-        f = open(aerodynFile, "r")
+        path = _polarCachePath(aerodynFile, ".polars.npy") if cache else None
+        if path is not None and os.path.exists(path):
+            # rows of (table, Re, alpha, cl, cd, cm)
+            try:
+                data = np.load(path, mmap_mode="r")
+            except (OSError, ValueError):
+                data = None
+            if data is not None:
+                start = np.r_[0, np.flatnonzero(np.diff(data[:, 0])) + 1, len(data)]
+                return cls(
+                    [
+                        polarType(float(t[0, 1]), t[:, 2], t[:, 3], t[:, 4], t[:, 5])
+                        for t in (data[i:j] for i, j in zip(start[:-1], start[1:]))
+                    ]
+                )
 
-        # skip through header
-        f.readline()
-        description = f.readline().rstrip()  # remove newline
-        f.readline()
-        numTables = int(f.readline().split()[0])
+        polars = [polarType(Re, *table.T) for Re, table in _readAerodynTables(aerodynFile)]
 
-        # loop through tables
-        for i in range(numTables):
+        if path is not None:
+            # rows of (table, Re, alpha, cl, cd, cm)
+            data = np.vstack(
+                [np.c_[np.full((len(p.alpha), 2), [i, p.Re]), p.alpha, p.cl, p.cd, p.cm] for i, p in enumerate(polars)]
+            )
+            _writePolarCache(path, ".polars.npy", np.save, data)
 
-            # read Reynolds number
-            Re = float(f.readline().split()[0]) * 1e6
+        return cls(polars)
 
-            # read Aerodyn parameters
-            param = [0] * 8
-            for j in range(8):
-                param[j] = float(f.readline().split()[0])
+    @classmethod
+    def dataGridFromAerodynFile(cls, aerodynFile, cache=True):
+        """``Airfoil.initFromAerodynFile(aerodynFile).createDataGrid()``, with the gridded
+        arrays kept in the parsed-polar cache (see initFromAerodynFile)
 
-            alpha = []
-            cl = []
-            cd = []
-            cm = []
-
-            # read polar information line by line
-            while True:
-                line = f.readline()
-                if "EOT" in line:
-                    break
-                data = [float(s) for s in line.split()]
-                if len(data) < 4:
-                    raise ValueError(f"Error: Expected 4 columns of data but found, {data}")
-                
-                alpha.append(data[0])
-                cl.append(data[1])
-                cd.append(data[2])
-                cm.append(data[3])
+        Returns
+        -------
+        alpha, Re, cl, cd, cm : ndarray
+            see createDataGrid
+        """
 
-            polars.append(polarType(Re, alpha, cl, cd, cm))
+        # the grid depends on the class (createDataGrid may be overridden)
+        path = _polarCachePath(aerodynFile, ".grid.npy", (cls.__module__, cls.__qualname__)) if cache else None
+        if path is not None and os.path.exists(path):
+            try:
+                grid = np.load(path, mmap_mode="r")
+            except (OSError, ValueError):
+                grid = None
+            if grid is not None:
+                return _unpackGrid(grid)
 
-        f.close()
+        alpha, Re, cl, cd, cm = cls.initFromAerodynFile(aerodynFile, cache=cache).createDataGrid()
 
-        return cls(polars)
+        if path is not None:
+            _writePolarCache(path, ".grid.npy", np.save, _packGrid(alpha, Re, cl, cd, cm))
+
+        return alpha, Re, cl, cd, cm
 
     def getPolar(self, Re):
         """Gets a Polar object for this airfoil at the specified Reynolds number.
@@ -609,24 +850,88 @@ class Airfoil(object):
         Notes
         -----
         Interpolates as necessary. If Reynolds number is larger than or smaller than
-        the stored Polars, it returns the Polar with the closest Reynolds number.
+        the stored Polars, it returns the Polar with the closest Reynolds number (the
+        stored object itself: polar arrays are read-only).
 
         """
 
         p = self.polars
 
         if Re <= p[0].Re:
-            return copy.deepcopy(p[0])
+            return p[0]
 
         elif Re >= p[-1].Re:
-            return copy.deepcopy(p[-1])
+            return p[-1]
 
         else:
-            Relist = [pp.Re for pp in p]
-            i = np.searchsorted(Relist, Re)
-            weight = (Re - Relist[i - 1]) / (Relist[i] - Relist[i - 1])
+            i = np.searchsorted(self.Re, Re)
+            weight = (Re - self.Re[i - 1]) / (self.Re[i] - self.Re[i - 1])
             return p[i - 1].blend(p[i], weight)
 
+    def getPolars(self, Re):
+        """Gets Polar objects for this airfoil at several Reynolds numbers (same as getPolar
+        for each of them).  If the polars share their angles of attack, all Reynolds numbers
+        are interpolated in one step and the returned polars are views into stacked arrays.
+
+        Parameters
+        ----------
+        Re : array_like
+            Reynolds numbers
+
+        Returns
+        -------
+        polars : list(Polar)
+            a Polar object at each Reynolds number
+        """
+
+        Re = np.atleast_1d(np.asarray(Re, dtype=float))
+        table = self.__polarTable(Re)
+        if table is None:
+            return [self.getPolar(Rei) for Rei in Re]
+
+        p = self.polars
+        Re_blend, i, coefs = table
+        out = []
+        for k, Rek in enumerate(Re):
+            if Rek <= p[0].Re:
+                out.append(p[0])
+            elif Rek >= p[-1].Re:
+                out.append(p[-1])
+            else:
+                out.append(type(p[i[k] - 1])(Re_blend[k], p[0].alpha, *(c[k] for c in coefs)))
+
+        return out
+
+    def __polarTable(self, Re):
+        """getPolar at each Reynolds number of the array Re as stacked read-only arrays:
+        Re, index of the upper polar and (cl, cd, cm) with one row per Reynolds number.
+        None if the polars do not share increasing angles of attack."""
+
+        p = self.polars
+        alpha = p[0].alpha
+        if len(p) == 1 or any(not np.array_equal(pp.alpha, alpha) for pp in p) or np.any(np.diff(alpha) <= 0):
+            return None
+
+        # Polar.blend of the neighbouring polars on their common grid, or the end polars
+        i = np.clip(np.searchsorted(self.Re, Re), 1, len(p) - 1)
+        weight = (Re - self.Re[i - 1]) / (self.Re[i] - self.Re[i - 1])
+        low = Re <= self.Re[0]
+        high = Re >= self.Re[-1]
+        Re_blend = self.Re[i - 1] + weight * (self.Re[i] - self.Re[i - 1])
+        Re_blend = np.where(low, self.Re[0], np.where(high, self.Re[-1], Re_blend))
+
+        coefs = []
+        for name in ("cl", "cd", "cm"):
+            table = np.array([getattr(pp, name) for pp in p])
+            c1 = table[i - 1]
+            c2 = table[i]
+            c = c1 + weight[:, np.newaxis] * (c2 - c1)
+            c[low] = table[0]
+            c[high] = table[-1]
+            coefs.append(_readOnly(c))
+
+        return Re_blend, i, coefs
+
     def blend(self, other, weight):
         """Blend this Airfoil with another one with the specified weighting.
 
@@ -655,13 +960,16 @@ class Airfoil(object):
         Relist2 = [p.Re for p in other.polars]
         Relist = np.union1d(Relist1, Relist2)
 
-        # blend polars
-        n = len(Relist)
-        polars = [0] * n
-        for i in range(n):
-            p1 = self.getPolar(Relist[i])
-            p2 = other.getPolar(Relist[i])
-            polars[i] = p1.blend(p2, weight)
+        # blend polars, all at once if the airfoils share their angles of attack
+        table1 = self.__polarTable(Relist)
+        table2 = other.__polarTable(Relist)
+        if table1 is None or table2 is None or not np.array_equal(self.polars[0].alpha, other.polars[0].alpha):
+            polars = [p1.blend(p2, weight) for p1, p2 in zip(self.getPolars(Relist), other.getPolars(Relist))]
+        else:
+            Re = table1[0] + weight * (table2[0] - table1[0])
+            cl, cd, cm = (_readOnly(c1 + weight * (c2 - c1)) for c1, c2 in zip(table1[2], table2[2]))
+            alpha = self.polars[0].alpha
+            polars = [self.polar_type(Re[k], alpha, cl[k], cd[k], cm[k]) for k in range(len(Relist))]
 
         return Airfoil(polars)
 
@@ -726,10 +1034,21 @@ class Airfoil(object):
 
         """
 
-        n = len(self.polars)
-        polars = [0] * n
-        for idx, p in enumerate(self.polars):
-            polars[idx] = p.extrapolate(cdmax, AR, cdmin)
+        alpha = self.polars[0].alpha
+        if any(not np.array_equal(p.alpha, alpha) for p in self.polars):
+            return Airfoil([p.extrapolate(cdmax, AR, cdmin) for p in self.polars])
+
+        # common angles of attack: all polars at once
+        alpha, cl, cd, cm = Polar.extrapolateArrays(
+            alpha,
+            np.column_stack([p.cl for p in self.polars]),
+            np.column_stack([p.cd for p in self.polars]),
+            np.column_stack([p.cm for p in self.polars]),
+            cdmax,
+            AR,
+            cdmin,
+        )
+        polars = [type(p)(p.Re, alpha, cl[:, k], cd[:, k], cm[:, k]) for k, p in enumerate(self.polars)]
 
         return Airfoil(polars)
 
@@ -761,48 +1080,105 @@ class Airfoil(object):
 
         return Airfoil(polars)
 
-    def writeToAerodynFile(self, filename):
+    def writeToAerodynFile(self, filename, version=13):
         """Write the airfoil section data to a file using AeroDyn input file style.
 
         Parameters
         ----------
         filename : str
             name (+ relative path) of where to write file
+        version : int, optional
+            13 (tables ended by EOT, with the unsteady aero parameters of Polar.unsteadyparam)
+            or 15 (AirfoilInfo file, without unsteady aerodynamics data)
+
+        """
+
+        Airfoil.writeAerodynFiles([self], [filename], version)
+
+    @staticmethod
+    def writeAerodynFiles(airfoils, filenames, version=13):
+        """Write several airfoils to AeroDyn files (see writeToAerodynFile).  Each file is
+        formatted in memory and written at once.
+
+        Parameters
+        ----------
+        airfoils : list(Airfoil)
+            airfoils to write
+        filenames : list(str)
+            file of each airfoil
+        version : int, optional
+            13 or 15, see writeToAerodynFile
 
         """
 
+        if version not in (13, 15):
+            raise ValueError(f"AeroDyn file version must be 13 or 15, but found {version}")
+        if len(airfoils) != len(filenames):
+            raise ValueError("airfoils and filenames must have the same length")
+
+        for af, filename in zip(airfoils, filenames):
+            text = af.__aerodynText(version)
+            with open(filename, "w") as f:
+                f.write(text)
+
+    def __aerodynText(self, version):
+        """contents of the AeroDyn file of the airfoil"""
+
         # aerodyn and wtperf require common set of angles of attack
-        af = self.interpToCommonAlpha()
+        af = self
+        alpha = self.polars[0].alpha
+        if any(not np.array_equal(p.alpha, alpha) for p in self.polars):
+            af = self.interpToCommonAlpha()
+
+        # table rows, formatted in one operation per table
+        row = "{:<10f}\t{:<10f}\t{:<10f}\t{:<10f}\n"
+
+        def table(p):
+            return (row * len(p.alpha)).format(*np.c_[p.alpha, p.cl, p.cd, p.cm].ravel().tolist())
+
+        out = []
+        if version == 13:
+            out.append("AeroDyn airfoil file.\nCompatible with AeroDyn v13.0.\nGenerated by airfoilprep.py\n")
+            out.append("{0:<10d}\t\t{1:40}\n".format(len(af.polars), "Number of airfoil tables in this file"))
+            names = [
+                "Reynolds number in millions.",
+                "Control setting",
+                "Stall angle (deg)",
+                "Angle of attack for zero Cn for linear Cn curve (deg)",
+                "Cn slope for zero lift for linear Cn curve (1/rad)",
+                "Cn at stall value for positive angle of attack for linear Cn curve",
+                "Cn at stall value for negative angle of attack for linear Cn curve",
+                "Angle of attack for minimum CD (deg)",
+                "Minimum CD value",
+            ]
+            for p in af.polars:
+                values = (p.Re / 1e6,) + tuple(p.unsteadyparam())
+                out.extend("{0:<10f}\t{1:40}\n".format(value, name) for value, name in zip(values, names))
+                out.append(table(p))
+                out.append("EOT\n")
 
-        f = open(filename, "w")
-
-        f.write("AeroDyn airfoil file.")
-        f.write("Compatible with AeroDyn v13.0.")
-        f.write("Generated by airfoilprep.py")
-        f.write("{0:<10d}\t\t{1:40}".format(len(af.polars), "Number of airfoil tables in this file"))
-        for p in af.polars:
-            f.write("{0:<10f}\t{1:40}".format(p.Re / 1e6, "Reynolds number in millions."))
-            param = p.unsteadyparam()
-            f.write("{0:<10f}\t{1:40}".format(param[0], "Control setting"))
-            f.write("{0:<10f}\t{1:40}".format(param[1], "Stall angle (deg)"))
-            f.write("{0:<10f}\t{1:40}".format(param[2], "Angle of attack for zero Cn for linear Cn curve (deg)"))
-            f.write("{0:<10f}\t{1:40}".format(param[3], "Cn slope for zero lift for linear Cn curve (1/rad)"))
-            f.write(
-                "{0:<10f}\t{1:40}".format(
-                    param[4], "Cn at stall value for positive angle of attack for linear Cn curve"
-                )
-            )
-            f.write(
-                "{0:<10f}\t{1:40}".format(
-                    param[5], "Cn at stall value for negative angle of attack for linear Cn curve"
+        else:
+            line = "! " + "-" * 78 + "\n"
+            out.append("! ------------ AirfoilInfo v1.01.x Input File " + "-" * 34 + "\n")
+            out.append("! AeroDyn airfoil file.  Generated by airfoilprep.py\n" + line)
+            out.append('"DEFAULT"     InterpOrd         ! Interpolation order to use for quasi-steady table lookup\n')
+            out.append("1             NonDimArea        ! The non-dimensional area of the airfoil (area/chord^2)\n")
+            out.append("0             NumCoords         ! The number of coordinates in the airfoil shape file\n")
+            out.append('"unused"      BL_file           ! The file name including the boundary layer characteristics\n')
+            out.append("{0:<10d}    NumTabs           ! Number of airfoil tables in this file\n".format(len(af.polars)))
+            for i, p in enumerate(af.polars):
+                out.append(line + f"! data for table {i + 1}\n" + line)
+                out.append("{0:<10f}    Re                ! Reynolds number in millions\n".format(p.Re / 1e6))
+                out.append("0             UserProp          ! User property (control) setting\n")
+                out.append("False         InclUAdata        ! Is unsteady aerodynamics data included in this table?\n")
+                out.append(line)
+                out.append(
+                    "{0:<10d}    NumAlf            ! Number of data lines in the following table\n".format(len(p.alpha))
                 )
-            )
-            f.write("{0:<10f}\t{1:40}".format(param[6], "Angle of attack for minimum CD (deg)"))
-            f.write("{0:<10f}\t{1:40}".format(param[7], "Minimum CD value"))
-            for a, cl, cd, cm in zip(p.alpha, p.cl, p.cd, p.cm):
-                f.write("{:<10f}\t{:<10f}\t{:<10f}\t{:<10f}".format(a, cl, cd, cm))
-            f.write("EOT")
-        f.close()
+                out.append("!    Alpha      Cl      Cd        Cm\n!    (deg)      (-)     (-)       (-)\n")
+                out.append(table(p))
+
+        return "".join(out)
 
     def createDataGrid(self):
         """interpolate airfoil data onto uniform alpha-Re grid.
@@ -980,6 +1356,223 @@ class Airfoil(object):
     #     return cl, cd
 
 
+class AirfoilFamily(object):
+    """Reference airfoils of a blade, ordered by relative thickness.  The airfoils are put on a
+    common alpha/Re grid once, and the cl, cd, cm tables at any array of thicknesses are then
+    interpolated in one array operation (what Airfoil.blend of the neighbouring reference
+    airfoils gives on that grid)."""
+
+    def __init__(self, airfoils, thickness, alpha=None, Re=None):
+        """Constructor
+
+        Parameters
+        ----------
+        airfoils : list(Airfoil)
+            reference airfoils
+        thickness : array_like
+            relative thickness of each reference airfoil (distinct values)
+        alpha : ndarray (deg), optional
+            common angles of attack.  If None the union of all angles of attack is used.
+        Re : ndarray, optional
+            common Reynolds numbers.  If None the union of all Reynolds numbers is used.
+        """
+
+        order = np.argsort(thickness)
+        self.thickness = np.asarray(thickness, dtype=float)[order]
+        if np.any(np.diff(self.thickness) <= 0):
+            raise ValueError(f"thickness must hold distinct values, but found {thickness}")
+        airfoils = [airfoils[k] for k in order]
+
+        if alpha is None:
+            alpha = np.unique(np.concatenate([p.alpha for af in airfoils for p in af.polars]))
+        if Re is None:
+            Re = np.unique(np.concatenate([af.Re for af in airfoils]))
+        self.alpha = _readOnly(np.array(alpha, dtype=float))
+        self.Re = _readOnly(np.array(Re, dtype=float))
+
+        # tables (n_af, n_alpha, n_Re), as Airfoil.createDataGrid on the common grid
+        shape = (len(airfoils), len(self.alpha), len(self.Re))
+        self.cl = np.zeros(shape)
+        self.cd = np.zeros(shape)
+        self.cm = np.zeros(shape)
+        for k, af in enumerate(airfoils):
+            for j, p in enumerate(af.interpToCommonAlpha(self.alpha).getPolars(self.Re)):
+                self.cl[k, :, j] = p.cl
+                self.cd[k, :, j] = p.cd
+                self.cm[k, :, j] = p.cm
+
+    def evaluate(self, thickness):
+        """cl, cd, cm tables at the given relative thicknesses, interpolated linearly between
+        the neighbouring reference airfoils (clipped to the thinnest and thickest ones)
+
+        Parameters
+        ----------
+        thickness : array_like
+            relative thickness of each station, shape (n_span,)
+
+        Returns
+        -------
+        cl, cd, cm : ndarray
+            shape (n_span, alpha.size, Re.size), as the airfoils_cl, airfoils_cd and
+            airfoils_cm inputs of the CCBlade components (for one tab)
+        """
+
+        thickness = np.atleast_1d(np.asarray(thickness, dtype=float))
+        t = self.thickness
+        if len(t) == 1:
+            return tuple(np.repeat(c, len(thickness), axis=0) for c in (self.cl, self.cd, self.cm))
+
+        i = np.clip(np.searchsorted(t, thickness, side="right"), 1, len(t) - 1)
+        weight = np.clip((thickness - t[i - 1]) / (t[i] - t[i - 1]), 0.0, 1.0)[:, np.newaxis, np.newaxis]
+        thickest = thickness >= t[-1]
+
+        out = []
+        for c in (self.cl, self.cd, self.cm):
+            c1 = c[i - 1]
+            c2 = c[i]
+            c = c1 + weight * (c2 - c1)
+            c[thickest] = c2[thickest]
+            out.append(c)
+
+        return tuple(out)
+
+
+def _libraryGrid(aerodynFile, correction3D, extrapolate):
+    """parse one file of an AirfoilLibrary, apply the optional corrections and return its packed grid"""
+
+    af = Airfoil.initFromAerodynFile(aerodynFile, cache=False)
+    if correction3D is not None:
+        af = af.correction3D(**correction3D)
+    if extrapolate is not None:
+        af = af.extrapolate(**extrapolate)
+    return _packGrid(*af.createDataGrid())
+
+
+class AirfoilLibrary(object):
+    """A set of airfoils stored in one archive file: a header line holding the names and
+    positions of the airfoils, followed by the data grids of all airfoils (see
+    Airfoil.createDataGrid) as one block of float64 values.  The block is memory-mapped, so
+    opening a library is cheap and the arrays of each airfoil are read-only views into it,
+    shared by all the processes that open the same file."""
+
+    # first line of an archive
+    magic = b"CCBlade airfoil library 1\n"
+
+    def __init__(self, archive):
+        """Constructor
+
+        Parameters
+        ----------
+        archive : str
+            archive file written by AirfoilLibrary.build
+        """
+
+        with open(archive, "rb") as f:
+            if f.readline() != self.magic:
+                raise ValueError(f"{archive} is not an airfoil library")
+            header = json.loads(f.readline())
+            offset = f.tell()
+
+        self.archive = archive
+        self.names = header["names"]
+        self.files = header["files"]
+        self.__index = {}
+        size = 0
+        for name, shape in zip(self.names, header["shapes"]):
+            self.__index[name] = (size, tuple(shape))
+            size += shape[0] * shape[1]
+        self.data = np.memmap(archive, dtype="<f8", mode="r", offset=offset, shape=(size,))
+
+    @classmethod
+    def build(cls, files, archive, nproc=None, correction3D=None, extrapolate=None):
+        """parse AeroDyn files in a process pool and write them into one archive
+
+        Parameters
+        ----------
+        files : str or list(str)
+            directory (all its .dat files are used) or list of AeroDyn airfoil files.  The
+            airfoils are named after the files, without directory and extension.
+        archive : str
+            output file
+        nproc : int, optional
+            number of worker processes.  If None the number of CPUs is used.
+        correction3D : dict, optional
+            keyword arguments of Airfoil.correction3D, to apply it to each airfoil
+        extrapolate : dict, optional
+            keyword arguments of Airfoil.extrapolate, to apply it to each airfoil (after correction3D)
+
+        Returns
+        -------
+        library : AirfoilLibrary
+            the opened archive
+        """
+
+        if isinstance(files, str):
+            files = sorted(glob.glob(os.path.join(files, "*.dat")))
+        files = list(files)
+        if len(files) == 0:
+            raise ValueError("no airfoil files to store")
+
+        names = [os.path.splitext(os.path.basename(f))[0] for f in files]
+        if len(set(names)) < len(names):
+            raise ValueError("airfoil files must have distinct names")
+
+        n = len(files)
+        nproc = min(os.cpu_count() if nproc is None else nproc, n)
+        args = (files, [correction3D] * n, [extrapolate] * n)
+        if nproc > 1:
+            with ProcessPoolExecutor(max_workers=nproc) as executor:
+                grids = list(executor.map(_libraryGrid, *args, chunksize=max(1, n // (4 * nproc))))
+        else:
+            grids = list(map(_libraryGrid, *args))
+
+        header = {
+            "names": names,
+            "files": [os.path.abspath(f) for f in files],
+            "shapes": [grid.shape for grid in grids],
+        }
+
+        directory = os.path.dirname(os.path.abspath(archive))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(cls.magic)
+                f.write(json.dumps(header).encode() + b"\n")
+                for grid in grids:
+                    f.write(grid.astype("<f8").tobytes())
+            os.replace(tmp, archive)
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+        return cls(archive)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.__index
+
+    def dataGrid(self, name):
+        """data grid of an airfoil
+
+        Returns
+        -------
+        alpha, Re, cl, cd, cm : ndarray
+            see Airfoil.createDataGrid (read-only views into the archive)
+        """
+
+        offset, shape = self.__index[name]
+        return _unpackGrid(self.data[offset : offset + shape[0] * shape[1]].reshape(shape))
+
+    def getAirfoil(self, name):
+        """Airfoil of the given name, with its polars defined on the common angles of attack of
+        the data grid (the polar arrays are views into the archive)"""
+
+        alpha, Re, cl, cd, cm = self.dataGrid(name)
+        return Airfoil([Polar(Re[j], alpha, cl[:, j], cd[:, j], cm[:, j]) for j in range(len(Re))])
+
+
 if __name__ == "__main__":
 
     import os
@@ -21,12 +21,18 @@ limitations under the License.
 """
 
 import os
+import copy
+import hashlib
 import warnings
+import threading
 import multiprocessing as mp
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 import numpy as np
+from scipy.sparse import diags
 from scipy.optimize import brentq
-from scipy.interpolate import RectBivariateSpline, bisplev
+from scipy.interpolate import RectBivariateSpline, splev, splrep
 
 import ccblade._bem as _bem
 from ccblade.airfoilprep import Airfoil
@@ -36,10 +42,61 @@ from ccblade.airfoilprep import Airfoil
 # ------------------
 
 
+class _AlphaSpline(object):
+    """spline in alpha only, for airfoils without Reynolds number dependence.  It has the
+    interface of the RectBivariateSpline used otherwise (tck, degrees, get_knots, get_coeffs,
+    __call__ and ev), as a spline of degree 0 with a single piece in Re."""
+
+    def __init__(self, tx, c, kx):
+        """from the (tx, c, kx) of splrep"""
+
+        self.tck = (tx, np.array([1e1, 1e15]), c[: len(tx) - kx - 1])
+        self.degrees = (kx, 0)
+
+    def get_knots(self):
+        return self.tck[:2]
+
+    def get_coeffs(self):
+        return self.tck[2]
+
+    def __call__(self, x, y, dx=0, dy=0, grid=True):
+        """spline (or its derivatives) at x, clipped to the knot range, on the grid x by y or at the
+        points (x, y), as RectBivariateSpline.__call__"""
+
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if grid:
+            x, y = np.broadcast_arrays(x.ravel()[:, np.newaxis], y.ravel())
+        else:
+            x, y = np.broadcast_arrays(x, y)
+
+        if dy > 0:
+            return np.zeros(x.shape)
+
+        tx, _, c = self.tck
+        return splev(np.clip(x, tx[0], tx[-1]), (tx, c, self.degrees[0]), der=dx)
+
+    def ev(self, xi, yi, dx=0, dy=0):
+        return self.__call__(xi, yi, dx=dx, dy=dy, grid=False)
+
+
+class _TensorSpline(RectBivariateSpline):
+    """RectBivariateSpline with given knots, coefficients and degrees (no fit)"""
+
+    def __init__(self, tx, ty, c, kx, ky):
+        self.tck = (tx, ty, c)
+        self.degrees = (kx, ky)
+
+
 class CCAirfoil(object):
     """A helper class to evaluate airfoil data using a continuously
     differentiable cubic spline"""
 
+    # maximum number of fitted airfoils kept by initCached (0 disables the cache)
+    cache_size = 512
+    _cache = OrderedDict()
+    _cache_lock = threading.Lock()
+
     def __init__(self, alpha, Re, cl, cd, cm=[], x=[], y=[], AFName="DEFAULTAF"):
         """Setup CCAirfoil from raw airfoil data on a grid.
         Parameters
@@ -69,29 +126,115 @@ class CCAirfoil(object):
         else:
             self.use_cm = False
 
-        # special case if zero or one Reynolds number (need at least two for bivariate spline)
+        if len(alpha) < 2:
+            raise ValueError(f"Need at least 2 angles of attack, but found {alpha}")
+
+        kx = min(len(alpha) - 1, 3)
+        self.alpha = alpha
+
+        # special case if zero or one Reynolds number: splines in alpha only.  The smoothing is half
+        # that of the bivariate fits, which would sum the residuals of two identical Re columns.
         if len(Re) < 2:
-            Re = [1e1, 1e15]
-            cl = np.c_[cl, cl]
-            cd = np.c_[cd, cd]
+            self.one_Re = True
+            self.cl_spline = _AlphaSpline(*splrep(alpha, np.ravel(cl), k=kx, s=0.05))
+            self.cd_spline = _AlphaSpline(*splrep(alpha, np.ravel(cd), k=kx, s=0.0005))
             if self.use_cm:
-                cm = np.c_[cm, cm]
+                self.cm_spline = _AlphaSpline(*splrep(alpha, np.ravel(cm), k=kx, s=0.00005))
 
-            self.one_Re = True
+        else:
+            ky = min(len(Re) - 1, 3)
 
-        if len(alpha) < 2:
-            raise ValueError(f"Need at least 2 angles of attack, but found {alpha}")
+            # a small amount of smoothing is used to prevent spurious multiple solutions
+            self.cl_spline = RectBivariateSpline(alpha, Re, cl, kx=kx, ky=ky, s=0.1)
+            self.cd_spline = RectBivariateSpline(alpha, Re, cd, kx=kx, ky=ky, s=0.001)
 
-        kx = min(len(alpha) - 1, 3)
-        ky = min(len(Re) - 1, 3)
+            if self.use_cm > 0:
+                self.cm_spline = RectBivariateSpline(alpha, Re, cm, kx=kx, ky=ky, s=0.0001)
 
-        # a small amount of smoothing is used to prevent spurious multiple solutions
-        self.cl_spline = RectBivariateSpline(alpha, Re, cl, kx=kx, ky=ky, s=0.1)
-        self.cd_spline = RectBivariateSpline(alpha, Re, cd, kx=kx, ky=ky, s=0.001)
-        self.alpha = alpha
+        self._setSplines()
+
+    def _setSplines(self, tck=None):
+        """pack the lift, drag (and moment) splines (or the given tck, see tabulate) for
+        _bem.splineevalarray, which evaluates them directly from their tck, with the last knot
+        intervals of the call as starting guess."""
+
+        if tck is None:
+            splines = [self.cl_spline, self.cd_spline] + ([self.cm_spline] if self.use_cm else [])
+            tck = [tuple(spline.tck[:3]) + tuple(spline.degrees) for spline in splines]
 
-        if self.use_cm > 0:
-            self.cm_spline = RectBivariateSpline(alpha, Re, cm, kx=kx, ky=ky, s=0.0001)
+        self._tck = tck
+        self._splint, self._knots, self._coefs = _packSplines(self._tck)
+        for packed in (self._splint, self._knots, self._coefs):
+            packed.flags.writeable = False
+
+        # lift and drag only (contiguous column view)
+        self._splint_clcd = self._splint[:, :2]
+
+    def tabulate(self, nalpha=721, nRe=17, order=1):
+        """Lookup-table version of the airfoil: the fitted splines are sampled on a uniform grid of
+        nalpha angles of attack over the data range and nRe Reynolds numbers uniform in log(Re).
+        evaluate, evaluate_derivatives and the CCBlade solvers of the returned airfoil interpolate
+        in that table, bilinearly (order=1) or with the interpolating bicubic spline (order=3), both
+        in (alpha, log(Re)).  The cell of a point follows from its position in the grid, without
+        knot search.  The bilinear table has piecewise constant derivatives.  This airfoil is not
+        modified.
+
+        Parameters
+        ----------
+        nalpha : int
+            number of angles of attack
+        nRe : int
+            number of Reynolds numbers (unused if there is a single Reynolds number)
+        order : int
+            1 (bilinear) or 3 (bicubic)
+
+        Returns
+        -------
+        af : CCAirfoil
+            tabulated airfoil.  Its table_error attribute holds the maximum absolute deviation of
+            'cl', 'cd' (and 'cm') from the fitted splines, checked at the cell centers.
+        """
+
+        if order not in (1, 3):
+            raise ValueError(f"order must be 1 or 3, but found {order}")
+
+        splines = [self.cl_spline, self.cd_spline] + ([self.cm_spline] if self.use_cm else [])
+
+        alpha = np.linspace(self.alpha[0], self.alpha[-1], nalpha)
+        if self.one_Re:
+            Re = np.array([1e6])  # the splines are constant in Re
+        else:
+            ty = self.cl_spline.get_knots()[1]
+            Re = np.geomspace(ty[0], ty[-1], nRe)
+
+        tck = []
+        for spline in splines:
+            values = spline(alpha, Re)
+            if order == 1 and self.one_Re:
+                tck.append((np.r_[alpha[0], alpha, alpha[-1]], np.array([1e1, 1e15]), values[:, 0], 1, 0))
+            elif order == 1:
+                logRe = np.log(Re)
+                tx, ty = np.r_[alpha[0], alpha, alpha[-1]], np.r_[logRe[0], logRe, logRe[-1]]
+                tck.append((tx, ty, values.ravel(), 1, 1, True))
+            elif self.one_Re:
+                tx, c, kx = splrep(alpha, values[:, 0], k=3, s=0)
+                tck.append((tx, np.array([1e1, 1e15]), c[: len(tx) - kx - 1], kx, 0))
+            else:
+                table = RectBivariateSpline(alpha, np.log(Re), values, kx=3, ky=min(3, nRe - 1), s=0)
+                tck.append(tuple(table.tck[:3]) + tuple(table.degrees) + (True,))
+
+        af = copy.copy(self)
+        af._setSplines(tck)
+
+        # deviation at the cell centers
+        alpha_c = 0.5 * (alpha[:-1] + alpha[1:])
+        Re_c = Re if self.one_Re else np.sqrt(Re[:-1] * Re[1:])
+        values = af.evaluate(alpha_c[:, np.newaxis], Re_c, return_cm=True)
+        af.table_error = {}
+        for name, spline, value in zip(("cl", "cd", "cm"), splines, values):
+            af.table_error[name] = np.max(np.abs(value - spline(alpha_c, Re_c)))
+
+        return af
 
     @classmethod
     def initFromAerodynFile(cls, aerodynFile):
@@ -106,74 +249,154 @@ class CCAirfoil(object):
             a constructed CCAirfoil object
         """
 
-        af = Airfoil.initFromAerodynFile(aerodynFile)
-        alpha, Re, cl, cd, cm = af.createDataGrid()
+        alpha, Re, cl, cd, cm = Airfoil.dataGridFromAerodynFile(aerodynFile)
         return cls(alpha, Re, cl, cd, cm=cm)
 
-    def max_eff(self, Re):
-        # Get the angle of attack, cl and cd at max airfoil efficiency. For a cylinder, set the angle of attack to 0
+    @classmethod
+    def initFromLibrary(cls, library, name):
+        """convenience method for initializing from an airfoil of an AirfoilLibrary
+        Parameters
+        ----------
+        library : AirfoilLibrary
+            opened airfoil library
+        name : str
+            name of the airfoil in the library
+        Returns
+        -------
+        af : CCAirfoil
+            a constructed CCAirfoil object
+        """
+
+        alpha, Re, cl, cd, cm = library.dataGrid(name)
+        return cls(alpha, Re, cl, cd, cm=cm, AFName=name)
+
+    @classmethod
+    def initCached(cls, alpha, Re, cl, cd, cm=[]):
+        """same as the constructor, but returns a previously fitted airfoil if one was built
+        from identical (alpha, Re, cl, cd, cm) data.  The cache is shared by the whole process,
+        keyed by a hash of the array contents, and keeps the ``CCAirfoil.cache_size`` most
+        recently used airfoils.  The returned objects may be shared.  Their evaluation cannot be
+        changed by a holder: the packed splines are read-only, evaluation keeps no state between
+        calls and tabulate returns a new airfoil.  Methods that store results on the airfoil
+        (eval_unsteady, af_flap_coords) should be used on airfoils from the constructor, or
+        replaced by unsteady_params, which returns its result.
+
+        Returns
+        -------
+        af : CCAirfoil
+            a constructed CCAirfoil object
+        """
+
+        h = hashlib.blake2b(digest_size=16)
+        for data in (alpha, Re, cl, cd, cm):
+            data = np.ascontiguousarray(data, dtype=float)
+            h.update(np.array(data.shape, dtype=np.int64).tobytes())
+            h.update(data.tobytes())
+        key = (cls, h.digest())
+
+        with cls._cache_lock:
+            af = cls._cache.get(key)
+            if af is not None:
+                cls._cache.move_to_end(key)
+                return af
+
+        af = cls(alpha, Re, cl, cd, cm=cm)
 
-        Eff = np.zeros_like(self.alpha)
+        with cls._cache_lock:
+            cls._cache[key] = af
+            while len(cls._cache) > cls.cache_size:
+                cls._cache.popitem(last=False)
+
+        return af
+
+    def _alphaSweep(self, Re):
+        """alpha (rad) and cl, cd with shape (201, len(Re)) on the sweep from -20 to +40 deg used by
+        max_eff and awayfromstall, or None for a cylinder (no data in that range)"""
 
-        # Check efficiency only between -20 and +40 deg
         aoa_start = -20.0
         aoa_end = 40
         i_start = np.argmin(abs(self.alpha - np.deg2rad(aoa_start)))
         i_end = np.argmin(abs(self.alpha - np.deg2rad(aoa_end)))
 
         if len(self.alpha[i_start:i_end]) == 0:  # Cylinder
-            alpha_Emax = 0.0
-            cl_Emax = self.cl_spline.ev(alpha_Emax, Re)
-            cd_Emax = self.cd_spline.ev(alpha_Emax, Re)
+            return None
+
+        alpha = np.deg2rad(np.linspace(aoa_start, aoa_end, num=201))
+        cl, cd = self.evaluate(alpha[:, np.newaxis], Re)
+        return alpha, cl, cd
+
+    def _maxEff(self, Re, sweep):
+        """max_eff for an array of Reynolds numbers and the sweep of _alphaSweep"""
+
+        if sweep is None:  # Cylinder
+            alpha_Emax = np.zeros(len(Re))
+            cl_Emax, cd_Emax = self.evaluate(alpha_Emax, Re)
             Emax = cl_Emax / cd_Emax
 
         else:
-            alpha = np.deg2rad(np.linspace(aoa_start, aoa_end, num=201))
-            cl = [self.cl_spline.ev(aoa, Re) for aoa in alpha]
-            cd = [self.cd_spline.ev(aoa, Re) for aoa in alpha]
-            Eff = [cli / cdi for cli, cdi, in zip(cl, cd)]
+            alpha, cl, cd = sweep
+            Eff = cl / cd
 
-            i_max = np.argmax(Eff)
+            i_max = np.argmax(Eff, axis=0)
+            j = np.arange(len(Re))
             alpha_Emax = alpha[i_max]
-            cl_Emax = cl[i_max]
-            cd_Emax = cd[i_max]
-            Emax = Eff[i_max]
-
-        # print Emax, np.deg2rad(alpha_Emax), cl_Emax, cd_Emax
+            cl_Emax = cl[i_max, j]
+            cd_Emax = cd[i_max, j]
+            Emax = Eff[i_max, j]
 
         return Emax, alpha_Emax, cl_Emax, cd_Emax
 
-    def awayfromstall(self, Re, margin):
-        # Get the angle of attack, cl and cd with a margin (in degrees) from the stall point. For a cylinder, set the angle of attack to 0 deg
-
-        # Eff         = np.zeros_like(self.alpha)
-
-        # Look for stall only between -20 and +40 deg
-        aoa_start = -20.0
-        aoa_end = 40
-        i_start = np.argmin(abs(self.alpha - np.deg2rad(aoa_start)))
-        i_end = np.argmin(abs(self.alpha - np.deg2rad(aoa_end)))
+    def _awayFromStall(self, Re, margin, sweep):
+        """awayfromstall for an array of Reynolds numbers (and margins) and the sweep of _alphaSweep"""
 
-        if len(self.alpha[i_start:i_end]) == 0:  # Cylinder
-            alpha_op = 0.0
+        if sweep is None:  # Cylinder
+            alpha_op = np.zeros(len(Re))
 
         else:
-            alpha = np.deg2rad(np.linspace(aoa_start, aoa_end, num=201))
-            cl = [self.cl_spline.ev(aoa, Re) for aoa in alpha]
-            cd = [self.cd_spline.ev(aoa, Re) for aoa in alpha]
+            alpha, cl, cd = sweep
 
-            i_stall = np.argmax(cl)
+            i_stall = np.argmax(cl, axis=0)
             alpha_stall = alpha[i_stall]
             alpha_op = alpha_stall - np.deg2rad(margin)
 
-        cl_op = self.cl_spline.ev(alpha_op, Re)
-        cd_op = self.cd_spline.ev(alpha_op, Re)
+        cl_op, cd_op = self.evaluate(alpha_op, Re)
         Eff_op = cl_op / cd_op
 
-        # print Emax, np.deg2rad(alpha_Emax), cl_Emax, cd_Emax
-
         return Eff_op, alpha_op, cl_op, cd_op
 
+    def max_eff(self, Re):
+        """Get the angle of attack, cl and cd at max airfoil efficiency, searched between -20 and
+        +40 deg.  For a cylinder, the angle of attack is set to 0.  Re may be an array, the
+        outputs then have the same shape.
+
+        Returns
+        -------
+        Emax, alpha_Emax (rad), cl_Emax, cd_Emax : float or ndarray
+        """
+
+        Re = np.asarray(Re, dtype=float)
+        Re_flat = Re.reshape(-1)
+        out = self._maxEff(Re_flat, self._alphaSweep(Re_flat))
+
+        return tuple(x.reshape(Re.shape)[()] for x in out)
+
+    def awayfromstall(self, Re, margin):
+        """Get the angle of attack, cl and cd with a margin (in degrees) from the stall point
+        (max cl between -20 and +40 deg).  For a cylinder, the angle of attack is set to 0.
+        Re may be an array, the outputs then have the same shape.
+
+        Returns
+        -------
+        Eff_op, alpha_op (rad), cl_op, cd_op : float or ndarray
+        """
+
+        Re = np.asarray(Re, dtype=float)
+        Re_flat = Re.reshape(-1)
+        margin = np.broadcast_to(margin, Re.shape).reshape(-1)
+        out = self._awayFromStall(Re_flat, margin, self._alphaSweep(Re_flat))
+
+        return tuple(x.reshape(Re.shape)[()] for x in out)
+
     def evaluate(self, alpha, Re, return_cm=False):
         """Get lift/drag coefficient at the specified angle of attack and Reynolds number.
         Parameters
@@ -194,41 +417,68 @@ class CCAirfoil(object):
         -----
         This method uses a spline so that the output is continuously differentiable, and
         also uses a small amount of smoothing to help remove spurious multiple solutions.
+        The splines are evaluated in _bem from their coefficients (same values as
+        RectBivariateSpline.ev), without scipy's argument checking.  alpha and Re may also
+        be arrays, which are broadcast against each other.
         """
 
-        cl = self.cl_spline.ev(alpha, Re)
-        cd = self.cd_spline.ev(alpha, Re)
+        splint = self._splint if self.use_cm and return_cm else self._splint_clcd
 
-        if self.use_cm and return_cm:
-            cm = self.cm_spline.ev(alpha, Re)
-            return cl, cd, cm
-        else:
-            return cl, cd
+        if isinstance(alpha, float) and isinstance(Re, float):
+            return tuple(_bem.splineevalarray(splint, self._knots, self._coefs, alpha, Re).ravel().tolist())
+
+        alpha, Re = np.broadcast_arrays(alpha, Re)
+        z = _bem.splineevalarray(splint, self._knots, self._coefs, alpha.ravel(), Re.ravel())
+        return tuple(zi.reshape(alpha.shape) for zi in z)
 
     def derivatives(self, alpha, Re):
+        """Partial derivatives of the lift/drag coefficients.  Like evaluate, alpha (rad)
+        and Re may be arrays of the same shape, evaluated pointwise.
+
+        Returns
+        -------
+        dcl_dalpha, dcl_dRe, dcd_dalpha, dcd_dRe : float or ndarray
+        """
 
-        # note: direct call to bisplev will be unnecessary with latest scipy update (add derivative method)
-        tck_cl = self.cl_spline.tck[:3] + self.cl_spline.degrees  # concatenate lists
-        tck_cd = self.cd_spline.tck[:3] + self.cd_spline.degrees
+        return self.evaluate_derivatives(alpha, Re)[2:]
 
-        dcl_dalpha = bisplev(alpha, Re, tck_cl, dx=1, dy=0)
-        dcd_dalpha = bisplev(alpha, Re, tck_cd, dx=1, dy=0)
+    def evaluate_derivatives(self, alpha, Re):
+        """Lift/drag coefficients and their partial derivatives from a single knot search and
+        basis evaluation.  alpha (rad) and Re may be arrays, broadcast against each other.
 
-        if self.one_Re:
-            dcl_dRe = 0.0
-            dcd_dRe = 0.0
-        else:
-            try:
-                dcl_dRe = bisplev(alpha, Re, tck_cl, dx=0, dy=1)
-                dcd_dRe = bisplev(alpha, Re, tck_cd, dx=0, dy=1)
-            except:
-                dcl_dRe = 0.0
-                dcd_dRe = 0.0
-        return dcl_dalpha, dcl_dRe, dcd_dalpha, dcd_dRe
+        Returns
+        -------
+        cl, cd, dcl_dalpha, dcl_dRe, dcd_dalpha, dcd_dRe : float or ndarray
+        """
+
+        if isinstance(alpha, float) and isinstance(Re, float):
+            z, z_alpha, z_Re = _bem.splineevalarrayderiv(self._splint_clcd, self._knots, self._coefs, alpha, Re)
+            (cl, cd), (dcl_dalpha, dcd_dalpha), (dcl_dRe, dcd_dRe) = (zi.ravel().tolist() for zi in (z, z_alpha, z_Re))
+            return cl, cd, dcl_dalpha, dcl_dRe, dcd_dalpha, dcd_dRe
+
+        alpha, Re = np.broadcast_arrays(alpha, Re)
+        z, z_alpha, z_Re = _bem.splineevalarrayderiv(
+            self._splint_clcd, self._knots, self._coefs, alpha.ravel(), Re.ravel()
+        )
+
+        cl, cd, dcl_dalpha, dcd_dalpha, dcl_dRe, dcd_dRe = (zi.reshape(alpha.shape) for zi in (*z, *z_alpha, *z_Re))
+        return cl, cd, dcl_dalpha, dcl_dRe, dcd_dalpha, dcd_dRe
 
     def eval_unsteady(self, alpha, cl, cd, cm):
         # calculate unsteady coefficients from polars for OpenFAST's Aerodyn
 
+        self.unsteady = self.unsteady_params(alpha, cl, cd, cm)
+
+    @staticmethod
+    def unsteady_params(alpha, cl, cd, cm):
+        """unsteady coefficients from polars for OpenFAST's Aerodyn, as set by eval_unsteady, but
+        returned instead of stored on the airfoil (usable with shared airfoils from initCached)
+
+        Returns
+        -------
+        unsteady : dict
+        """
+
         unsteady = {}
 
         alpha_rad = np.deg2rad(alpha)
@@ -360,7 +610,7 @@ class CCAirfoil(object):
         unsteady["Cd"] = cd
         unsteady["Cm"] = cm
 
-        self.unsteady = unsteady
+        return unsteady
 
     def af_flap_coords(
         self, xfoil_path, delta_flap=12.0, xc_hinge=0.8, yt_hinge=0.5, numNodes=250, multi_run=False, MPI_run=False
@@ -454,6 +704,575 @@ class CCAirfoil(object):
             os.remove(NUL_fname)
 
 
+class CCAirfoilFlap(CCAirfoil):
+    """CCAirfoil with polars at several flap deflections (tabs).  Each tab is fitted once, as a
+    CCAirfoil (shared through CCAirfoil.initCached), and the splines of all tabs are refined to
+    common knots.  The airfoil at a deflection between two tabs is then the spline whose
+    coefficients interpolate linearly between those of the two tabs, so set_flap only
+    combines coefficients and all CCAirfoil methods (and the CCBlade solvers) use the
+    current deflection.
+    """
+
+    def __init__(self, alpha, Re, cl, cd, cm=[], flap=None, delta=None, x=[], y=[], AFName="DEFAULTAF"):
+        """Setup CCAirfoilFlap from raw airfoil data on a grid.
+        Parameters
+        ----------
+        alpha : array_like (deg)
+            angles of attack where airfoil data are defined
+        Re : array_like
+            Reynolds numbers where airfoil data are defined
+        cl : array_like
+            lift coefficient 3-D array with shape (alpha.size, Re.size, n_tab)
+        cd : array_like
+            drag coefficient 3-D array with shape (alpha.size, Re.size, n_tab)
+        cm : array_like
+            moment coefficient 3-D array with shape (alpha.size, Re.size, n_tab) (optional)
+        flap : array_like (deg)
+            increasing flap deflection of each tab (defaults to the tab index)
+        delta : float (deg)
+            initial flap deflection (defaults to the middle tab)
+        """
+
+        cl = np.asarray(cl, dtype=float)
+        cd = np.asarray(cd, dtype=float)
+        cm = np.asarray(cm, dtype=float)
+        n_tab = cl.shape[-1]
+        self.flap = np.arange(n_tab, dtype=float) if flap is None else np.asarray(flap, dtype=float)
+        if len(self.flap) != n_tab or np.any(np.diff(self.flap) <= 0.0):
+            raise ValueError(f"flap must hold {n_tab} increasing deflections, but found {self.flap}")
+
+        Re = np.atleast_1d(Re)
+        self.tabs = [
+            CCAirfoil.initCached(alpha, Re, cl[..., k], cd[..., k], cm[..., k] if cm.size > 0 else [])
+            for k in range(n_tab)
+        ]
+        af = self.tabs[0]
+        self.x = x
+        self.y = y
+        self.AFName = AFName
+        self.one_Re = af.one_Re
+        self.use_cm = af.use_cm
+        self.alpha = af.alpha
+
+        # coefficients of the cl, cd (and cm) splines of all tabs on common knots
+        self._flap_tck = []
+        for name in ("cl_spline", "cd_spline") + (("cm_spline",) if self.use_cm else ()):
+            splines = [getattr(afk, name) for afk in self.tabs]
+            kx, ky = splines[0].degrees
+            tx = _knotUnion([spline.get_knots()[0] for spline in splines])
+            ty = _knotUnion([spline.get_knots()[1] for spline in splines])
+            coefs = []
+            for spline in splines:
+                txk, tyk = spline.get_knots()
+                c = spline.get_coeffs().reshape(len(txk) - kx - 1, len(tyk) - ky - 1)
+                c = _insertKnots(txk, c, kx, tx)
+                c = _insertKnots(tyk, c.T, ky, ty).T
+                coefs.append(c.ravel())
+            self._flap_tck.append((tx, ty, np.array(coefs), kx, ky))
+
+        self.set_flap(self.flap[n_tab // 2] if delta is None else delta)
+
+    def set_flap(self, delta):
+        """Set the flap deflection used by evaluate and the other CCAirfoil methods.  Deflections
+        outside the tabs are clipped to the first or last tab.  This also switches a tabulated
+        airfoil back to its splines.
+
+        Parameters
+        ----------
+        delta : float (deg)
+            flap deflection
+        """
+
+        self.delta = float(np.clip(delta, self.flap[0], self.flap[-1]))
+        j = min(np.searchsorted(self.flap, self.delta, side="right") - 1, len(self.flap) - 2)
+        w = (self.delta - self.flap[j]) / (self.flap[j + 1] - self.flap[j]) if len(self.flap) > 1 else 0.0
+
+        tck = []
+        splines = []
+        for tx, ty, coefs, kx, ky in self._flap_tck:
+            c = coefs[j] if w == 0.0 else (1.0 - w) * coefs[j] + w * coefs[j + 1]
+            tck.append((tx, ty, c, kx, ky))
+            splines.append(_AlphaSpline(tx, c, kx) if ky == 0 else _TensorSpline(tx, ty, c, kx, ky))
+
+        self.cl_spline, self.cd_spline = splines[:2]
+        if self.use_cm:
+            self.cm_spline = splines[2]
+
+        self._setSplines(tck)
+
+
+# ------------------
+#  Array BEM kernels
+# ------------------
+
+
+def airfoilOperatingPoints(af, Re, margin):
+    """max efficiency and stall margin operating points of all stations of a blade
+    (CCAirfoil.max_eff and CCAirfoil.awayfromstall in one call).  Stations sharing an
+    airfoil object are evaluated together on one alpha sweep.
+
+    Parameters
+    ----------
+    af : list(CCAirfoil)
+        airfoil at each station
+    Re : array_like
+        Reynolds number at each station
+    margin : float or array_like (deg)
+        stall margin (at each station)
+
+    Returns
+    -------
+    max_eff : tuple(ndarray)
+        (Emax, alpha_Emax, cl_Emax, cd_Emax) at each station, alpha in rad
+    stall : tuple(ndarray)
+        (Eff_op, alpha_op, cl_op, cd_op) at each station, alpha in rad
+    """
+
+    n = len(af)
+    Re = np.broadcast_to(np.asarray(Re, dtype=float), (n,))
+    margin = np.broadcast_to(np.asarray(margin, dtype=float), (n,))
+
+    groups = {}
+    for i, afi in enumerate(af):
+        groups.setdefault(id(afi), []).append(i)
+
+    max_eff = np.zeros((4, n))
+    stall = np.zeros((4, n))
+    for idx in groups.values():
+        afi = af[idx[0]]
+        sweep = afi._alphaSweep(Re[idx])
+        max_eff[:, idx] = afi._maxEff(Re[idx], sweep)
+        stall[:, idx] = afi._awayFromStall(Re[idx], margin[idx], sweep)
+
+    return tuple(max_eff), tuple(stall)
+
+
+class CCAirfoilSet:
+    """Lift and drag of the airfoils at all stations of a blade.  The splines of the distinct
+    airfoil objects are packed into contiguous arrays (spline 2k+1 is the lift and 2k+2 the
+    drag of airfoil k), and n points, each with its own station, alpha and Re, are evaluated
+    in one call to _bem.  Airfoils other than CCAirfoil are evaluated one airfoil at a time
+    with their evaluate method.
+    """
+
+    # serializes the repacking of the splines shared by the threads evaluating a set
+    _pack_lock = threading.Lock()
+
+    def __init__(self, af):
+        """Constructor
+
+        Parameters
+        ----------
+        af : list(CCAirfoil)
+            airfoil at each station (stations may share airfoil objects)
+        """
+
+        self.af = list(af)
+        self.airfoils = []
+        self.labels = np.zeros(len(af), dtype=np.int32)
+        seen = {}
+        for i, afi in enumerate(af):
+            if id(afi) not in seen:
+                seen[id(afi)] = len(self.airfoils)
+                self.airfoils.append(afi)
+            self.labels[i] = seen[id(afi)]
+
+        self.packed = all(isinstance(afi, CCAirfoil) for afi in self.airfoils)
+        self._state = (None, None)
+        if self.packed:
+            self.pack()
+
+    def pack(self):
+        """lift and drag splines of the distinct airfoils packed as in _packSplines (packed by
+        the constructor, and repacked when an airfoil changed its splines, e.g.
+        CCAirfoilFlap.set_flap)
+
+        Returns
+        -------
+        splint, knots, coefs : ndarray
+        """
+
+        def current(state):
+            key = state[0]
+            return key is not None and all(a._tck is b for a, b in zip(self.airfoils, key))
+
+        # the packed splines and their key are replaced together, so readers see either
+        # the old or the new pair
+        state = self._state
+        if current(state):
+            return state[1]
+
+        with self._pack_lock:
+            state = self._state
+            if not current(state):
+                key = [afi._tck for afi in self.airfoils]
+                splines = []
+                for tck in key:
+                    splines += tck[:2]
+                state = (key, _packSplines(splines))
+                self._state = state
+
+        return state[1]
+
+    def __points(self, alpha, Re, stations):
+        """broadcast alpha, Re (and the stations, by default the last axis) to flat arrays"""
+
+        if stations is None:
+            stations = np.arange(len(self.af))
+        alpha, Re, stations = np.broadcast_arrays(alpha, Re, stations)
+
+        return alpha.shape, alpha.ravel(), Re.ravel(), self.labels[stations.ravel()]
+
+    def evaluate(self, alpha, Re, stations=None):
+        """lift and drag coefficients at (alpha, Re) of the given stations
+
+        Parameters
+        ----------
+        alpha : array_like (rad)
+            angle of attack
+        Re : array_like
+            Reynolds number
+        stations : array_like(int), optional
+            station index of each point.  By default the last axis of the broadcast
+            alpha and Re runs over all stations.
+
+        Returns
+        -------
+        cl, cd : ndarray
+            lift and drag coefficients, with the broadcast shape of alpha, Re and stations
+        """
+
+        shape, alpha, Re, labels = self.__points(alpha, Re, stations)
+
+        if self.packed and len(labels) > 0:
+            splint, knots, coefs = self.pack()
+            z = _bem.splineevalindexed(2, 2 * labels + 1, splint, knots, coefs, alpha, Re)
+        else:
+            z = np.zeros((2, len(labels)))
+            for k in np.unique(labels):
+                idx = labels == k
+                z[:, idx] = self.airfoils[k].evaluate(alpha[idx], Re[idx])
+
+        return tuple(zi.reshape(shape) for zi in z)
+
+    def evaluate_derivatives(self, alpha, Re, stations=None):
+        """lift and drag coefficients and their partial derivatives at (alpha, Re) of the
+        given stations (see evaluate and CCAirfoil.evaluate_derivatives)
+
+        Returns
+        -------
+        cl, cd, dcl_dalpha, dcl_dRe, dcd_dalpha, dcd_dRe : ndarray
+        """
+
+        shape, alpha, Re, labels = self.__points(alpha, Re, stations)
+
+        if self.packed and len(labels) > 0:
+            splint, knots, coefs = self.pack()
+            z, z_alpha, z_Re = _bem.splineevalindexedderiv(2, 2 * labels + 1, splint, knots, coefs, alpha, Re)
+            out = (z[0], z[1], z_alpha[0], z_Re[0], z_alpha[1], z_Re[1])
+        else:
+            out = np.zeros((6, len(labels)))
+            for k in np.unique(labels):
+                idx = labels == k
+                out[:, idx] = self.airfoils[k].evaluate_derivatives(alpha[idx], Re[idx])
+
+        return tuple(zi.reshape(shape) for zi in out)
+
+
+def _inductionFactors(
+    r, chord, Rhub, Rtip, phi, cl, cd, B, Vx, Vy, usecd=True, hubloss=True, tiploss=True, wakerotation=True
+):
+    """elementwise array version of _bem.inductionfactors (same operations, same order).
+    Floating point warnings are left to the caller."""
+
+    sigma_p = B / 2.0 / np.pi * chord / r
+    sphi = np.sin(phi)
+    cphi = np.cos(phi)
+
+    # resolve into normal and tangential forces
+    if not usecd:
+        cn = cl * cphi
+        ct = cl * sphi
+    else:
+        cn = cl * cphi + cd * sphi
+        ct = cl * sphi - cd * cphi
+
+    # Prandtl's tip and hub loss factor
+    Ftip = 1.0
+    if tiploss:
+        factortip = B / 2.0 * (Rtip - r) / (r * sphi)
+        Ftip = 2.0 / np.pi * np.arccos(np.exp(-factortip))
+
+    Fhub = 1.0
+    if hubloss:
+        factorhub = B / 2.0 * (r - Rhub) / (Rhub * sphi)
+        Fhub = 2.0 / np.pi * np.arccos(np.exp(-factorhub))
+
+    F = Ftip * Fhub
+    if np.ndim(F) == 0:
+        F = np.full_like(phi, F)
+
+    # bem parameters
+    k = sigma_p * cn / 4.0 / F / sphi / sphi
+    kp = sigma_p * ct / 4.0 / F / sphi / cphi
+
+    # axial induction factor: momentum state
+    a = k / (1 + k)
+    fzero = sphi / (1 - a)
+
+    # Glauert(Buhl) correction
+    i = np.flatnonzero(k > 2.0 / 3.0)
+    if i.size > 0:
+        Fi = F[i]
+        ki = k[i]
+        g1 = 2.0 * Fi * ki - (10.0 / 9 - Fi)
+        g2 = 2.0 * Fi * ki - (4.0 / 3 - Fi) * Fi
+        g3 = 2.0 * Fi * ki - (25.0 / 9 - 2 * Fi)
+        a[i] = np.where(np.abs(g3) < 1e-6, 1.0 - 1.0 / 2.0 / np.sqrt(g2), (g1 - np.sqrt(g2)) / g3)
+        fzero[i] = sphi[i] / (1 - a[i])
+
+    # propeller brake region (phi <= 0)
+    i = np.flatnonzero(~(phi > 0))
+    if i.size > 0:
+        ki = k[i]
+        a[i] = np.where(ki > 1, ki / (ki - 1), 0.0)
+        fzero[i] = sphi[i] * (1 - ki)
+
+    # tangential induction factor
+    ap = kp / (1 - kp)
+
+    if not wakerotation:
+        ap = np.zeros_like(ap)
+        kp = np.zeros_like(kp)
+
+    # error function
+    lambda_r = Vy / Vx
+    fzero = fzero - cphi / lambda_r * (1 - kp)
+
+    return fzero, a, ap
+
+
+def _relativeWind(phi, a, ap, Vx, Vy, pitch, chord, theta, rho, mu):
+    """elementwise array version of _bem.relativewind.
+    Floating point warnings are left to the caller."""
+
+    # angle of attack
+    alpha = phi - (theta + pitch)
+
+    # avoid numerical errors when angle is close to 0 or 90 deg (see _bem.relativewind)
+    W = np.sqrt((Vx * (1 - a)) ** 2 + (Vy * (1 + ap)) ** 2)
+    i = np.flatnonzero(np.abs(ap) > 10)
+    if i.size > 0:
+        W[i] = (Vx * (1 - a) / np.sin(phi))[i]
+    i = np.flatnonzero(np.abs(a) > 10)
+    if i.size > 0:
+        W[i] = (Vy * (1 + ap) / np.cos(phi))[i]
+
+    Re = rho * W * chord / mu
+
+    return alpha, W, Re
+
+
+def _brentq(f, xa, xb, fa, fb, xtol=2e-12, rtol=4 * np.finfo(float).eps, maxiter=100):
+    """Brent's method run independently on an array of brackets.
+
+    This is a line-by-line translation of the algorithm behind scipy.optimize.brentq,
+    except that all brackets are advanced together so the residual is evaluated once per
+    iteration for every unconverged element.  Each element follows exactly the same
+    sequence of iterates that brentq would.
+
+    Parameters
+    ----------
+    f : callable
+        ``f(x, idx)`` returns the residuals at x for the elements idx
+    xa, xb : array_like
+        bracket ends
+    fa, fb : array_like
+        residuals at xa and xb
+
+    Returns
+    -------
+    x : ndarray
+        roots
+    failed : ndarray(bool)
+        True where brentq would raise a ValueError (no sign change across the bracket,
+        or a NaN residual)
+    """
+
+    xpre = np.array(xa, dtype=float)
+    xcur = np.array(xb, dtype=float)
+    fpre = np.array(fa, dtype=float)
+    fcur = np.array(fb, dtype=float)
+
+    x = np.where(fpre == 0, xpre, xcur)
+    zero = (fpre == 0) | (fcur == 0)
+    failed = np.isnan(fpre) | np.isnan(fcur) | (~zero & (np.signbit(fpre) == np.signbit(fcur)))
+
+    # working set (compressed as elements converge)
+    idx = np.flatnonzero(~zero & ~failed)
+    xpre, xcur, fpre, fcur = xpre[idx], xcur[idx], fpre[idx], fcur[idx]
+    xblk = np.zeros_like(xcur)
+    fblk = np.zeros_like(xcur)
+    spre = np.zeros_like(xcur)
+    scur = np.zeros_like(xcur)
+
+    with np.errstate(all="ignore"):
+        for _ in range(maxiter):
+
+            if idx.size == 0:
+                break
+
+            # keep the root bracketed between xcur and xblk
+            # (fpre and fcur are never zero here: zeros converge immediately)
+            flip = np.signbit(fpre) != np.signbit(fcur)
+            np.copyto(xblk, xpre, where=flip)
+            np.copyto(fblk, fpre, where=flip)
+            np.copyto(spre, xcur - xpre, where=flip)
+            np.copyto(scur, spre, where=flip)
+
+            swap = np.abs(fblk) < np.abs(fcur)
+            if swap.any():
+                xpre, xcur, xblk = np.where(swap, xcur, xpre), np.where(swap, xblk, xcur), np.where(swap, xcur, xblk)
+                fpre, fcur, fblk = np.where(swap, fcur, fpre), np.where(swap, fblk, fcur), np.where(swap, fcur, fblk)
+
+            delta = (xtol + rtol * np.abs(xcur)) / 2
+            sbis = (xblk - xcur) / 2
+
+            # converged elements leave the working set
+            done = (fcur == 0) | (np.abs(sbis) < delta)
+            if done.any():
+                x[idx[done]] = xcur[done]
+                keep = ~done
+                idx = idx[keep]
+                xcur = xcur[keep]
+                if idx.size == 0:
+                    break
+                xpre, xblk = xpre[keep], xblk[keep]
+                fpre, fcur, fblk = fpre[keep], fcur[keep], fblk[keep]
+                spre, scur = spre[keep], scur[keep]
+                delta, sbis = delta[keep], sbis[keep]
+
+            # interpolate (secant) or extrapolate (inverse quadratic), otherwise bisect
+            secant = xpre == xblk
+            if secant.all():
+                stry = -fcur * (xcur - xpre) / (fcur - fpre)
+            else:
+                dpre = (fpre - fcur) / (xpre - xcur)
+                dblk = (fblk - fcur) / (xblk - xcur)
+                stry = np.where(
+                    secant,
+                    -fcur * (xcur - xpre) / (fcur - fpre),
+                    -fcur * (fblk * dblk - fpre * dpre) / (dblk * dpre * (fblk - fpre)),
+                )
+            abs_spre = np.abs(spre)
+            good = (
+                (abs_spre > delta)
+                & (np.abs(fcur) < np.abs(fpre))
+                & (2 * np.abs(stry) < np.minimum(abs_spre, 3 * np.abs(sbis) - delta))
+            )
+            spre = np.where(good, scur, sbis)
+            scur = np.where(good, stry, sbis)
+
+            xpre = xcur
+            fpre = fcur
+            step = np.where(np.abs(scur) > delta, scur, np.copysign(delta, sbis))
+            xcur = xcur + step
+            fcur = f(xcur, idx)
+
+            # a NaN residual stops the solve for that element (as brentq does)
+            nan = np.isnan(fcur)
+            if nan.any():
+                failed[idx[nan]] = True
+                keep = ~nan
+                idx = idx[keep]
+                xpre, xcur, xblk = xpre[keep], xcur[keep], xblk[keep]
+                fpre, fcur, fblk = fpre[keep], fcur[keep], fblk[keep]
+                spre, scur = spre[keep], scur[keep]
+
+    # iteration limit reached
+    x[idx] = xcur
+
+    return x, failed
+
+
+def _warmBracket(phi0, dphi, epsilon=1e-6):
+    """bracket of half-width dphi around a previous solution phi0, clipped to the standard
+    bracket ([epsilon, pi/2], [-pi/4, -epsilon] or [pi/2, pi - epsilon]) that contains it.
+    NaN where phi0 is in none of them."""
+
+    phi0 = np.asarray(phi0, dtype=float)
+    branch = [
+        (phi0 >= epsilon) & (phi0 <= np.pi / 2),
+        (phi0 >= -np.pi / 4) & (phi0 <= -epsilon),
+        (phi0 > np.pi / 2) & (phi0 <= np.pi - epsilon),
+    ]
+    lower = np.select(branch, [epsilon, -np.pi / 4, np.pi / 2], np.nan)
+    upper = np.select(branch, [np.pi / 2, -epsilon, np.pi - epsilon], np.nan)
+
+    return np.maximum(lower, phi0 - dphi), np.minimum(upper, phi0 + dphi)
+
+
+def _knotUnion(knots):
+    """smallest knot vector containing each of the given knot vectors (with multiplicities)"""
+
+    values = np.unique(np.concatenate(knots))
+    counts = [np.searchsorted(t, values, side="right") - np.searchsorted(t, values, side="left") for t in knots]
+    return np.repeat(values, np.max(counts, axis=0))
+
+
+def _insertKnots(t, c, k, t_new):
+    """coefficients, along the first axis of c, of the spline with knots t and degree k on the
+    refined knots t_new (a superset of t).  Boehm's knot insertion, one knot at a time."""
+
+    values, counts = np.unique(t_new, return_counts=True)
+    extra = counts - (np.searchsorted(t, values, side="right") - np.searchsorted(t, values, side="left"))
+    for x in np.repeat(values, extra):
+        l = np.searchsorted(t, x, side="right") - 1  # t[l] <= x < t[l + 1]
+        i = np.arange(l - k + 1, l + 1)
+        a = ((x - t[i]) / (t[i + k] - t[i]))[:, np.newaxis]
+        c = np.concatenate([c[: l - k + 1], (1.0 - a) * c[i - 1] + a * c[i], c[l:]])
+        t = np.insert(t, l + 1, x)
+
+    return c
+
+
+def _packSplines(splines):
+    """pack bivariate splines into the flat arrays used by _bem.solvephi.
+
+    Parameters
+    ----------
+    splines : list
+        (tx, ty, c, kx, ky) of each spline, as in RectBivariateSpline.tck + degrees.
+        A table on an (x, y) grid with bilinear interpolation is the degree-1 spline
+        with knots x, y (end points repeated) and the table values as coefficients.
+        An optional sixth entry, if true, marks ty as knots in log(y).
+
+    Returns
+    -------
+    splint : ndarray(int)
+        8 x nspl Fortran-ordered array of (first x knot, nx, first y knot, ny,
+        first coefficient, kx, ky, logy), 1-based
+    knots : ndarray
+        all knots
+    coefs : ndarray
+        all coefficients
+    """
+
+    splint = np.zeros((8, len(splines)), dtype=np.int32, order="F")
+    knots = []
+    coefs = []
+    nknot = 0
+    ncoef = 0
+    for k, (tx, ty, c, kx, ky, *logy) in enumerate(splines):
+        splint[:, k] = (nknot + 1, len(tx), nknot + len(tx) + 1, len(ty), ncoef + 1, kx, ky, any(logy))
+        knots += [tx, ty]
+        coefs.append(c)
+        nknot += len(tx) + len(ty)
+        ncoef += len(c)
+
+    return splint, np.concatenate(knots).astype(float), np.concatenate(coefs).astype(float)
+
+
 # ------------------
 #  Main Class: CCBlade
 # ------------------
@@ -487,6 +1306,11 @@ class CCBlade(object):
         usecd=True,
         iterRe=1,
         derivatives=False,
+        solver="brentq",
+        warmstart=False,
+        nthreads=1,
+        sparse=False,
+        adjoint=False,
     ):
         """Constructor for aerodynamic rotor analysis
 
@@ -550,6 +1374,41 @@ class CCBlade(object):
             should not be necessary.  Gradients have only been implemented for the case iterRe=1.
         derivatives : boolean, optional
             if True, derivatives along with function values will be returned for the various methods
+        solver : str, optional
+            method used to converge the inflow angle at the blade stations.
+            ``'brentq'`` solves one station at a time with scipy's Brent method.
+            ``'vectorized'`` runs the same Brent iteration on all stations at once with array
+            operations, which removes most of the Python overhead and converges to the same
+            phi.  It requires airfoil objects whose evaluate method accepts arrays
+            (CCAirfoil does).  Without derivatives, evaluate then stacks every
+            (condition, azimuth sector, station) element into a single array solve.  With
+            derivatives, the load derivatives of all stations are computed in one batched pass.
+            ``'fortran'`` does the same but converges all elements inside the compiled
+            _bem.solvephi routine, with the airfoil splines evaluated in Fortran.  It requires
+            CCAirfoil airfoils and falls back to
+            ``'vectorized'`` for inverse analysis.
+        warmstart : boolean, optional
+            if True, distributedAeroLoads first tries a narrow bracket around the phi that was
+            converged at each station in the previous call (same solution branch), and only falls
+            back to the standard bracket search if the residual does not change sign across it.
+            This saves residual evaluations when sweeping azimuth or operating conditions.
+            The batched evaluate engine of the array solvers solves all conditions at once and
+            does not use it.
+        nthreads : int, optional
+            number of threads.  If larger than 1, distributedAeroLoads solves blocks of stations
+            and evaluate blocks of conditions in a ThreadPoolExecutor.  The _bem routines release
+            the GIL, so this mostly pays off with ``solver='fortran'``.
+        sparse : boolean, optional
+            if True, the n x n Jacobians returned by distributedAeroLoads (diagonal 'dr', 'dchord',
+            'dtheta', 'dpresweep' and tridiagonal 'dprecurve') are scipy.sparse ``dia_matrix``
+            objects that only store their bands, instead of dense arrays.  The keys are unchanged,
+            ``.diagonal()`` gives the vector of a diagonal Jacobian and ``.toarray()`` the dense matrix.
+        adjoint : boolean, optional
+            if True, evaluate computes its derivatives in reverse (adjoint) mode: the adjoints of the
+            integrated loads are propagated back through the station loads and the inflow, instead of
+            forming the Jacobians of the distributed loads at every azimuth sector.  Same outputs, but
+            the cost grows linearly rather than quadratically with the number of stations.
+            distributedAeroLoads is not affected.
         """
         r = np.array(r)
         self.r = r.copy()
@@ -570,6 +1429,15 @@ class CCBlade(object):
         self.iterRe = iterRe
         self.derivatives = derivatives
 
+        if solver not in ("brentq", "vectorized", "fortran"):
+            raise ValueError(f"Unknown solver {solver}.  Options are 'brentq', 'vectorized' and 'fortran'")
+        self.solver = solver
+        self.warmstart = warmstart
+        self.nthreads = nthreads
+        self.sparse = sparse
+        self.adjoint = adjoint
+        self._phi_warm = np.full(len(r), np.nan)
+
         # check if no precurve / presweep
         if precurve is None:
             precurve = np.zeros(len(r))
@@ -679,8 +1547,7 @@ class CCBlade(object):
         dRe_dx = np.array([0.0, Re / chord, 0.0, Re * Vx / W ** 2, Re * Vy / W ** 2, 0.0, 0.0, 0.0, 0.0])
 
         # cl, cd (spline derivatives)
-        cl, cd = af.evaluate(alpha, Re)
-        dcl_dalpha, dcl_dRe, dcd_dalpha, dcd_dRe = af.derivatives(alpha, Re)
+        cl, cd, dcl_dalpha, dcl_dRe, dcd_dalpha, dcd_dRe = af.evaluate_derivatives(alpha, Re)
 
         # chain rule
         dcl_dx = dcl_dalpha * dalpha_dx + dcl_dRe * dRe_dx
@@ -780,38 +1647,536 @@ class CCBlade(object):
                     self.mu,
                 )
 
-                # cl, cd (spline derivatives)
-                dcl_dalpha, dcl_dRe, dcd_dalpha, dcd_dRe = af.derivatives(alpha_rad, Re)
+                # cl, cd (spline derivatives)
+                dcl_dalpha, dcl_dRe, dcd_dalpha, dcd_dRe = af.derivatives(alpha_rad, Re)
+
+                # chain rule
+                dcl_dx = dcl_dalpha * dalpha_dx + dcl_dRe * dRe_dx
+                dcd_dx = dcd_dalpha * dalpha_dx + dcd_dRe * dRe_dx
+
+                # cn, cd
+                dcn_dx = dcl_dx * cphi - cl * sphi * dphi_dx + dcd_dx * sphi + cd * cphi * dphi_dx
+                dct_dx = dcl_dx * sphi + cl * cphi * dphi_dx - dcd_dx * cphi + cd * sphi * dphi_dx
+
+                # Np, Tp
+                if cn == 0.0 or W == 0.0 or chord == 0.0:
+                    print(phi, rotating, r, chord, theta, af, Vx, Vy)
+                    raise ValueError()
+                dNp_dx = Np * (1.0 / cn * dcn_dx + 2.0 / W * dW_dx + 1.0 / chord * dchord_dx)
+                dTp_dx = Tp * (1.0 / ct * dct_dx + 2.0 / W * dW_dx + 1.0 / chord * dchord_dx)
+
+                alpha_deg = np.rad2deg(alpha_rad)
+
+            else:
+                dNp_dx = np.zeros(9)
+                dTp_dx = np.zeros(9)
+                dR_dx = np.zeros(9)
+
+            return a, ap, Np, Tp, alpha_deg, cl, cd, cn, ct, q, W, Re, dNp_dx, dTp_dx, dR_dx
+
+        else:
+            # print('Warning: CCBlade.__loads: Wind Velocities, Vx=0, Vy=0. If unexpected, check assigned load cases, connections, and/or workflow order.')
+            return 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, np.zeros(9), np.zeros(9), np.zeros(9)
+
+    def __solvePhiBrentq(self, errf, args, warm_bracket=None):
+        """converge phi at one station with brentq.
+        warm_bracket optionally holds a narrow bracket around the previous solution (NaN for none)."""
+
+        # ------ BEM solution method see (Ning, doi:10.1002/we.1636) ------
+
+        # warm start: narrow bracket around the previous solution at this station
+        warm = False
+        if warm_bracket is not None and np.isfinite(warm_bracket[0]):
+            phi_lower, phi_upper = warm_bracket
+            warm = errf(phi_lower, *args) * errf(phi_upper, *args) <= 0
+
+        if not warm:
+
+            # set standard limits
+            epsilon = 1e-6
+            phi_lower = epsilon
+            phi_upper = np.pi / 2
+
+            if errf(phi_lower, *args) * errf(phi_upper, *args) > 0:  # an uncommon but possible case
+
+                if errf(-np.pi / 4, *args) < 0 and errf(-epsilon, *args) > 0:
+                    phi_lower = -np.pi / 4
+                    phi_upper = -epsilon
+                else:
+                    phi_lower = np.pi / 2
+                    phi_upper = np.pi - epsilon
+
+        try:
+            phi_star = brentq(errf, phi_lower, phi_upper, args=args)
+
+        except ValueError:
+
+            warnings.warn("error.  check input values.")
+            phi_star = 0.0
+
+        # ----------------------------------------------------------------
+
+        return phi_star
+
+    # ------ array solver (solver='vectorized') ------
+    # Elements are (station, inflow) pairs: s holds the station index of each element
+    # and Vx, Vy, pitch the inflow seen by that element.
+
+    def __groupAirfoils(self):
+        """pack the station airfoils so that all elements are evaluated in one call"""
+
+        af_set = getattr(self, "_af_set", None)
+        if af_set is None or len(af_set.af) != len(self.af) or any(a is not b for a, b in zip(af_set.af, self.af)):
+            self._af_set = CCAirfoilSet(self.af)
+
+    def __evaluateAirfoils(self, alpha, Re, s):
+        """lift and drag coefficients for an array of elements"""
+
+        return self._af_set.evaluate(alpha, Re, s)
+
+    def __evaluateAirfoilDerivatives(self, alpha, Re, s):
+        """lift and drag coefficients and their partial derivatives for an array of elements
+        (cl, cd, dcl_dalpha, dcl_dRe, dcd_dalpha, dcd_dRe)"""
+
+        return self._af_set.evaluate_derivatives(alpha, Re, s)
+
+    def __runBEMVectorized(self, phi, s, Vx, Vy, pitch, inverse=False):
+        """residual of BEM method and other corresponding variables for an array of elements"""
+
+        r = self.r[s]
+        chord = self.chord[s]
+
+        if inverse:
+            cl = np.asarray(self.cl)[s]
+            cd = np.asarray(self.cd)[s]
+            fzero, a, ap = _inductionFactors(
+                r, chord, self.Rhub, self.Rtip, phi, cl, cd, self.B, Vx, Vy, **self.bemoptions
+            )
+            return fzero, a, ap, cl, cd
+
+        theta = self.theta[s]
+        a = 0.0
+        ap = 0.0
+        for i in range(self.iterRe):
+
+            alpha, W, Re = _relativeWind(phi, a, ap, Vx, Vy, pitch, chord, theta, self.rho, self.mu)
+            cl, cd = self.__evaluateAirfoils(alpha, Re, s)
+
+            fzero, a, ap = _inductionFactors(
+                r, chord, self.Rhub, self.Rtip, phi, cl, cd, self.B, Vx, Vy, **self.bemoptions
+            )
+
+        return fzero, a, ap, cl, cd
+
+    def __solvePhiVectorized(self, s, Vx, Vy, pitch, phi0=None):
+        """converge phi for an array of rotating elements at once.
+        Same bracketing as the scalar loop in distributedAeroLoads, see (Ning, doi:10.1002/we.1636).
+        phi0 optionally holds previous solutions to warm start from (NaN for none).
+        """
+
+        def errf(phi, idx):
+            with np.errstate(all="ignore"):
+                return self.__runBEMVectorized(phi, s[idx], Vx[idx], Vy[idx], pitch[idx], self.inverse_analysis)[0]
+
+        # elements without inflow carry no load and are not solved
+        phi_star = np.zeros(len(s))
+        moving = np.flatnonzero((Vx != 0.0) & (Vy != 0.0))
+        m = len(moving)
+
+        # set standard limits
+        epsilon = 1e-6
+        phi_lower = np.full(m, epsilon)
+        phi_upper = np.full(m, np.pi / 2)
+        f_lower = np.zeros(m)
+        f_upper = np.zeros(m)
+        cold = np.ones(m, dtype=bool)
+
+        # warm start: narrow bracket around the previous solution (kept if the residual changes sign)
+        if phi0 is not None:
+            w = np.flatnonzero(np.isfinite(phi0[moving]))
+            lower, upper = _warmBracket(phi0[moving[w]], np.deg2rad(5.0), epsilon)
+            valid = np.isfinite(lower)
+            w, lower, upper = w[valid], lower[valid], upper[valid]
+            if w.size > 0:
+                fl = errf(lower, moving[w])
+                fu = errf(upper, moving[w])
+                valid = fl * fu <= 0
+                w = w[valid]
+                phi_lower[w], phi_upper[w] = lower[valid], upper[valid]
+                f_lower[w], f_upper[w] = fl[valid], fu[valid]
+                cold[w] = False
+
+        c = np.flatnonzero(cold)
+        f_lower[c] = errf(phi_lower[c], moving[c])
+        f_upper[c] = errf(phi_upper[c], moving[c])
+
+        i = c[f_lower[c] * f_upper[c] > 0]  # an uncommon but possible case
+        if i.size > 0:
+            f_neg_lower = errf(np.full(i.size, -np.pi / 4), moving[i])
+            f_neg_upper = errf(np.full(i.size, -epsilon), moving[i])
+            neg = (f_neg_lower < 0) & (f_neg_upper > 0)
+
+            phi_lower[i[neg]] = -np.pi / 4
+            phi_upper[i[neg]] = -epsilon
+            f_lower[i[neg]] = f_neg_lower[neg]
+            f_upper[i[neg]] = f_neg_upper[neg]
+
+            j = i[~neg]
+            phi_lower[j] = np.pi / 2
+            phi_upper[j] = np.pi - epsilon
+            f_lower[j] = f_upper[j]
+            f_upper[j] = errf(phi_upper[j], moving[j])
+
+        phi, failed = _brentq(lambda x, idx: errf(x, moving[idx]), phi_lower, phi_upper, f_lower, f_upper)
+
+        if failed.any():
+            warnings.warn("error.  check input values.")
+            phi[failed] = 0.0
+
+        phi_star[moving] = phi
+
+        return phi_star
+
+    def __solvePhiArray(self, s, Vx, Vy, pitch, phi0=None):
+        """converge phi for an array of rotating elements with the selected array solver.
+        Returns phi and, from the compiled solver, the induction at the solution (otherwise None).
+        With nthreads > 1 the elements are split into blocks solved in a thread pool."""
+
+        def solve(i):
+            p0 = None if phi0 is None else phi0[i]
+            if self.solver == "fortran" and not self.inverse_analysis:
+                return self.__solvePhiCompiled(s[i], Vx[i], Vy[i], pitch[i], p0)
+            return self.__solvePhiVectorized(s[i], Vx[i], Vy[i], pitch[i], p0), None
+
+        nblocks = min(self.nthreads, len(s))
+        if nblocks <= 1:
+            return solve(slice(None))
+
+        with ThreadPoolExecutor(max_workers=nblocks) as executor:
+            results = list(executor.map(solve, np.array_split(np.arange(len(s)), nblocks)))
+
+        phi = np.concatenate([phi for phi, _ in results])
+        induction = None if results[0][1] is None else np.concatenate([ind for _, ind in results], axis=1)
+
+        return phi, induction
+
+    def __solvePhiCompiled(self, s, Vx, Vy, pitch, phi0=None):
+        """converge phi for an array of rotating elements in one call to _bem.solvephi.
+        Also returns the induction factors and airfoil coefficients at the solution."""
+
+        splint, knots, coefs = self._af_set.pack()
+        labels = self._af_set.labels[s]
+        if phi0 is None:
+            phi0 = np.full(len(s), np.nan)
+
+        phi, a, ap, cl, cd, _, _, _, _, _, info = _bem.solvephi(
+            self.r[s],
+            self.chord[s],
+            self.theta[s],
+            Vx,
+            Vy,
+            pitch,
+            2 * labels + 1,
+            2 * labels + 2,
+            self.Rhub,
+            self.Rtip,
+            self.B,
+            self.rho,
+            self.mu,
+            self.iterRe,
+            splint,
+            knots,
+            coefs,
+            phi0,
+            np.deg2rad(5.0),
+            **self.bemoptions,
+        )
+
+        if info.any():
+            warnings.warn("error.  check input values.")
+
+        return phi, np.array([a, ap, cl, cd])
+
+    def __loadsVectorized(self, phi, rotating, s, Vx, Vy, pitch, induction=None):
+        """normal and tangential loads for an array of elements (no derivatives).
+        induction optionally holds (a, ap, cl, cd) of the rotating elements at phi,
+        as returned by the compiled solver."""
+
+        n = len(s)
+        loads = {key: np.zeros(n) for key in ("Np", "Tp", "a", "ap", "alpha", "Cl", "Cd", "Cn", "Ct", "W", "Re")}
+
+        # sections without inflow carry no load
+        i = np.flatnonzero((Vx != 0.0) & (Vy != 0.0))
+        phi, rotating, s, Vx, Vy, pitch = phi[i], rotating[i], s[i], Vx[i], Vy[i], pitch[i]
+        chord = self.chord[s]
+
+        m = len(i)
+        a = np.zeros(m)
+        ap = np.zeros(m)
+        cl = np.zeros(m)
+        cd = np.zeros(m)
+
+        with np.errstate(all="ignore"):
+            j = np.flatnonzero(rotating)
+            if j.size > 0 and induction is not None:
+                a[j], ap[j], cl[j], cd[j] = induction[:, i[j]]
+            elif j.size > 0:
+                _, a[j], ap[j], cl[j], cd[j] = self.__runBEMVectorized(phi[j], s[j], Vx[j], Vy[j], pitch[j])
+
+            alpha_rad, W, Re = _relativeWind(phi, a, ap, Vx, Vy, pitch, chord, self.theta[s], self.rho, self.mu)
+
+            j = np.flatnonzero(~rotating)
+            if j.size > 0:
+                cl[j], cd[j] = self.__evaluateAirfoils(alpha_rad[j], Re[j], s[j])
+
+            cphi = np.cos(phi)
+            sphi = np.sin(phi)
+            cn = cl * cphi + cd * sphi  # these expressions should always contain drag
+            ct = cl * sphi - cd * cphi
+
+            q = 0.5 * self.rho * W**2
+            Np = cn * q * chord
+            Tp = ct * q * chord
+
+        # BEM convergence errors
+        bad = np.isnan(Np)
+        for k in np.flatnonzero(bad):
+            print(f"NaNs at {i[k]}/{n}: {phi[k]}")
+        a[bad] = ap[bad] = Np[bad] = Tp[bad] = alpha_rad[bad] = 0.0
+
+        loads["Np"][i] = Np
+        loads["Tp"][i] = Tp
+        loads["a"][i] = a
+        loads["ap"][i] = ap
+        loads["alpha"][i] = np.rad2deg(alpha_rad)
+        loads["Cl"][i] = cl
+        loads["Cd"][i] = cd
+        loads["Cn"][i] = cn
+        loads["Ct"][i] = ct
+        loads["W"][i] = W
+        loads["Re"][i] = Re
+
+        return loads
+
+    def __loadsDerivativesVectorized(self, phi, rotating, Vx, Vy):
+        """partial derivatives dNp_dx, dTp_dx and dR_dx of the normal and tangential loads and of
+        the residual at all stations of the blade (n x 9, one row per station).  Same equations as
+        __loads and __residualDerivatives, with the Tapenade routines seeded for all stations at once."""
+
+        n = len(self.r)
+        dNp_dx = np.zeros((n, 9))
+        dTp_dx = np.zeros((n, 9))
+        dR_dx = np.zeros((n, 9))
+
+        # sections without inflow carry no load
+        i = np.flatnonzero((Vx != 0.0) & (Vy != 0.0))
+        phi, Vx, Vy = phi[i], Vx[i], Vy[i]
+        r, chord, theta = self.r[i], self.chord[i], self.theta[i]
+        pitch = np.full(len(i), self.pitch)
+
+        # x = [phi, chord, theta, Vx, Vy, r, Rhub, Rtip, pitch]  (derivative order)
+        # derivatives are stored as 9 x m arrays (one column per section), seed[k] is dx_k/dx
+        m = len(i)
+        seed = np.zeros((9, 9, m))
+        seed[np.arange(9), np.arange(9)] = 1.0
+
+        with np.errstate(all="ignore"):
+
+            if rotating:
+
+                # derivative of residual function (a = ap = 0 with iterRe = 1)
+                zero = np.zeros(m)
+                alpha_rad, W, Re = _relativeWind(phi, zero, zero, Vx, Vy, pitch, chord, theta, self.rho, self.mu)
+
+                dalpha_dx = seed[0] - seed[2] - seed[8]
+                dRe_dx = Re / chord * seed[1] + Re * Vx / W**2 * seed[3] + Re * Vy / W**2 * seed[4]
+
+                cl, cd, dcl_dalpha, dcl_dRe, dcd_dalpha, dcd_dRe = self.__evaluateAirfoilDerivatives(alpha_rad, Re, i)
+                dcl_dx = dcl_dalpha * dalpha_dx + dcl_dRe * dRe_dx
+                dcd_dx = dcd_dalpha * dalpha_dx + dcd_dRe * dRe_dx
+
+                _, dR, a, da_dx, ap, dap_dx = _bem.inductionfactorsarray_dv(
+                    r,
+                    seed[5],
+                    chord,
+                    seed[1],
+                    self.Rhub,
+                    seed[6],
+                    self.Rtip,
+                    seed[7],
+                    phi,
+                    seed[0],
+                    cl,
+                    dcl_dx,
+                    cd,
+                    dcd_dx,
+                    self.B,
+                    Vx,
+                    seed[3],
+                    Vy,
+                    seed[4],
+                    **self.bemoptions,
+                )
+                dR_dx[i] = dR.T
+                dphi_dx = seed[0]
+
+            else:
+                a = np.zeros(m)
+                ap = np.zeros(m)
+                da_dx = np.zeros((9, m))
+                dap_dx = np.zeros((9, m))
+                dR_dx[i, 0] = 1.0  # just to prevent divide by zero
+                dphi_dx = np.zeros((9, m))
+
+            # alpha, W, Re (Tapenade)
+            alpha_rad, dalpha_dx, W, dW_dx, Re, dRe_dx = _bem.relativewindarray_dv(
+                phi,
+                seed[0],
+                a,
+                da_dx,
+                ap,
+                dap_dx,
+                Vx,
+                seed[3],
+                Vy,
+                seed[4],
+                pitch,
+                seed[8],
+                chord,
+                seed[1],
+                theta,
+                seed[2],
+                self.rho,
+                self.mu,
+            )
+
+            # cl, cd (spline derivatives)
+            coefficients = self.__evaluateAirfoilDerivatives(alpha_rad, Re, i)
+            if not rotating:
+                cl, cd = coefficients[:2]
+            dcl_dalpha, dcl_dRe, dcd_dalpha, dcd_dRe = coefficients[2:]
+
+            # chain rule
+            dcl_dx = dcl_dalpha * dalpha_dx + dcl_dRe * dRe_dx
+            dcd_dx = dcd_dalpha * dalpha_dx + dcd_dRe * dRe_dx
+
+            cphi = np.cos(phi)
+            sphi = np.sin(phi)
+            cn = cl * cphi + cd * sphi  # these expressions should always contain drag
+            ct = cl * sphi - cd * cphi
+
+            q = 0.5 * self.rho * W**2
+            Np = cn * q * chord
+            Tp = ct * q * chord
+
+            # cn, ct
+            dcn_dx = dcl_dx * cphi - cl * sphi * dphi_dx + dcd_dx * sphi + cd * cphi * dphi_dx
+            dct_dx = dcl_dx * sphi + cl * cphi * dphi_dx - dcd_dx * cphi + cd * sphi * dphi_dx
+
+            # Np, Tp
+            if np.any((cn == 0.0) | (W == 0.0) | (chord == 0.0)):
+                raise ValueError("zero normal force coefficient, relative velocity or chord in load derivatives")
+            dchord_dx = seed[1]
+            dNp_dx[i] = (Np * (1.0 / cn * dcn_dx + 2.0 / W * dW_dx + 1.0 / chord * dchord_dx)).T
+            dTp_dx[i] = (Tp * (1.0 / ct * dct_dx + 2.0 / W * dW_dx + 1.0 / chord * dchord_dx)).T
+
+        return dNp_dx, dTp_dx, dR_dx
+
+    def __azimuthSectors(self):
+        """azimuth angles to solve in evaluate, with their weight in the azimuthal average and
+        the cosine/sine factors used to rotate the blade loads into the hub frame.
 
-                # chain rule
-                dcl_dx = dcl_dalpha * dalpha_dx + dcl_dRe * dRe_dx
-                dcd_dx = dcd_dalpha * dalpha_dx + dcd_dRe * dRe_dx
+        Without yaw, tilt or presweep the inflow (shear included) only depends on cos(azimuth),
+        so the sectors at azimuth and -azimuth carry identical blade loads.  Only one of each
+        mirrored pair is solved and counted twice, and its sine terms (Y, Z and Mz contributions)
+        cancel exactly, so they are set to zero.
+        """
 
-                # cn, cd
-                dcn_dx = dcl_dx * cphi - cl * sphi * dphi_dx + dcd_dx * sphi + cd * cphi * dphi_dx
-                dct_dx = dcl_dx * sphi + cl * cphi * dphi_dx - dcd_dx * cphi + cd * sphi * dphi_dx
+        nsec = self.nSector
+        azimuth_angles = np.linspace(0.0, 2 * np.pi, nsec + 1)[:-1]
+        weight = np.ones(nsec)
 
-                # Np, Tp
-                if cn == 0.0 or W == 0.0 or chord == 0.0:
-                    print(phi, rotating, r, chord, theta, af, Vx, Vy)
-                    raise ValueError()
-                dNp_dx = Np * (1.0 / cn * dcn_dx + 2.0 / W * dW_dx + 1.0 / chord * dchord_dx)
-                dTp_dx = Tp * (1.0 / ct * dct_dx + 2.0 / W * dW_dx + 1.0 / chord * dchord_dx)
+        if self.derivatives or self.yaw != 0.0 or self.tilt != 0.0 or np.any(self.presweep != 0.0):
+            return azimuth_angles, weight, np.cos(azimuth_angles), np.sin(azimuth_angles)
 
-                alpha_deg = np.rad2deg(alpha_rad)
+        # sector 0, then the second half (mirrors of the first), so the last sector is still solved last
+        k = np.r_[0, np.arange((nsec + 1) // 2, nsec)]
+        weight = np.where((k == 0) | (2 * k == nsec), 1.0, 2.0)
 
-            else:
-                dNp_dx = None
-                dTp_dx = None
-                dR_dx = None
+        return azimuth_angles[k], weight, np.cos(azimuth_angles[k]), np.zeros(len(k))
 
-            return a, ap, Np, Tp, alpha_deg, cl, cd, cn, ct, q, W, Re, dNp_dx, dTp_dx, dR_dx
+    def __evaluateVectorized(self, Uinf, Omega, pitch, sectors, args):
+        """rotor loads for all conditions and azimuth sectors in one array solve (no derivatives)"""
 
-        else:
-            # print('Warning: CCBlade.__loads: Wind Velocities, Vx=0, Vy=0. If unexpected, check assigned load cases, connections, and/or workflow order.')
-            return 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, np.zeros(9), np.zeros(9), np.zeros(9)
+        azimuth_angles, weight, ca, sa = sectors
+        n = len(self.r)
+        npts = len(Uinf)
+        nsec = len(azimuth_angles)
+
+        # elements ordered (condition, sector, station)
+        Vx = np.zeros((npts, nsec, n))
+        Vy = np.zeros((npts, nsec, n))
+        for i in range(npts):
+            for j, azimuth in enumerate(azimuth_angles):
+                Vx[i, j], Vy[i, j] = _bem.windcomponents(
+                    self.r,
+                    self.precurve,
+                    self.presweep,
+                    self.precone,
+                    self.yaw,
+                    self.tilt,
+                    azimuth,
+                    Uinf[i],
+                    Omega[i],
+                    self.hubHt,
+                    self.shearExp,
+                )
+
+        shape = (npts, nsec, n)
+        s = np.broadcast_to(np.arange(n), shape).ravel()
+        pitch_s = np.broadcast_to(np.deg2rad(pitch)[:, None, None], shape).ravel()
+        rotating = np.broadcast_to((Omega != 0.0)[:, None, None], shape).ravel()
+        Vx = Vx.ravel()
+        Vy = Vy.ravel()
+
+        self.__groupAirfoils()
+        phi = np.full(s.size, np.pi / 2.0)
+        induction = None
+        i = np.flatnonzero(rotating)
+        if i.size > 0:
+            phi[i], induction_i = self.__solvePhiArray(s[i], Vx[i], Vy[i], pitch_s[i])
+            if induction_i is not None:
+                induction = np.zeros((4, s.size))
+                induction[:, i] = induction_i
+
+        loads = self.__loadsVectorized(phi, rotating, s, Vx, Vy, pitch_s, induction)
+        Np = loads["Np"].reshape(shape)
+        Tp = loads["Tp"].reshape(shape)
+
+        # integrate along the blade (each condition and sector), then average across azimuth
+        Tsub, Ysub, Zsub, Qsub, Msub = np.zeros((5, npts, nsec))
+        for i in range(npts):
+            for j in range(nsec):
+                Tsub[i, j], Ysub[i, j], Zsub[i, j], Qsub[i, j], Msub[i, j] = _bem.thrusttorque(
+                    Np[i, j], Tp[i, j], *args
+                )
+
+        nsec = self.nSector
+        T = self.B * (Tsub * weight).sum(axis=1) / nsec
+        Y = self.B * ((Ysub * ca - Zsub * sa) * weight).sum(axis=1) / nsec
+        Z = self.B * ((Zsub * ca + Ysub * sa) * weight).sum(axis=1) / nsec
+        Q = self.B * (Qsub * weight).sum(axis=1) / nsec
+        My = self.B * (Msub * ca * weight).sum(axis=1) / nsec
+        Mz = self.B * (Msub * sa * weight).sum(axis=1) / nsec
+        Mb = (Msub * weight).sum(axis=1) / nsec
+
+        # same state as after the sequential loop (last condition, last sector)
+        self.pitch = np.deg2rad(pitch[-1])
+        W = loads["W"].reshape(shape)[-1, -1]
+
+        return T, Y, Z, Q, My, Mz, Mb, W
 
-    def __windComponents(self, Uinf, Omega, azimuth):
+    def __windComponents(self, Uinf, Omega, azimuth, jacobian=True):
         """x, y components of wind in blade-aligned coordinate system"""
 
         Vx, Vy = _bem.windcomponents(
@@ -828,7 +2193,7 @@ class CCBlade(object):
             self.shearExp,
         )
 
-        if not self.derivatives:
+        if not self.derivatives or not jacobian:
             return Vx, Vy, 0.0, 0.0, 0.0, 0.0
 
         # y = [r, precurve, presweep, precone, tilt, hubHt, yaw, shear, azimuth, Uinf, Omega]  (derivative order)
@@ -875,60 +2240,10 @@ class CCBlade(object):
 
         return Vx, Vy, dVx_dw, dVy_dw, dVx_dcurve, dVy_dcurve
 
-    def distributedAeroLoads(self, Uinf, Omega, pitch, azimuth):
-        """Compute distributed aerodynamic loads along blade.
-
-        Parameters
-        ----------
-        Uinf : float or array_like (m/s)
-            hub height wind speed (float).  If desired, an array can be input which specifies
-            the velocity at each radial location along the blade (useful for analyzing loads
-            behind tower shadow for example).  In either case shear corrections will be applied.
-        Omega : float (RPM)
-            rotor rotation speed
-        pitch : float (deg)
-            blade pitch in same direction as :ref:`twist <blade_airfoil_coord>`
-            (positive decreases angle of attack)
-        azimuth : float (deg)
-            the :ref:`azimuth angle <hub_azimuth_coord>` where aerodynamic loads should be computed at
-
-        Returns
-        -------
-        loads : dict
-            Dictionary of distributed aerodynamic loads (and other useful quantities). Keys include:
-
-            - 'Np' : force per unit length normal to the section on downwind side (N/m)
-            - 'Tp' : force per unit length tangential to the section in the direction of rotation (N/m)
-            - 'a' : axial induction factor
-            - 'ap' : tangential induction factor
-            - 'alpha' : airfoil angle of attack (degrees)
-            - 'Cl' : lift coefficient
-            - 'Cd' : drag coefficient
-            - 'Cn' : normal force coefficient
-            - 'Ct' : tangential force coefficient
-            - 'W' : airfoil relative velocity (m/s)
-            - 'Re' : chord Reynolds number
-
-        derivs : dict
-            Dictionary of derivatives of distributed aerodynamic loads with respect to inputs. Keys include:
-
-            - dNp : dictionary containing arrays (present if ``self.derivatives = True``)
-                derivatives of normal loads.  Each item in the dictionary a 2D Jacobian.
-                The array sizes and keys are (where n = number of stations along blade):
-                n x n (diagonal): 'dr', 'dchord', 'dtheta', 'dpresweep'
-                n x n (tridiagonal): 'dprecurve'
-                n x 1: 'dRhub', 'dRtip', 'dprecone', 'dtilt', 'dhubHt', 'dyaw', 'dshear', 'dazimuth', 'dUinf', 'dOmega', 'dpitch'
-                for example dNp_dr = dNp['dr']  (where dNp_dr is an n x n array)
-                and dNp_dr[i, j] = dNp_i / dr_j
-            - dTp : dictionary (present if ``self.derivatives = True``)
-                derivatives of tangential loads.  Same keys as dNp.
-        """
-
-        self.pitch = np.deg2rad(pitch)
-        azimuth = np.deg2rad(azimuth)
-
-        # component of velocity at each radial station
-        Vx, Vy, dVx_dw, dVy_dw, dVx_dcurve, dVy_dcurve = self.__windComponents(Uinf, Omega, azimuth)
+    def __bladeLoads(self, Vx, Vy, rotating):
+        """converge the BEM equations at all stations for the given inflow and return the loads.
+        With derivatives, also returns the total derivatives DNp_Dx, DTp_Dx of the loads (n x 8)
+        with respect to x = [chord, theta, Vx, Vy, r, Rhub, Rtip, pitch], otherwise None."""
 
         # initialize
         n = len(self.r)
@@ -945,60 +2260,84 @@ class CCBlade(object):
         Re = np.zeros(n)
         W = np.zeros(n)
 
-        dNp_dVx = np.zeros(n)
-        dTp_dVx = np.zeros(n)
-        dNp_dVy = np.zeros(n)
-        dTp_dVy = np.zeros(n)
-        dNp_dz = np.zeros((6, n))
-        dTp_dz = np.zeros((6, n))
+        # x = [phi, chord, theta, Vx, Vy, r, Rhub, Rtip, pitch]  (derivative order)
+        dNp_dx = np.zeros((n, 9))
+        dTp_dx = np.zeros((n, 9))
+        dR_dx = np.zeros((n, 9))
 
         if self.inverse_analysis == True:
             errf = self.__errorFunction_inverse
             self.theta = np.zeros_like(self.r)
         else:
             errf = self.__errorFunction
-        rotating = Omega != 0.0
 
-        # ---------------- loop across blade ------------------
-        for i in range(n):
+        # previous solution at each station (warm start)
+        if len(self._phi_warm) != n:
+            self._phi_warm = np.full(n, np.nan)
+        phi0 = self._phi_warm if self.warmstart else None
+        if phi0 is not None and self.solver == "brentq":
+            warm_lower, warm_upper = _warmBracket(phi0, np.deg2rad(5.0))
 
-            # index dependent arguments
-            if self.inverse_analysis == True:
-                args = (self.r[i], self.chord[i], self.cl[i], self.cd[i], self.af[i], Vx[i], Vy[i])
+        if self.solver != "brentq":
+            self.__groupAirfoils()
+            s = np.arange(n)
+            pitch_s = np.full(n, self.pitch)
+            induction = None
+
+            if not rotating:
+                phi_vec = np.full(n, np.pi / 2.0)
             else:
-                args = (self.r[i], self.chord[i], self.theta[i], self.af[i], Vx[i], Vy[i])
+                phi_vec, induction = self.__solvePhiArray(s, Vx, Vy, pitch_s, phi0)
+                self._phi_warm = phi_vec.copy()
 
-            if not rotating:  # non-rotating
+            if self.inverse_analysis == True:
+                self.theta = phi_vec - np.asarray(self.alpha) - self.pitch  # rad
 
-                phi_star = np.pi / 2.0
+            loads = self.__loadsVectorized(phi_vec, np.full(n, rotating), s, Vx, Vy, pitch_s, induction)
+            if not self.derivatives:
+                return loads, None, None
+
+            # all stations in one batched derivative pass
+            dNp_dx, dTp_dx, dR_dx = self.__loadsDerivativesVectorized(phi_vec, rotating, Vx, Vy)
+            Np, Tp, a, ap, alpha, cl, cd, cn, ct, W, Re = (
+                loads[key] for key in ("Np", "Tp", "a", "ap", "alpha", "Cl", "Cd", "Cn", "Ct", "W", "Re")
+            )
 
+        # index dependent arguments
+        def station_args(i):
+            if self.inverse_analysis == True:
+                return (self.r[i], self.chord[i], self.cl[i], self.cd[i], self.af[i], Vx[i], Vy[i])
             else:
+                return (self.r[i], self.chord[i], self.theta[i], self.af[i], Vx[i], Vy[i])
 
-                # ------ BEM solution method see (Ning, doi:10.1002/we.1636) ------
+        def station_bracket(i):
+            return (warm_lower[i], warm_upper[i]) if phi0 is not None else None
 
-                # set standard limits
-                epsilon = 1e-6
-                phi_lower = epsilon
-                phi_upper = np.pi / 2
+        # stations solved in a thread pool
+        if self.solver == "brentq" and rotating and self.nthreads > 1:
+            with ThreadPoolExecutor(max_workers=self.nthreads) as executor:
+                solve = lambda i: self.__solvePhiBrentq(errf, station_args(i), station_bracket(i))
+                phi_vec = np.array(list(executor.map(solve, range(n))))
+            self._phi_warm = phi_vec.copy()
 
-                if errf(phi_lower, *args) * errf(phi_upper, *args) > 0:  # an uncommon but possible case
+        # ---------------- loop across blade ------------------
+        stations = range(n) if self.solver == "brentq" else []
+        for i in stations:
 
-                    if errf(-np.pi / 4, *args) < 0 and errf(-epsilon, *args) > 0:
-                        phi_lower = -np.pi / 4
-                        phi_upper = -epsilon
-                    else:
-                        phi_lower = np.pi / 2
-                        phi_upper = np.pi - epsilon
+            args = station_args(i)
+
+            if not rotating:  # non-rotating
+
+                phi_star = np.pi / 2.0
 
-                try:
-                    phi_star = brentq(errf, phi_lower, phi_upper, args=args)
+            elif self.nthreads > 1:
 
-                except ValueError:
+                phi_star = phi_vec[i]
 
-                    warnings.warn("error.  check input values.")
-                    phi_star = 0.0
+            else:
 
-                # ----------------------------------------------------------------
+                phi_star = self.__solvePhiBrentq(errf, args, station_bracket(i))
+                self._phi_warm[i] = phi_star
 
             if self.inverse_analysis == True:
                 self.theta[i] = phi_star - self.alpha[i] - self.pitch  # rad
@@ -1019,13 +2358,13 @@ class CCBlade(object):
                 q[i],
                 W[i],
                 Re[i],
-                dNp_dx,
-                dTp_dx,
-                dR_dx,
+                dNp_dx[i],
+                dTp_dx[i],
+                dR_dx[i],
             ) = self.__loads(phi_star, rotating, *args)
 
             if np.isnan(Np[i]):
-                print(f"NaNs at {i}/{n}: {phi_lower} {phi_star} {phi_upper}")
+                print(f"NaNs at {i}/{n}: {phi_star}")
                 a[i] = 0.0
                 ap[i] = 0.0
                 Np[i] = 0.0
@@ -1033,35 +2372,106 @@ class CCBlade(object):
                 alpha[i] = 0.0
                 # print('warning, BEM convergence error, setting Np[%d] = Tp[%d] = 0.' % (i,i))
 
-            if self.derivatives:
-                # separate state vars from design vars
-                # x = [phi, chord, theta, Vx, Vy, r, Rhub, Rtip, pitch]  (derivative order)
-                dNp_dy = dNp_dx[0]
-                dNp_dx = dNp_dx[1:]
-                dTp_dy = dTp_dx[0]
-                dTp_dx = dTp_dx[1:]
-                dR_dy = dR_dx[0]
-                dR_dx = dR_dx[1:]
+        loads = {
+            "Np": Np,
+            "Tp": Tp,
+            "a": a,
+            "ap": ap,
+            "alpha": alpha,
+            "Cl": cl,
+            "Cd": cd,
+            "Cn": cn,
+            "Ct": ct,
+            "W": W,
+            "Re": Re,
+        }
+
+        if not self.derivatives:
+            return loads, None, None
+
+        # separate state vars from design vars
+        # direct (or adjoint) total derivatives
+        with np.errstate(divide="ignore", invalid="ignore"):
+            DNp_Dx = dNp_dx[:, 1:] - (dNp_dx[:, 0] / dR_dx[:, 0])[:, np.newaxis] * dR_dx[:, 1:]
+            DTp_Dx = dTp_dx[:, 1:] - (dTp_dx[:, 0] / dR_dx[:, 0])[:, np.newaxis] * dR_dx[:, 1:]
+
+        return loads, DNp_Dx, DTp_Dx
+
+    def distributedAeroLoads(self, Uinf, Omega, pitch, azimuth):
+        """Compute distributed aerodynamic loads along blade.
+
+        Parameters
+        ----------
+        Uinf : float or array_like (m/s)
+            hub height wind speed (float).  If desired, an array can be input which specifies
+            the velocity at each radial location along the blade (useful for analyzing loads
+            behind tower shadow for example).  In either case shear corrections will be applied.
+        Omega : float (RPM)
+            rotor rotation speed
+        pitch : float (deg)
+            blade pitch in same direction as :ref:`twist <blade_airfoil_coord>`
+            (positive decreases angle of attack)
+        azimuth : float (deg)
+            the :ref:`azimuth angle <hub_azimuth_coord>` where aerodynamic loads should be computed at
+
+        Returns
+        -------
+        loads : dict
+            Dictionary of distributed aerodynamic loads (and other useful quantities). Keys include:
+
+            - 'Np' : force per unit length normal to the section on downwind side (N/m)
+            - 'Tp' : force per unit length tangential to the section in the direction of rotation (N/m)
+            - 'a' : axial induction factor
+            - 'ap' : tangential induction factor
+            - 'alpha' : airfoil angle of attack (degrees)
+            - 'Cl' : lift coefficient
+            - 'Cd' : drag coefficient
+            - 'Cn' : normal force coefficient
+            - 'Ct' : tangential force coefficient
+            - 'W' : airfoil relative velocity (m/s)
+            - 'Re' : chord Reynolds number
+
+        derivs : dict
+            Dictionary of derivatives of distributed aerodynamic loads with respect to inputs. Keys include:
 
-                # direct (or adjoint) total derivatives
-                DNp_Dx = dNp_dx - dNp_dy / dR_dy * dR_dx
-                DTp_Dx = dTp_dx - dTp_dy / dR_dy * dR_dx
+            - dNp : dictionary containing arrays (present if ``self.derivatives = True``)
+                derivatives of normal loads.  Each item in the dictionary a 2D Jacobian.
+                The array sizes and keys are (where n = number of stations along blade):
+                n x n (diagonal): 'dr', 'dchord', 'dtheta', 'dpresweep'
+                n x n (tridiagonal): 'dprecurve'
+                (scipy.sparse dia_matrix if ``self.sparse = True``)
+                n x 1: 'dRhub', 'dRtip', 'dprecone', 'dtilt', 'dhubHt', 'dyaw', 'dshear', 'dazimuth',
+                'dUinf', 'dOmega', 'dpitch'
+                for example dNp_dr = dNp['dr']  (where dNp_dr is an n x n array)
+                and dNp_dr[i, j] = dNp_i / dr_j
+            - dTp : dictionary (present if ``self.derivatives = True``)
+                derivatives of tangential loads.  Same keys as dNp.
+        """
 
-                # parse components
-                # z = [r, chord, theta, Rhub, Rtip, pitch]
-                zidx = [4, 0, 1, 5, 6, 7]
-                dNp_dz[:, i] = DNp_Dx[zidx]
-                dTp_dz[:, i] = DTp_Dx[zidx]
+        self.pitch = np.deg2rad(pitch)
+        azimuth = np.deg2rad(azimuth)
 
-                dNp_dVx[i] = DNp_Dx[2]
-                dTp_dVx[i] = DTp_Dx[2]
+        # component of velocity at each radial station
+        Vx, Vy, dVx_dw, dVy_dw, dVx_dcurve, dVy_dcurve = self.__windComponents(Uinf, Omega, azimuth)
 
-                dNp_dVy[i] = DNp_Dx[3]
-                dTp_dVy[i] = DTp_Dx[3]
+        loads, DNp_Dx, DTp_Dx = self.__bladeLoads(Vx, Vy, Omega != 0.0)
+        n = len(self.r)
 
         derivs = {}
         if self.derivatives:
 
+            # parse components
+            # z = [r, chord, theta, Rhub, Rtip, pitch]
+            zidx = [4, 0, 1, 5, 6, 7]
+            dNp_dz = DNp_Dx[:, zidx].T
+            dTp_dz = DTp_Dx[:, zidx].T
+
+            dNp_dVx = DNp_Dx[:, 2]
+            dTp_dVx = DTp_Dx[:, 2]
+
+            dNp_dVy = DNp_Dx[:, 3]
+            dTp_dVy = DTp_Dx[:, 3]
+
             # chain rule
             dNp_dw = dNp_dVx * dVx_dw + dNp_dVy * dVy_dw
             dTp_dw = dTp_dVx * dVx_dw + dTp_dVy * dVy_dw
@@ -1096,18 +2506,23 @@ class CCBlade(object):
             dTp = {}
 
             # n x n (diagonal)
-            dNp["dr"] = np.diag(dNp_dX[0, :])
-            dTp["dr"] = np.diag(dTp_dX[0, :])
-            dNp["dchord"] = np.diag(dNp_dX[1, :])
-            dTp["dchord"] = np.diag(dTp_dX[1, :])
-            dNp["dtheta"] = np.diag(dNp_dX[2, :])
-            dTp["dtheta"] = np.diag(dTp_dX[2, :])
-            dNp["dpresweep"] = np.diag(dNp_dX[5, :])
-            dTp["dpresweep"] = np.diag(dTp_dX[5, :])
+            diag = diags if self.sparse else np.diag
+            dNp["dr"] = diag(dNp_dX[0, :])
+            dTp["dr"] = diag(dTp_dX[0, :])
+            dNp["dchord"] = diag(dNp_dX[1, :])
+            dTp["dchord"] = diag(dTp_dX[1, :])
+            dNp["dtheta"] = diag(dNp_dX[2, :])
+            dTp["dtheta"] = diag(dTp_dX[2, :])
+            dNp["dpresweep"] = diag(dNp_dX[5, :])
+            dTp["dpresweep"] = diag(dTp_dX[5, :])
 
             # n x n (tridiagonal)
-            dNp["dprecurve"] = dNp_dprecurve.T
-            dTp["dprecurve"] = dTp_dprecurve.T
+            if self.sparse:
+                dNp["dprecurve"] = diags([np.diagonal(dNp_dprecurve, k) for k in (1, 0, -1)], [-1, 0, 1])
+                dTp["dprecurve"] = diags([np.diagonal(dTp_dprecurve, k) for k in (1, 0, -1)], [-1, 0, 1])
+            else:
+                dNp["dprecurve"] = dNp_dprecurve.T
+                dTp["dprecurve"] = dTp_dprecurve.T
 
             # n x 1
             dNp["dRhub"] = dNp_dX[3, :].reshape(n, 1)
@@ -1136,23 +2551,9 @@ class CCBlade(object):
             derivs["dNp"] = dNp
             derivs["dTp"] = dTp
 
-        loads = {
-            "Np": Np,
-            "Tp": Tp,
-            "a": a,
-            "ap": ap,
-            "alpha": alpha,
-            "Cl": cl,
-            "Cd": cd,
-            "Cn": cn,
-            "Ct": ct,
-            "W": W,
-            "Re": Re,
-        }
-
         return loads, derivs
 
-    def evaluate(self, Uinf, Omega, pitch, coefficients=False):
+    def evaluate(self, Uinf, Omega, pitch, coefficients=False, nproc=1):
         """Run the aerodynamic analysis at the specified conditions.
 
         Parameters
@@ -1165,6 +2566,11 @@ class CCBlade(object):
             blade pitch setting
         coefficients : bool, optional
             if True, results are returned in nondimensional form
+        nproc : int, optional
+            number of worker processes.  If larger than 1, the conditions are split into contiguous
+            blocks that are evaluated in a ProcessPoolExecutor and the results (and derivatives)
+            are reassembled in the original order.  On platforms that spawn rather than fork,
+            the calling script needs an ``if __name__ == "__main__":`` guard.
 
         Returns
         -------
@@ -1221,6 +2627,11 @@ class CCBlade(object):
         ``R = Rtip*cos(precone) + precurveTip*sin(precone)``
         """
 
+        if nproc > 1 and np.size(Uinf) > 1:
+            return self.__evaluateParallel(Uinf, Omega, pitch, coefficients, ProcessPoolExecutor, nproc)
+        if self.nthreads > 1 and np.size(Uinf) > 1:
+            return self.__evaluateParallel(Uinf, Omega, pitch, coefficients, ThreadPoolExecutor, self.nthreads)
+
         # rename
         args = (
             self.r,
@@ -1267,32 +2678,48 @@ class CCBlade(object):
             dMz_dv = np.zeros((npts, 5, nr))
             dMb_dv = np.zeros((npts, 5, nr))
 
-        azimuth_angles = np.linspace(0.0, 2 * np.pi, nsec + 1)[:-1]
-        for i in range(npts):  # iterate across conditions
+        sectors = self.__azimuthSectors()
+        conditions = range(npts)
+
+        # all conditions and sectors at once
+        if self.solver != "brentq" and not self.derivatives and not self.inverse_analysis and npts > 0:
+            T, Y, Z, Q, My, Mz, Mb, W = self.__evaluateVectorized(Uinf, Omega, pitch, sectors, args)
+            conditions = []
 
-            for azimuth in azimuth_angles:  # integrate across azimuth
-                ca = np.cos(azimuth)
-                sa = np.sin(azimuth)
+        for i in conditions:  # iterate across conditions
+
+            for azimuth, weight, ca, sa in zip(*sectors):  # integrate across azimuth
 
                 # contribution from this azimuthal location
-                loads, derivs = self.distributedAeroLoads(Uinf[i], Omega[i], pitch[i], np.rad2deg(azimuth))
+                if self.derivatives and self.adjoint:
+                    self.pitch = np.deg2rad(pitch[i])
+                    Vx, Vy, _, _, _, _ = self.__windComponents(Uinf[i], Omega[i], azimuth, jacobian=False)
+                    loads, DNp_Dx, DTp_Dx = self.__bladeLoads(Vx, Vy, Omega[i] != 0.0)
+                else:
+                    loads, derivs = self.distributedAeroLoads(Uinf[i], Omega[i], pitch[i], np.rad2deg(azimuth))
                 Np, Tp, W = (loads["Np"], loads["Tp"], loads["W"])
 
                 Tsub, Ysub, Zsub, Qsub, Msub = _bem.thrusttorque(Np, Tp, *args)
 
                 # Scale rotor quantities (thrust & torque) by num blades.  Keep blade root moment as is
-                T[i] += self.B * Tsub / nsec
-                Y[i] += self.B * (Ysub * ca - Zsub * sa) / nsec
-                Z[i] += self.B * (Zsub * ca + Ysub * sa) / nsec
-                Q[i] += self.B * Qsub / nsec
-                My[i] += self.B * Msub * ca / nsec
-                Mz[i] += self.B * Msub * sa / nsec
-                Mb[i] += Msub / nsec
+                T[i] += self.B * Tsub * weight / nsec
+                Y[i] += self.B * (Ysub * ca - Zsub * sa) * weight / nsec
+                Z[i] += self.B * (Zsub * ca + Ysub * sa) * weight / nsec
+                Q[i] += self.B * Qsub * weight / nsec
+                My[i] += self.B * Msub * ca * weight / nsec
+                Mz[i] += self.B * Msub * sa * weight / nsec
+                Mb[i] += Msub * weight / nsec
 
                 if self.derivatives:
                     # dNp = derivs["dNp"]
                     # dTp = derivs["dTp"]
 
+                    if self.adjoint:
+                        sub = self.__thrustTorqueAdjoint(Np, Tp, DNp_Dx, DTp_Dx, Uinf[i], Omega[i], azimuth, *args)
+                    else:
+                        sub = self.__thrustTorqueDeriv(
+                            Np, Tp, self._dNp_dX, self._dTp_dX, self._dNp_dprecurve, self._dTp_dprecurve, *args
+                        )
                     (
                         dT_ds_sub,
                         dY_ds_sub,
@@ -1304,9 +2731,7 @@ class CCBlade(object):
                         dZ_dv_sub,
                         dQ_dv_sub,
                         dM_dv_sub,
-                    ) = self.__thrustTorqueDeriv(
-                        Np, Tp, self._dNp_dX, self._dTp_dX, self._dNp_dprecurve, self._dTp_dprecurve, *args
-                    )
+                    ) = sub
 
                     dT_ds[i, :] += self.B * dT_ds_sub / nsec
                     dY_ds[i, :] += self.B * (dY_ds_sub * ca - dZ_ds_sub * sa) / nsec
@@ -1487,6 +2912,54 @@ class CCBlade(object):
 
         return outputs, derivs
 
+    def __evaluateParallel(self, Uinf, Omega, pitch, coefficients, Executor, nworkers):
+        """evaluate with the conditions split across worker processes or threads"""
+
+        Uinf = np.array(Uinf).flatten()
+        Omega = np.array(Omega).flatten()
+        pitch = np.array(pitch).flatten()
+
+        # each block gets its own copy of the rotor state (theta, pitch, warm-start angles...).
+        # The airfoils and their packed set are shared: their evaluation keeps no state.
+        def block_rotor():
+            memo = {id(afi): afi for afi in self.af}
+            af_set = getattr(self, "_af_set", None)
+            if af_set is not None:
+                memo[id(af_set)] = af_set
+            rotor = copy.deepcopy(self, memo)
+            rotor.nthreads = 1
+            return rotor
+
+        blocks = np.array_split(np.arange(len(Uinf)), min(nworkers, len(Uinf)))
+        with Executor(max_workers=len(blocks)) as executor:
+            futures = [
+                executor.submit(block_rotor().evaluate, Uinf[i], Omega[i], pitch[i], coefficients) for i in blocks
+            ]
+            results = [future.result() for future in futures]
+
+        # W is the distribution of the last condition, as in the sequential loop
+        outputs = {}
+        for key in results[0][0]:
+            if key == "W":
+                outputs[key] = results[-1][0][key]
+            else:
+                outputs[key] = np.concatenate([out[key] for out, _ in results])
+
+        # npts x npts Jacobians are diagonal, the others are stacked by row
+        derivs = {}
+        for name in results[0][1]:
+            derivs[name] = {}
+            for key in results[0][1][name]:
+                jac = [d[name][key] for _, d in results]
+                if key in ("dUinf", "dOmega", "dpitch"):
+                    derivs[name][key] = np.diag(np.concatenate([np.diag(J) for J in jac]))
+                else:
+                    derivs[name][key] = np.vstack(jac)
+
+        self.pitch = np.deg2rad(pitch[-1])
+
+        return outputs, derivs
+
     def __thrustTorqueDeriv(
         self,
         Np,
@@ -1733,6 +3206,88 @@ class CCBlade(object):
 
         return dT_ds, dY_ds, dZ_ds, dQ_ds, dM_ds, dT_dv, dY_dv, dZ_dv, dQ_dv, dM_dv
 
+    def __thrustTorqueAdjoint(
+        self,
+        Np,
+        Tp,
+        DNp_Dx,
+        DTp_Dx,
+        Uinf,
+        Omega,
+        azimuth,
+        r,
+        precurve,
+        presweep,
+        precone,
+        Rhub,
+        Rtip,
+        precurveTip,
+        presweepTip,
+    ):
+        """derivatives of thrust and torque in reverse mode.  The adjoints of T, Y, Z, Q, M are
+        propagated back through the station loads (DNp_Dx, DTp_Dx from __bladeLoads) and the
+        inflow, so the n x n Jacobians of the distributed loads are never formed."""
+
+        Tb, Yb, Zb, Qb, Mb = np.eye(5)
+        Npb, Tpb, rb, precurveb, presweepb, preconeb, Rhubb, Rtipb, precurvetipb, presweeptipb = _bem.thrusttorque_bv(
+            Np, Tp, r, precurve, presweep, precone, Rhub, Rtip, precurveTip, presweepTip, Tb, Yb, Zb, Qb, Mb
+        )
+
+        # station inputs (5 x n x 8), x = [chord, theta, Vx, Vy, r, Rhub, Rtip, pitch]
+        xb = Npb[:, :, np.newaxis] * DNp_Dx + Tpb[:, :, np.newaxis] * DTp_Dx
+
+        # inflow
+        wrb, wprecurveb, wpresweepb, wpreconeb, yawb, tiltb, _, Uinfb, Omegab, hubHtb, shearb = _bem.windcomponents_bv(
+            r,
+            precurve,
+            presweep,
+            precone,
+            self.yaw,
+            self.tilt,
+            azimuth,
+            Uinf,
+            Omega,
+            self.hubHt,
+            self.shearExp,
+            xb[:, :, 2],
+            xb[:, :, 3],
+        )
+
+        # angles are input in degrees
+        deg = np.pi / 180.0
+
+        # scalars = [precone, tilt, hubHt, Rhub, Rtip, precurvetip, presweeptip, yaw, shear, Uinf, Omega, pitch]
+        ds = np.column_stack(
+            (
+                deg * (wpreconeb + preconeb),
+                deg * tiltb,
+                hubHtb,
+                np.sum(xb[:, :, 5], axis=1) + Rhubb,
+                np.sum(xb[:, :, 6], axis=1) + Rtipb,
+                precurvetipb,
+                presweeptipb,
+                deg * yawb,
+                shearb,
+                Uinfb,
+                Omegab,
+                deg * np.sum(xb[:, :, 7], axis=1),
+            )
+        )
+
+        # vectors = [r, chord, theta, precurve, presweep]
+        dv = np.stack(
+            (
+                xb[:, :, 4] + wrb + rb,
+                xb[:, :, 0],
+                deg * xb[:, :, 1],
+                wprecurveb + precurveb,
+                wpresweepb + presweepb,
+            ),
+            axis=1,
+        )
+
+        return (*ds, *dv)
+
     def __thrustTorqueDictionary(
         self,
         dT_ds,
@@ -222,46 +222,28 @@ class CCBladeLoads(ExplicitComponent):
         self.add_output("loads_Pz", val=np.zeros(n_span), units="N/m")
 
         arange = np.arange(n_span)
-        self.declare_partials(
-            "loads_Px",
-            [
-                "Omega_load",
-                "Rhub",
-                "Rtip",
-                "V_load",
-                "azimuth_load",
-                "chord",
-                "hub_height",
-                "pitch_load",
-                "precone",
-                "precurve",
-                "r",
-                "theta",
-                "tilt",
-                "yaw",
-                "shearExp",
-            ],
-        )
-        self.declare_partials(
-            "loads_Py",
-            [
-                "Omega_load",
-                "Rhub",
-                "Rtip",
-                "V_load",
-                "azimuth_load",
-                "chord",
-                "hub_height",
-                "pitch_load",
-                "precone",
-                "precurve",
-                "r",
-                "theta",
-                "tilt",
-                "yaw",
-                "shearExp",
-            ],
-        )
+        # tridiagonal sparsity of the precurve derivatives
+        self.rows_tri = np.r_[arange, arange[1:], arange[:-1]]
+        self.cols_tri = np.r_[arange, arange[:-1], arange[1:]]
+        for output in ["loads_Px", "loads_Py"]:
+            self.declare_partials(
+                output,
+                [
+                    "Omega_load",
+                    "Rhub",
+                    "Rtip",
+                    "V_load",
+                    "azimuth_load",
+                    "hub_height",
+                    "pitch_load",
+                    "precone",
+                    "tilt",
+                    "yaw",
+                    "shearExp",
+                ],
+            )
+            self.declare_partials(output, ["chord", "r", "theta"], rows=arange, cols=arange)
+            self.declare_partials(output, "precurve", rows=self.rows_tri, cols=self.cols_tri)
         self.declare_partials("loads_Pz", "*", dependent=False)
         self.declare_partials("loads_r", "r", val=1.0, rows=arange, cols=arange)
         self.declare_partials("*", "airfoils*", dependent=False)
@@ -298,7 +280,7 @@ class CCBladeLoads(ExplicitComponent):
         # airfoil files
         af = [None] * self.n_span
         for i in range(self.n_span):
-            af[i] = CCAirfoil(
+            af[i] = CCAirfoil.initCached(
                 inputs["airfoils_aoa"],
                 inputs["airfoils_Re"],
                 inputs["airfoils_cl"][i, :, :, 0],
@@ -329,6 +311,7 @@ class CCBladeLoads(ExplicitComponent):
             wakerotation=wakerotation,
             usecd=usecd,
             derivatives=True,
+            sparse=True,
         )
 
         # distributed loads
@@ -348,9 +331,9 @@ class CCBladeLoads(ExplicitComponent):
         dNp = self.derivs["dNp"]
         dTp = self.derivs["dTp"]
 
-        J["loads_Px", "r"] = dNp["dr"]
-        J["loads_Px", "chord"] = dNp["dchord"]
-        J["loads_Px", "theta"] = dNp["dtheta"]
+        J["loads_Px", "r"] = dNp["dr"].diagonal()
+        J["loads_Px", "chord"] = dNp["dchord"].diagonal()
+        J["loads_Px", "theta"] = dNp["dtheta"].diagonal()
         J["loads_Px", "Rhub"] = np.squeeze(dNp["dRhub"])
         J["loads_Px", "Rtip"] = np.squeeze(dNp["dRtip"])
         J["loads_Px", "hub_height"] = np.squeeze(dNp["dhubHt"])
@@ -362,11 +345,11 @@ class CCBladeLoads(ExplicitComponent):
         J["loads_Px", "Omega_load"] = np.squeeze(dNp["dOmega"])
         J["loads_Px", "pitch_load"] = np.squeeze(dNp["dpitch"])
         J["loads_Px", "azimuth_load"] = np.squeeze(dNp["dazimuth"])
-        J["loads_Px", "precurve"] = dNp["dprecurve"]
+        J["loads_Px", "precurve"] = np.asarray(dNp["dprecurve"].tocsr()[self.rows_tri, self.cols_tri]).ravel()
 
-        J["loads_Py", "r"] = -dTp["dr"]
-        J["loads_Py", "chord"] = -dTp["dchord"]
-        J["loads_Py", "theta"] = -dTp["dtheta"]
+        J["loads_Py", "r"] = -dTp["dr"].diagonal()
+        J["loads_Py", "chord"] = -dTp["dchord"].diagonal()
+        J["loads_Py", "theta"] = -dTp["dtheta"].diagonal()
         J["loads_Py", "Rhub"] = -np.squeeze(dTp["dRhub"])
         J["loads_Py", "Rtip"] = -np.squeeze(dTp["dRtip"])
         J["loads_Py", "hub_height"] = -np.squeeze(dTp["dhubHt"])
@@ -378,7 +361,7 @@ class CCBladeLoads(ExplicitComponent):
         J["loads_Py", "Omega_load"] = -np.squeeze(dTp["dOmega"])
         J["loads_Py", "pitch_load"] = -np.squeeze(dTp["dpitch"])
         J["loads_Py", "azimuth_load"] = -np.squeeze(dTp["dazimuth"])
-        J["loads_Py", "precurve"] = -dTp["dprecurve"]
+        J["loads_Py", "precurve"] = -np.asarray(dTp["dprecurve"].tocsr()[self.rows_tri, self.cols_tri]).ravel()
 
 
 class CCBladeTwist(ExplicitComponent):
@@ -538,7 +521,7 @@ class CCBladeTwist(ExplicitComponent):
         for i in range(self.n_span):
             if self.n_tab > 1:
                 ref_tab = int(np.floor(self.n_tab / 2))
-                af[i] = CCAirfoil(
+                af[i] = CCAirfoil.initCached(
                     inputs["airfoils_aoa"],
                     inputs["airfoils_Re"],
                     inputs["airfoils_cl"][i, :, :, ref_tab],
@@ -546,7 +529,7 @@ class CCBladeTwist(ExplicitComponent):
                     inputs["airfoils_cm"][i, :, :, ref_tab],
                 )
             else:
-                af[i] = CCAirfoil(
+                af[i] = CCAirfoil.initCached(
                     inputs["airfoils_aoa"],
                     inputs["airfoils_Re"],
                     inputs["airfoils_cl"][i, :, :, 0],
@@ -598,13 +581,14 @@ class CCBladeTwist(ExplicitComponent):
             for i in range(self.n_span):
                 # Use the required angle of attack if defined. If it isn't defined (==pi), then take the stall point minus the margin
                 if abs(aoa_op[i] - np.pi) < 1.0e-4:
-                    af[i].eval_unsteady(
+                    # af[i] may be shared (initCached): the unsteady coefficients are not stored on it
+                    unsteady = CCAirfoil.unsteady_params(
                         inputs["airfoils_aoa"],
                         inputs["airfoils_cl"][i, :, 0, 0],
                         inputs["airfoils_cd"][i, :, 0, 0],
                         inputs["airfoils_cm"][i, :, 0, 0],
                     )
-                    alpha[i] = (af[i].unsteady["alpha1"] - margin2stall) / 180.0 * np.pi
+                    alpha[i] = (unsteady["alpha1"] - margin2stall) / 180.0 * np.pi
                 else:
                     alpha[i] = aoa_op[i]
                 cl[i], cd[i] = af[i].evaluate(alpha[i], Re[i])
@@ -798,7 +782,7 @@ class CCBladeEvaluate(ExplicitComponent):
         # airfoil files
         af = [None] * self.n_span
         for i in range(self.n_span):
-            af[i] = CCAirfoil(
+            af[i] = CCAirfoil.initCached(
                 inputs["airfoils_aoa"],
                 inputs["airfoils_Re"],
                 inputs["airfoils_cl"][i, :, :, 0],
@@ -876,7 +860,7 @@ class CCBladeEvaluate(ExplicitComponent):
         # airfoil files
         af = [None] * self.n_span
         for i in range(self.n_span):
-            af[i] = CCAirfoil(
+            af[i] = CCAirfoil.initCached(
                 inputs["airfoils_aoa"],
                 inputs["airfoils_Re"],
                 inputs["airfoils_cl"][i, :, :, 0],
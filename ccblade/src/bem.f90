@@ -19,6 +19,7 @@ subroutine inductionFactors(r, chord, Rhub, Rtip, phi, cl, cd, B, &
     fzero, a, ap)
 
     implicit none
+    !f2py threadsafe
 
     integer, parameter :: dp = kind(0.d0)
 
@@ -131,6 +132,7 @@ subroutine relativeWind(phi, a, ap, Vx, Vy, pitch, &
     chord, theta, rho, mu, alpha, W, Re)
 
     implicit none
+    !f2py threadsafe
 
     integer, parameter :: dp = kind(0.d0)
 
@@ -166,6 +168,7 @@ end subroutine relativeWind
 subroutine defineCurvature(n, r, precurve, presweep, precone, x_az, y_az, z_az, cone, s)
 
     implicit none
+    !f2py threadsafe
 
     integer, parameter :: dp = kind(0.d0)
 
@@ -213,6 +216,7 @@ subroutine windComponents(n, r, precurve, presweep, precone, yaw, tilt, azimuth,
     Uinf, OmegaRPM, hubHt, shearExp, Vx, Vy)
 
     implicit none
+    !f2py threadsafe
 
     integer, parameter :: dp = kind(0.d0)
 
@@ -291,6 +295,7 @@ subroutine thrustTorque(n, Np, Tp, r, precurve, presweep, precone, &
     Rhub, Rtip, precurveTip, presweepTip, T, Y, Z, Q, M)
 
     implicit none
+    !f2py threadsafe
 
     integer, parameter :: dp = kind(0.d0)
 
@@ -362,6 +367,1107 @@ end subroutine thrustTorque
 
 
 
+subroutine bsplineBasis(nt, t, k, x, l, h)
+
+    ! values of the k+1 B-splines that are nonzero on t(l) <= x < t(l+1)
+    ! (de Boor-Cox recurrence, same operations as FITPACK fpbspl)
+
+    implicit none
+    !f2py threadsafe
+
+    integer, parameter :: dp = kind(0.d0)
+
+    ! in
+    integer, intent(in) :: nt, k, l
+    real(dp), dimension(nt), intent(in) :: t
+    real(dp), intent(in) :: x
+
+    ! out
+    real(dp), dimension(6), intent(out) :: h
+
+    ! local
+    real(dp) :: f
+    real(dp), dimension(6) :: hh
+    integer :: i, j, li, lj
+
+
+    h = 0.0_dp
+    h(1) = 1.0_dp
+    do j = 1, k
+        hh(1:j) = h(1:j)
+        h(1) = 0.0_dp
+        do i = 1, j
+            li = l + i
+            lj = li - j
+            if (t(li) /= t(lj)) then
+                f = hh(i)/(t(li) - t(lj))
+                h(i) = h(i) + f*(t(li) - x)
+                h(i+1) = f*(x - t(lj))
+            else
+                h(i+1) = 0.0_dp
+            end if
+        end do
+    end do
+
+end subroutine bsplineBasis
+
+
+
+
+subroutine bsplineBasisDeriv(nt, t, k, x, l, h, dh)
+
+    ! values h and first derivatives dh of the k+1 B-splines that are nonzero on
+    ! t(l) <= x < t(l+1), from the degree k-1 basis on the same interval
+
+    implicit none
+    !f2py threadsafe
+
+    integer, parameter :: dp = kind(0.d0)
+
+    ! in
+    integer, intent(in) :: nt, k, l
+    real(dp), dimension(nt), intent(in) :: t
+    real(dp), intent(in) :: x
+
+    ! out
+    real(dp), dimension(6), intent(out) :: h, dh
+
+    ! local
+    real(dp) :: f
+    real(dp), dimension(6) :: hk
+    integer :: j
+
+
+    dh = 0.0_dp
+    call bsplineBasis(nt, t, k, x, l, h)
+    if (k == 0) return
+
+    ! B'(i, k) = k*(B(i, k-1)/(t(i+k) - t(i)) - B(i+1, k-1)/(t(i+k+1) - t(i+1))), i = l-k-1+j
+    call bsplineBasis(nt, t, k-1, x, l, hk)
+    do j = 1, k
+        if (t(l+j) /= t(l+j-k)) then
+            f = k*hk(j)/(t(l+j) - t(l+j-k))
+            dh(j) = dh(j) - f
+            dh(j+1) = dh(j+1) + f
+        end if
+    end do
+
+end subroutine bsplineBasisDeriv
+
+
+
+
+subroutine knotSpan(nt, t, k, x, arg, l)
+
+    ! knot interval t(l) <= arg < t(l+1) of x clipped to the knot range, with l in
+    ! [k+1, nt-k-1] as found by the forward search of FITPACK fpbisp.  On input l is a
+    ! guess (e.g. the interval of the previous call).  If it is wrong, the search walks from
+    ! the position of arg within the knot range, which is exact for uniform knots (tables).
+
+    implicit none
+    !f2py threadsafe
+
+    integer, parameter :: dp = kind(0.d0)
+
+    ! in
+    integer, intent(in) :: nt, k
+    real(dp), dimension(nt), intent(in) :: t
+    real(dp), intent(in) :: x
+
+    ! out
+    real(dp), intent(out) :: arg
+    integer, intent(inout) :: l
+
+    ! local
+    integer :: nk1
+
+
+    nk1 = nt - k - 1
+    arg = x
+    if (arg < t(k+1)) arg = t(k+1)
+    if (arg > t(nk1+1)) arg = t(nk1+1)
+
+    l = max(k+1, min(l, nk1))
+    if (.not. ((arg < t(l+1) .or. l == nk1) .and. (t(l) <= arg .or. l == k+1))) then
+        if (t(nk1+1) > t(k+1)) then
+            l = k + 1 + int((arg - t(k+1))/(t(nk1+1) - t(k+1))*(nk1 - k))
+            l = max(k+1, min(l, nk1))
+        end if
+    end if
+    do while (.not. (arg < t(l+1) .or. l == nk1))
+        l = l + 1
+    end do
+    do while (.not. (t(l) <= arg .or. l == k+1))
+        l = l - 1
+    end do
+
+end subroutine knotSpan
+
+
+
+
+subroutine bisplineSpan(nx, tx, ny, ty, nc, c, kx, ky, x, y, lx, ly, z)
+
+    ! bivariate tensor-product B-spline at one point, same operations as FITPACK fpbisp
+    ! (the spline behind scipy's RectBivariateSpline.ev).  x and y are clipped to the knot range.
+    ! lx, ly are the knot intervals in x and y, used as the starting guess and updated.
+
+    implicit none
+    !f2py threadsafe
+
+    integer, parameter :: dp = kind(0.d0)
+
+    ! in
+    integer, intent(in) :: nx, ny, nc, kx, ky
+    real(dp), dimension(nx), intent(in) :: tx
+    real(dp), dimension(ny), intent(in) :: ty
+    real(dp), dimension(nc), intent(in) :: c
+    real(dp), intent(in) :: x, y
+
+    ! out
+    integer, intent(inout) :: lx, ly
+    real(dp), intent(out) :: z
+
+    ! local
+    real(dp) :: arg
+    real(dp), dimension(6) :: wx, wy
+    integer :: l1, l2, i1, j1, nky1
+
+
+    ! knot interval and basis in x
+    call knotSpan(nx, tx, kx, x, arg, lx)
+    call bsplineBasis(nx, tx, kx, arg, lx, wx)
+
+    ! a single piece of degree 0 in y (spline in x only): no search, basis or sum in y
+    if (ky == 0 .and. ny == 2) then
+        z = dot_product(c(lx-kx:lx), wx(1:kx+1))
+        return
+    end if
+
+    ! knot interval and basis in y
+    nky1 = ny - ky - 1
+    call knotSpan(ny, ty, ky, y, arg, ly)
+    call bsplineBasis(ny, ty, ky, arg, ly, wy)
+
+    ! tensor product
+    z = 0.0_dp
+    l1 = (lx - kx - 1)*nky1 + ly - ky - 1
+    do i1 = 1, kx+1
+        l2 = l1
+        do j1 = 1, ky+1
+            l2 = l2 + 1
+            z = z + c(l2)*wx(i1)*wy(j1)
+        end do
+        l1 = l1 + nky1
+    end do
+
+end subroutine bisplineSpan
+
+
+
+
+subroutine bisplineSpanDeriv(nx, tx, ny, ty, nc, c, kx, ky, x, y, lx, ly, z, zx, zy)
+
+    ! bivariate B-spline and its first partial derivatives at one point, from one knot
+    ! search and one set of basis functions (see bisplineSpan).  Outside of the knot range
+    ! the spline is evaluated at the clipped point.
+
+    implicit none
+    !f2py threadsafe
+
+    integer, parameter :: dp = kind(0.d0)
+
+    ! in
+    integer, intent(in) :: nx, ny, nc, kx, ky
+    real(dp), dimension(nx), intent(in) :: tx
+    real(dp), dimension(ny), intent(in) :: ty
+    real(dp), dimension(nc), intent(in) :: c
+    real(dp), intent(in) :: x, y
+
+    ! out
+    integer, intent(inout) :: lx, ly
+    real(dp), intent(out) :: z, zx, zy
+
+    ! local
+    real(dp) :: arg
+    real(dp), dimension(6) :: wx, wy, dwx, dwy
+    integer :: l1, l2, i1, j1, nky1
+
+
+    call knotSpan(nx, tx, kx, x, arg, lx)
+    call bsplineBasisDeriv(nx, tx, kx, arg, lx, wx, dwx)
+
+    if (ky == 0 .and. ny == 2) then
+        z = dot_product(c(lx-kx:lx), wx(1:kx+1))
+        zx = dot_product(c(lx-kx:lx), dwx(1:kx+1))
+        zy = 0.0_dp
+        return
+    end if
+
+    nky1 = ny - ky - 1
+    call knotSpan(ny, ty, ky, y, arg, ly)
+    call bsplineBasisDeriv(ny, ty, ky, arg, ly, wy, dwy)
+
+    z = 0.0_dp
+    zx = 0.0_dp
+    zy = 0.0_dp
+    l1 = (lx - kx - 1)*nky1 + ly - ky - 1
+    do i1 = 1, kx+1
+        l2 = l1
+        do j1 = 1, ky+1
+            l2 = l2 + 1
+            z = z + c(l2)*wx(i1)*wy(j1)
+            zx = zx + c(l2)*dwx(i1)*wy(j1)
+            zy = zy + c(l2)*wx(i1)*dwy(j1)
+        end do
+        l1 = l1 + nky1
+    end do
+
+end subroutine bisplineSpanDeriv
+
+
+
+
+subroutine bisplineEval(nx, tx, ny, ty, nc, c, kx, ky, x, y, z)
+
+    ! bivariate tensor-product B-spline at one point (see bisplineSpan)
+
+    implicit none
+    !f2py threadsafe
+
+    integer, parameter :: dp = kind(0.d0)
+
+    ! in
+    integer, intent(in) :: nx, ny, nc, kx, ky
+    real(dp), dimension(nx), intent(in) :: tx
+    real(dp), dimension(ny), intent(in) :: ty
+    real(dp), dimension(nc), intent(in) :: c
+    real(dp), intent(in) :: x, y
+
+    ! out
+    real(dp), intent(out) :: z
+
+    ! local
+    integer :: lx, ly
+
+
+    lx = kx + 1
+    ly = ky + 1
+    call bisplineSpan(nx, tx, ny, ty, nc, c, kx, ky, x, y, lx, ly, z)
+
+end subroutine bisplineEval
+
+
+
+
+subroutine splineLookup(ispl, nspl, splint, nknot, knots, ncoef, coefs, x, y, z)
+
+    ! evaluate spline ispl of a packed set of bivariate splines
+    ! splint(:, ispl) = (first x knot, nx, first y knot, ny, first coefficient, kx, ky, logy)
+    ! tabulated data are packed as degree-1 splines: knots are the grid with repeated
+    ! end points and the coefficients are the table values
+    ! logy /= 0 marks splines whose y knots are in log(y) (tables on a log-spaced grid)
+
+    implicit none
+    !f2py threadsafe
+
+    integer, parameter :: dp = kind(0.d0)
+
+    ! in
+    integer, intent(in) :: ispl, nspl, nknot, ncoef
+    integer, dimension(8, nspl), intent(in) :: splint
+    real(dp), dimension(nknot), intent(in) :: knots
+    real(dp), dimension(ncoef), intent(in) :: coefs
+    real(dp), intent(in) :: x, y
+
+    ! out
+    real(dp), intent(out) :: z
+
+    ! local
+    integer :: nx, ny, kx, ky
+    real(dp) :: yy
+
+
+    nx = splint(2, ispl)
+    ny = splint(4, ispl)
+    kx = splint(6, ispl)
+    ky = splint(7, ispl)
+    yy = y
+    if (splint(8, ispl) /= 0) yy = log(y)
+
+    call bisplineEval(nx, knots(splint(1, ispl)), ny, knots(splint(3, ispl)), &
+        (nx-kx-1)*(ny-ky-1), coefs(splint(5, ispl)), kx, ky, x, yy, z)
+
+end subroutine splineLookup
+
+
+
+
+subroutine splineEvalArray(m, nspl, splint, nknot, knots, ncoef, coefs, x, y, z)
+
+    ! evaluate all splines of a packed set (see splineLookup) at m points.
+    ! span(:, ispl) holds the last x and y knot intervals of spline ispl; they are the
+    ! starting point of the next search, so nearby successive points cost one comparison.
+    ! span is local to the call, so concurrent calls on the same splines are independent.
+
+    implicit none
+    !f2py threadsafe
+
+    integer, parameter :: dp = kind(0.d0)
+
+    ! in
+    integer, intent(in) :: m, nspl, nknot, ncoef
+    integer, dimension(8, nspl), intent(in) :: splint
+    real(dp), dimension(nknot), intent(in) :: knots
+    real(dp), dimension(ncoef), intent(in) :: coefs
+    real(dp), dimension(m), intent(in) :: x, y
+
+    ! out
+    real(dp), dimension(nspl, m), intent(out) :: z
+
+    ! local
+    integer :: i, ispl, nx, ny, kx, ky
+    integer, dimension(2, nspl) :: span
+    real(dp) :: yy
+
+
+    span(1, :) = splint(6, :) + 1
+    span(2, :) = splint(7, :) + 1
+
+    do ispl = 1, nspl
+        nx = splint(2, ispl)
+        ny = splint(4, ispl)
+        kx = splint(6, ispl)
+        ky = splint(7, ispl)
+        do i = 1, m
+            yy = y(i)
+            if (splint(8, ispl) /= 0) yy = log(y(i))
+            call bisplineSpan(nx, knots(splint(1, ispl)), ny, knots(splint(3, ispl)), &
+                (nx-kx-1)*(ny-ky-1), coefs(splint(5, ispl)), kx, ky, x(i), yy, &
+                span(1, ispl), span(2, ispl), z(ispl, i))
+        end do
+    end do
+
+end subroutine splineEvalArray
+
+
+
+
+subroutine splineEvalArrayDeriv(m, nspl, splint, nknot, knots, ncoef, coefs, x, y, z, zx, zy)
+
+    ! values and first partial derivatives of all splines of a packed set at m points
+    ! (see splineEvalArray)
+
+    implicit none
+    !f2py threadsafe
+
+    integer, parameter :: dp = kind(0.d0)
+
+    ! in
+    integer, intent(in) :: m, nspl, nknot, ncoef
+    integer, dimension(8, nspl), intent(in) :: splint
+    real(dp), dimension(nknot), intent(in) :: knots
+    real(dp), dimension(ncoef), intent(in) :: coefs
+    real(dp), dimension(m), intent(in) :: x, y
+
+    ! out
+    real(dp), dimension(nspl, m), intent(out) :: z, zx, zy
+
+    ! local
+    integer :: i, ispl, nx, ny, kx, ky
+    integer, dimension(2, nspl) :: span
+    real(dp) :: yy
+
+
+    span(1, :) = splint(6, :) + 1
+    span(2, :) = splint(7, :) + 1
+
+    do ispl = 1, nspl
+        nx = splint(2, ispl)
+        ny = splint(4, ispl)
+        kx = splint(6, ispl)
+        ky = splint(7, ispl)
+        do i = 1, m
+            if (splint(8, ispl) /= 0) then
+                call bisplineSpanDeriv(nx, knots(splint(1, ispl)), ny, knots(splint(3, ispl)), &
+                    (nx-kx-1)*(ny-ky-1), coefs(splint(5, ispl)), kx, ky, x(i), log(y(i)), &
+                    span(1, ispl), span(2, ispl), z(ispl, i), zx(ispl, i), yy)
+                zy(ispl, i) = yy / y(i)
+            else
+                call bisplineSpanDeriv(nx, knots(splint(1, ispl)), ny, knots(splint(3, ispl)), &
+                    (nx-kx-1)*(ny-ky-1), coefs(splint(5, ispl)), kx, ky, x(i), y(i), &
+                    span(1, ispl), span(2, ispl), z(ispl, i), zx(ispl, i), zy(ispl, i))
+            end if
+        end do
+    end do
+
+end subroutine splineEvalArrayDeriv
+
+
+
+
+subroutine splineEvalIndexed(m, ncomp, ispl, nspl, splint, nknot, knots, ncoef, coefs, x, y, z)
+
+    ! evaluate the ncomp consecutive splines ispl(i), ..., ispl(i)+ncomp-1 of a packed set
+    ! at point i, for m points (e.g. lift and drag of the airfoil at each blade station).
+    ! span as in splineEvalArray.
+
+    implicit none
+    !f2py threadsafe
+
+    integer, parameter :: dp = kind(0.d0)
+
+    ! in
+    integer, intent(in) :: m, ncomp, nspl, nknot, ncoef
+    integer, dimension(m), intent(in) :: ispl
+    integer, dimension(8, nspl), intent(in) :: splint
+    real(dp), dimension(nknot), intent(in) :: knots
+    real(dp), dimension(ncoef), intent(in) :: coefs
+    real(dp), dimension(m), intent(in) :: x, y
+
+    ! out
+    real(dp), dimension(ncomp, m), intent(out) :: z
+
+    ! local
+    integer :: i, j, k, nx, ny, kx, ky
+    integer, dimension(2, nspl) :: span
+    real(dp) :: yy
+
+
+    span(1, :) = splint(6, :) + 1
+    span(2, :) = splint(7, :) + 1
+
+    do i = 1, m
+        do j = 1, ncomp
+            k = ispl(i) + j - 1
+            nx = splint(2, k)
+            ny = splint(4, k)
+            kx = splint(6, k)
+            ky = splint(7, k)
+            yy = y(i)
+            if (splint(8, k) /= 0) yy = log(y(i))
+            call bisplineSpan(nx, knots(splint(1, k)), ny, knots(splint(3, k)), &
+                (nx-kx-1)*(ny-ky-1), coefs(splint(5, k)), kx, ky, x(i), yy, &
+                span(1, k), span(2, k), z(j, i))
+        end do
+    end do
+
+end subroutine splineEvalIndexed
+
+
+
+
+subroutine splineEvalIndexedDeriv(m, ncomp, ispl, nspl, splint, nknot, knots, ncoef, coefs, x, y, z, zx, zy)
+
+    ! values and first partial derivatives of splines ispl(i), ..., ispl(i)+ncomp-1 at point i
+    ! (see splineEvalIndexed)
+
+    implicit none
+    !f2py threadsafe
+
+    integer, parameter :: dp = kind(0.d0)
+
+    ! in
+    integer, intent(in) :: m, ncomp, nspl, nknot, ncoef
+    integer, dimension(m), intent(in) :: ispl
+    integer, dimension(8, nspl), intent(in) :: splint
+    real(dp), dimension(nknot), intent(in) :: knots
+    real(dp), dimension(ncoef), intent(in) :: coefs
+    real(dp), dimension(m), intent(in) :: x, y
+
+    ! out
+    real(dp), dimension(ncomp, m), intent(out) :: z, zx, zy
+
+    ! local
+    integer :: i, j, k, nx, ny, kx, ky
+    integer, dimension(2, nspl) :: span
+    real(dp) :: yy
+
+
+    span(1, :) = splint(6, :) + 1
+    span(2, :) = splint(7, :) + 1
+
+    do i = 1, m
+        do j = 1, ncomp
+            k = ispl(i) + j - 1
+            nx = splint(2, k)
+            ny = splint(4, k)
+            kx = splint(6, k)
+            ky = splint(7, k)
+            if (splint(8, k) /= 0) then
+                call bisplineSpanDeriv(nx, knots(splint(1, k)), ny, knots(splint(3, k)), &
+                    (nx-kx-1)*(ny-ky-1), coefs(splint(5, k)), kx, ky, x(i), log(y(i)), &
+                    span(1, k), span(2, k), z(j, i), zx(j, i), yy)
+                zy(j, i) = yy / y(i)
+            else
+                call bisplineSpanDeriv(nx, knots(splint(1, k)), ny, knots(splint(3, k)), &
+                    (nx-kx-1)*(ny-ky-1), coefs(splint(5, k)), kx, ky, x(i), y(i), &
+                    span(1, k), span(2, k), z(j, i), zx(j, i), zy(j, i))
+            end if
+        end do
+    end do
+
+end subroutine splineEvalIndexedDeriv
+
+
+
+
+subroutine bemResidual(phi, r, chord, theta, Vx, Vy, pitch, icl, icd, &
+    Rhub, Rtip, B, rho, mu, iterRe, nspl, splint, nknot, knots, ncoef, coefs, &
+    useCd, hubLoss, tipLoss, wakerotation, fzero, a, ap, cl, cd)
+
+    ! residual of the BEM equations at one section (CCBlade.__runBEM)
+
+    implicit none
+    !f2py threadsafe
+
+    integer, parameter :: dp = kind(0.d0)
+
+    ! in
+    real(dp), intent(in) :: phi, r, chord, theta, Vx, Vy, pitch
+    integer, intent(in) :: icl, icd
+    real(dp), intent(in) :: Rhub, Rtip, rho, mu
+    integer, intent(in) :: B, iterRe
+    integer, intent(in) :: nspl, nknot, ncoef
+    integer, dimension(8, nspl), intent(in) :: splint
+    real(dp), dimension(nknot), intent(in) :: knots
+    real(dp), dimension(ncoef), intent(in) :: coefs
+    logical, intent(in) :: useCd, hubLoss, tipLoss, wakerotation
+    !f2py logical, optional, intent(in) :: useCd = 1, hubLoss = 1, tipLoss = 1, wakerotation = 1
+
+    ! out
+    real(dp), intent(out) :: fzero, a, ap, cl, cd
+
+    ! local
+    real(dp) :: alpha, W, Re
+    integer :: i
+
+
+    a = 0.0_dp
+    ap = 0.0_dp
+    fzero = 0.0_dp
+    cl = 0.0_dp
+    cd = 0.0_dp
+
+    do i = 1, iterRe
+
+        call relativeWind(phi, a, ap, Vx, Vy, pitch, chord, theta, rho, mu, alpha, W, Re)
+        call splineLookup(icl, nspl, splint, nknot, knots, ncoef, coefs, alpha, Re, cl)
+        call splineLookup(icd, nspl, splint, nknot, knots, ncoef, coefs, alpha, Re, cd)
+
+        call inductionFactors(r, chord, Rhub, Rtip, phi, cl, cd, B, &
+            Vx, Vy, useCd, hubLoss, tipLoss, wakerotation, fzero, a, ap)
+
+    end do
+
+end subroutine bemResidual
+
+
+
+
+subroutine solvePhi(m, r, chord, theta, Vx, Vy, pitch, icl, icd, &
+    Rhub, Rtip, B, rho, mu, iterRe, nspl, splint, nknot, knots, ncoef, coefs, &
+    phi0, dphi, useCd, hubLoss, tipLoss, wakerotation, &
+    phi, a, ap, cl, cd, alpha, W, Re, Np, Tp, info)
+
+    ! converge the inflow angle at m rotating sections in one call and return their loads.
+    ! Same bracketing as CCBlade (Ning, doi:10.1002/we.1636) and the same iteration as
+    ! scipy.optimize.brentq.  Sections are independent, so they can be any mix of stations
+    ! and operating conditions.  icl, icd index the lift and drag splines of each section
+    ! in the packed set (see splineLookup).
+    ! info = 1 where brentq would fail (no sign change or NaN residual); phi is then 0.
+    ! Sections with Vx = 0 or Vy = 0 carry no load and return zeros.
+    ! Where phi0 is not NaN the bracket phi0 +/- dphi (within the standard bracket containing
+    ! phi0) is tried first, and the standard bracket search is only used if it has no sign change.
+
+    implicit none
+    !f2py threadsafe
+
+    integer, parameter :: dp = kind(0.d0)
+
+    ! in
+    integer, intent(in) :: m
+    real(dp), dimension(m), intent(in) :: r, chord, theta, Vx, Vy, pitch
+    integer, dimension(m), intent(in) :: icl, icd
+    real(dp), intent(in) :: Rhub, Rtip, rho, mu
+    integer, intent(in) :: B, iterRe
+    integer, intent(in) :: nspl, nknot, ncoef
+    integer, dimension(8, nspl), intent(in) :: splint
+    real(dp), dimension(nknot), intent(in) :: knots
+    real(dp), dimension(ncoef), intent(in) :: coefs
+    real(dp), dimension(m), intent(in) :: phi0
+    real(dp), intent(in) :: dphi
+    logical, intent(in) :: useCd, hubLoss, tipLoss, wakerotation
+    !f2py logical, optional, intent(in) :: useCd = 1, hubLoss = 1, tipLoss = 1, wakerotation = 1
+
+    ! out
+    real(dp), dimension(m), intent(out) :: phi, a, ap, cl, cd, alpha, W, Re, Np, Tp
+    integer, dimension(m), intent(out) :: info
+
+    ! local
+    real(dp), parameter :: pi = 3.1415926535897932_dp, epsilon = 1e-6_dp
+    real(dp) :: xa, xb, fa, fb, fneg_lower, fneg_upper, fzero, cphi, sphi, q
+    real(dp) :: lower, upper
+    logical :: warm
+    integer :: i
+
+
+    do i = 1, m
+
+        phi(i) = 0.0_dp
+        a(i) = 0.0_dp
+        ap(i) = 0.0_dp
+        cl(i) = 0.0_dp
+        cd(i) = 0.0_dp
+        alpha(i) = 0.0_dp
+        W(i) = 0.0_dp
+        Re(i) = 0.0_dp
+        Np(i) = 0.0_dp
+        Tp(i) = 0.0_dp
+        info(i) = 0
+
+        if (Vx(i) == 0.0_dp .or. Vy(i) == 0.0_dp) cycle
+
+        ! warm start: narrow bracket around the previous solution
+        warm = .false.
+        lower = 0.0_dp
+        upper = 0.0_dp
+        if (phi0(i) >= epsilon .and. phi0(i) <= pi/2) then
+            lower = epsilon
+            upper = pi/2
+        else if (phi0(i) >= -pi/4 .and. phi0(i) <= -epsilon) then
+            lower = -pi/4
+            upper = -epsilon
+        else if (phi0(i) > pi/2 .and. phi0(i) <= pi - epsilon) then
+            lower = pi/2
+            upper = pi - epsilon
+        end if
+
+        if (lower /= upper) then
+            xa = max(lower, phi0(i) - dphi)
+            xb = min(upper, phi0(i) + dphi)
+            call bemResidual(xa, r(i), chord(i), theta(i), Vx(i), Vy(i), pitch(i), icl(i), icd(i), &
+                Rhub, Rtip, B, rho, mu, iterRe, nspl, splint, nknot, knots, ncoef, coefs, &
+                useCd, hubLoss, tipLoss, wakerotation, fa, a(i), ap(i), cl(i), cd(i))
+            call bemResidual(xb, r(i), chord(i), theta(i), Vx(i), Vy(i), pitch(i), icl(i), icd(i), &
+                Rhub, Rtip, B, rho, mu, iterRe, nspl, splint, nknot, knots, ncoef, coefs, &
+                useCd, hubLoss, tipLoss, wakerotation, fb, a(i), ap(i), cl(i), cd(i))
+            warm = fa*fb <= 0
+        end if
+
+        ! set standard limits
+        if (.not. warm) then
+            xa = epsilon
+            xb = pi/2
+            call bemResidual(xa, r(i), chord(i), theta(i), Vx(i), Vy(i), pitch(i), icl(i), icd(i), &
+                Rhub, Rtip, B, rho, mu, iterRe, nspl, splint, nknot, knots, ncoef, coefs, &
+                useCd, hubLoss, tipLoss, wakerotation, fa, a(i), ap(i), cl(i), cd(i))
+            call bemResidual(xb, r(i), chord(i), theta(i), Vx(i), Vy(i), pitch(i), icl(i), icd(i), &
+                Rhub, Rtip, B, rho, mu, iterRe, nspl, splint, nknot, knots, ncoef, coefs, &
+                useCd, hubLoss, tipLoss, wakerotation, fb, a(i), ap(i), cl(i), cd(i))
+        end if
+
+        if (.not. warm .and. fa*fb > 0) then  ! an uncommon but possible case
+
+            call bemResidual(-pi/4, r(i), chord(i), theta(i), Vx(i), Vy(i), pitch(i), icl(i), icd(i), &
+                Rhub, Rtip, B, rho, mu, iterRe, nspl, splint, nknot, knots, ncoef, coefs, &
+                useCd, hubLoss, tipLoss, wakerotation, fneg_lower, a(i), ap(i), cl(i), cd(i))
+            call bemResidual(-epsilon, r(i), chord(i), theta(i), Vx(i), Vy(i), pitch(i), icl(i), icd(i), &
+                Rhub, Rtip, B, rho, mu, iterRe, nspl, splint, nknot, knots, ncoef, coefs, &
+                useCd, hubLoss, tipLoss, wakerotation, fneg_upper, a(i), ap(i), cl(i), cd(i))
+
+            if (fneg_lower < 0 .and. fneg_upper > 0) then
+                xa = -pi/4
+                xb = -epsilon
+                fa = fneg_lower
+                fb = fneg_upper
+            else
+                xa = pi/2
+                xb = pi - epsilon
+                fa = fb
+                call bemResidual(xb, r(i), chord(i), theta(i), Vx(i), Vy(i), pitch(i), icl(i), icd(i), &
+                    Rhub, Rtip, B, rho, mu, iterRe, nspl, splint, nknot, knots, ncoef, coefs, &
+                    useCd, hubLoss, tipLoss, wakerotation, fb, a(i), ap(i), cl(i), cd(i))
+            end if
+
+        end if
+
+        call brentPhi(xa, xb, fa, fb, r(i), chord(i), theta(i), Vx(i), Vy(i), pitch(i), icl(i), icd(i), &
+            Rhub, Rtip, B, rho, mu, iterRe, nspl, splint, nknot, knots, ncoef, coefs, &
+            useCd, hubLoss, tipLoss, wakerotation, phi(i), info(i))
+
+        if (info(i) /= 0) phi(i) = 0.0_dp
+
+        ! loads at the converged inflow angle (CCBlade.__loads)
+        call bemResidual(phi(i), r(i), chord(i), theta(i), Vx(i), Vy(i), pitch(i), icl(i), icd(i), &
+            Rhub, Rtip, B, rho, mu, iterRe, nspl, splint, nknot, knots, ncoef, coefs, &
+            useCd, hubLoss, tipLoss, wakerotation, fzero, a(i), ap(i), cl(i), cd(i))
+        call relativeWind(phi(i), a(i), ap(i), Vx(i), Vy(i), pitch(i), chord(i), theta(i), &
+            rho, mu, alpha(i), W(i), Re(i))
+
+        cphi = cos(phi(i))
+        sphi = sin(phi(i))
+        q = 0.5_dp*rho*W(i)**2
+        Np(i) = (cl(i)*cphi + cd(i)*sphi)*q*chord(i)
+        Tp(i) = (cl(i)*sphi - cd(i)*cphi)*q*chord(i)
+
+    end do
+
+end subroutine solvePhi
+
+
+
+
+subroutine brentPhi(xa, xb, fa, fb, r, chord, theta, Vx, Vy, pitch, icl, icd, &
+    Rhub, Rtip, B, rho, mu, iterRe, nspl, splint, nknot, knots, ncoef, coefs, &
+    useCd, hubLoss, tipLoss, wakerotation, x, info)
+
+    ! Brent's method on the BEM residual, a translation of scipy.optimize.brentq
+    ! (xtol = 2e-12, rtol = 4*eps, maxiter = 100) given the residuals fa, fb at the bracket ends
+
+    implicit none
+    !f2py threadsafe
+
+    integer, parameter :: dp = kind(0.d0)
+
+    ! in
+    real(dp), intent(in) :: xa, xb, fa, fb
+    real(dp), intent(in) :: r, chord, theta, Vx, Vy, pitch
+    integer, intent(in) :: icl, icd
+    real(dp), intent(in) :: Rhub, Rtip, rho, mu
+    integer, intent(in) :: B, iterRe
+    integer, intent(in) :: nspl, nknot, ncoef
+    integer, dimension(8, nspl), intent(in) :: splint
+    real(dp), dimension(nknot), intent(in) :: knots
+    real(dp), dimension(ncoef), intent(in) :: coefs
+    logical, intent(in) :: useCd, hubLoss, tipLoss, wakerotation
+    !f2py logical, optional, intent(in) :: useCd = 1, hubLoss = 1, tipLoss = 1, wakerotation = 1
+
+    ! out
+    real(dp), intent(out) :: x
+    integer, intent(out) :: info
+
+    ! local
+    real(dp), parameter :: xtol = 2e-12_dp, rtol = 4*epsilon(1.0_dp)
+    real(dp) :: xpre, xcur, xblk, fpre, fcur, fblk, spre, scur, sbis, delta, stry, dpre, dblk
+    real(dp) :: a, ap, cl, cd
+    integer :: i
+
+
+    xpre = xa
+    xcur = xb
+    fpre = fa
+    fcur = fb
+    xblk = 0.0_dp
+    fblk = 0.0_dp
+    spre = 0.0_dp
+    scur = 0.0_dp
+    info = 0
+    x = 0.0_dp
+
+    ! NaN residual or no sign change
+    if (fpre /= fpre .or. fcur /= fcur) then
+        info = 1
+        return
+    end if
+    if (fpre == 0) then
+        x = xpre
+        return
+    end if
+    if (fcur == 0) then
+        x = xcur
+        return
+    end if
+    if ((sign(1.0_dp, fpre) < 0) .eqv. (sign(1.0_dp, fcur) < 0)) then
+        info = 1
+        return
+    end if
+
+    do i = 1, 100
+
+        if (fpre /= 0 .and. fcur /= 0 .and. ((sign(1.0_dp, fpre) < 0) .neqv. (sign(1.0_dp, fcur) < 0))) then
+            xblk = xpre
+            fblk = fpre
+            spre = xcur - xpre
+            scur = xcur - xpre
+        end if
+        if (abs(fblk) < abs(fcur)) then
+            xpre = xcur
+            xcur = xblk
+            xblk = xpre
+
+            fpre = fcur
+            fcur = fblk
+            fblk = fpre
+        end if
+
+        delta = (xtol + rtol*abs(xcur))/2
+        sbis = (xblk - xcur)/2
+        if (fcur == 0 .or. abs(sbis) < delta) then
+            x = xcur
+            return
+        end if
+
+        if (abs(spre) > delta .and. abs(fcur) < abs(fpre)) then
+            if (xpre == xblk) then
+                ! interpolate
+                stry = -fcur*(xcur - xpre)/(fcur - fpre)
+            else
+                ! extrapolate
+                dpre = (fpre - fcur)/(xpre - xcur)
+                dblk = (fblk - fcur)/(xblk - xcur)
+                stry = -fcur*(fblk*dblk - fpre*dpre)/(dblk*dpre*(fblk - fpre))
+            end if
+            if (2*abs(stry) < min(abs(spre), 3*abs(sbis) - delta)) then
+                ! good short step
+                spre = scur
+                scur = stry
+            else
+                ! bisect
+                spre = sbis
+                scur = sbis
+            end if
+        else
+            ! bisect
+            spre = sbis
+            scur = sbis
+        end if
+
+        xpre = xcur
+        fpre = fcur
+        if (abs(scur) > delta) then
+            xcur = xcur + scur
+        else if (sbis > 0) then
+            xcur = xcur + delta
+        else
+            xcur = xcur - delta
+        end if
+
+        call bemResidual(xcur, r, chord, theta, Vx, Vy, pitch, icl, icd, &
+            Rhub, Rtip, B, rho, mu, iterRe, nspl, splint, nknot, knots, ncoef, coefs, &
+            useCd, hubLoss, tipLoss, wakerotation, fcur, a, ap, cl, cd)
+
+        if (fcur /= fcur) then
+            info = 1
+            return
+        end if
+
+    end do
+
+    ! iteration limit reached
+    x = xcur
+
+end subroutine brentPhi
+
+
+
+
+subroutine inductionFactorsArray_dv(m, r, rd, chord, chordd, Rhub, Rhubd, Rtip, Rtipd, &
+    phi, phid, cl, cld, cd, cdd, B, Vx, Vxd, Vy, Vyd, &
+    useCd, hubLoss, tipLoss, wakerotation, fzero, fzerod, a, ad, ap, apd, nbdirs)
+
+    ! INDUCTIONFACTORS_DV at m sections in one call.  Column i of each seed
+    ! array holds the nbdirs directional derivatives of section i.
+
+    implicit none
+    !f2py threadsafe
+
+    integer, parameter :: dp = kind(0.d0)
+
+    ! in
+    integer, intent(in) :: m, B, nbdirs
+    real(dp), dimension(m), intent(in) :: r, chord, phi, cl, cd, Vx, Vy
+    real(dp), intent(in) :: Rhub, Rtip
+    real(dp), dimension(nbdirs, m), intent(in) :: rd, chordd, Rhubd, Rtipd, phid, cld, cdd, Vxd, Vyd
+    logical, intent(in) :: useCd, hubLoss, tipLoss, wakerotation
+    !f2py logical, optional, intent(in) :: useCd = 1, hubLoss = 1, tipLoss = 1, wakerotation = 1
+
+    ! out
+    real(dp), dimension(m), intent(out) :: fzero, a, ap
+    real(dp), dimension(nbdirs, m), intent(out) :: fzerod, ad, apd
+
+    ! local
+    integer :: i
+
+
+    do i = 1, m
+        call INDUCTIONFACTORS_DV(r(i), rd(:, i), chord(i), chordd(:, i), Rhub, Rhubd(:, i), &
+            Rtip, Rtipd(:, i), phi(i), phid(:, i), cl(i), cld(:, i), cd(i), cdd(:, i), B, &
+            Vx(i), Vxd(:, i), Vy(i), Vyd(:, i), useCd, hubLoss, tipLoss, wakerotation, &
+            fzero(i), fzerod(:, i), a(i), ad(:, i), ap(i), apd(:, i), nbdirs)
+    end do
+
+end subroutine inductionFactorsArray_dv
+
+
+
+
+subroutine relativeWindArray_dv(m, phi, phid, a, ad, ap, apd, Vx, Vxd, Vy, Vyd, &
+    pitch, pitchd, chord, chordd, theta, thetad, rho, mu, alpha, alphad, W, Wd, Re, Red, nbdirs)
+
+    ! RELATIVEWIND_DV at m sections in one call (seeds as in inductionFactorsArray_dv)
+
+    implicit none
+    !f2py threadsafe
+
+    integer, parameter :: dp = kind(0.d0)
+
+    ! in
+    integer, intent(in) :: m, nbdirs
+    real(dp), dimension(m), intent(in) :: phi, a, ap, Vx, Vy, pitch, chord, theta
+    real(dp), dimension(nbdirs, m), intent(in) :: phid, ad, apd, Vxd, Vyd, pitchd, chordd, thetad
+    real(dp), intent(in) :: rho, mu
+
+    ! out
+    real(dp), dimension(m), intent(out) :: alpha, W, Re
+    real(dp), dimension(nbdirs, m), intent(out) :: alphad, Wd, Red
+
+    ! local
+    integer :: i
+
+
+    do i = 1, m
+        call RELATIVEWIND_DV(phi(i), phid(:, i), a(i), ad(:, i), ap(i), apd(:, i), &
+            Vx(i), Vxd(:, i), Vy(i), Vyd(:, i), pitch(i), pitchd(:, i), chord(i), chordd(:, i), &
+            theta(i), thetad(:, i), rho, mu, alpha(i), alphad(:, i), W(i), Wd(:, i), Re(i), Red(:, i), nbdirs)
+    end do
+
+end subroutine relativeWindArray_dv
+
+
+
+
+
+subroutine windComponents_bv(n, r, rb, precurve, precurveb, presweep, presweepb, &
+    precone, preconeb, yaw, yawb, tilt, tiltb, azimuth, azimuthb, &
+    Uinf, Uinfb, OmegaRPM, OmegaRPMb, hubHt, hubHtb, shearExp, shearExpb, Vxb, Vyb, nbdirs)
+
+    ! reverse mode of windComponents (by hand, on top of DEFINECURVATURE_BV).
+    ! Vxb, Vyb hold nbdirs adjoints of Vx, Vy and the input adjoints are returned.
+    ! Costs O(n) per direction, whereas WINDCOMPONENTS_DV needs 3n+8 directions
+    ! for the full Jacobian.
+
+    implicit none
+    !f2py threadsafe
+
+    integer, parameter :: dp = kind(0.d0)
+
+    ! in
+    integer, intent(in) :: n, nbdirs
+    real(dp), dimension(n), intent(in) :: r, precurve, presweep
+    real(dp), intent(in) :: precone, yaw, tilt, azimuth, Uinf, OmegaRPM, hubHt, shearExp
+    real(dp), dimension(nbdirs, n), intent(in) :: Vxb, Vyb
+
+    ! out
+    real(dp), dimension(nbdirs, n), intent(out) :: rb, precurveb, presweepb
+    real(dp), dimension(nbdirs), intent(out) :: preconeb, yawb, tiltb, azimuthb, &
+        Uinfb, OmegaRPMb, hubHtb, shearExpb
+
+    ! local
+    real(dp) :: sy, cy, st, ct, sa, ca, pi, Omega, A, B
+    real(dp) :: syb, cyb, stb, ctb, sab, cab, Omegab, Ab
+    real(dp), dimension(n) :: cone, sc, cc, x_az, y_az, z_az, sint
+    real(dp), dimension(n) :: heightFromHub, pwx, pwr, V, dpwr, lpwr
+    real(dp), dimension(n) :: Vb, scb, ccb, hb
+    real(dp), dimension(nbdirs, n) :: x_azb, y_azb, z_azb, x_azh, coneb, sb
+    integer :: nd
+
+
+    ! forward sweep (see windComponents)
+    sy = sin(yaw)
+    cy = cos(yaw)
+    st = sin(tilt)
+    ct = cos(tilt)
+    sa = sin(azimuth)
+    ca = cos(azimuth)
+    pi = 3.1415926535897932_dp
+    Omega = OmegaRPM * pi/30.0_dp
+
+    call defineCurvature(n, r, precurve, presweep, precone, x_az, y_az, z_az, cone, sint)
+    sc = sin(cone)
+    cc = cos(cone)
+
+    heightFromHub = (y_az*sa + z_az*ca)*ct - x_az*st
+    pwx = 1 + heightFromHub/hubHt
+    pwr = pwx**shearExp
+    V = Uinf*pwr
+
+    A = cy*st*ca + sy*sa
+    B = cy*st*sa - sy*ca
+
+    ! derivatives of the power law (same branches as WINDCOMPONENTS_DV)
+    where (pwx .le. 0.0 .and. (shearExp .eq. 0.0 .or. shearExp .ne. int(shearExp)))
+        dpwr = 0.0_dp
+        lpwr = 0.0_dp
+    elsewhere (pwx .le. 0.0)
+        dpwr = shearExp*pwx**(shearExp-1)
+        lpwr = 0.0_dp
+    elsewhere
+        dpwr = shearExp*pwx**(shearExp-1)
+        lpwr = pwr*log(pwx)
+    end where
+
+    ! reverse sweep
+    do nd = 1, nbdirs
+
+        ! Vx = V*(A*sc + cy*ct*cc) - Omega*y_az*sc,  Vy = V*B + Omega*z_az
+        Omegab = sum(z_az*Vyb(nd, :)) - sum(y_az*sc*Vxb(nd, :))
+        y_azb(nd, :) = -(Omega*sc*Vxb(nd, :))
+        z_azb(nd, :) = Omega*Vyb(nd, :)
+        scb = (V*A - Omega*y_az)*Vxb(nd, :)
+        ccb = V*cy*ct*Vxb(nd, :)
+        Vb = (A*sc + cy*ct*cc)*Vxb(nd, :) + B*Vyb(nd, :)
+
+        Ab = sum(V*sc*Vxb(nd, :))
+        cyb = sum(V*ct*cc*Vxb(nd, :)) + st*ca*Ab + st*sa*sum(V*Vyb(nd, :))
+        ctb = sum(V*cy*cc*Vxb(nd, :))
+        stb = cy*ca*Ab + cy*sa*sum(V*Vyb(nd, :))
+        syb = sa*Ab - ca*sum(V*Vyb(nd, :))
+        sab = sy*Ab + cy*st*sum(V*Vyb(nd, :))
+        cab = cy*st*Ab - sy*sum(V*Vyb(nd, :))
+
+        ! V = Uinf*(1 + heightFromHub/hubHt)**shearExp
+        Uinfb(nd) = sum(pwr*Vb)
+        shearExpb(nd) = Uinf*sum(lpwr*Vb)
+        hb = Uinf*dpwr*Vb/hubHt
+        hubHtb(nd) = -(sum(heightFromHub*hb)/hubHt)
+
+        ! heightFromHub = (y_az*sa + z_az*ca)*ct - x_az*st
+        x_azh(nd, :) = -(st*hb)
+        y_azb(nd, :) = y_azb(nd, :) + sa*ct*hb
+        z_azb(nd, :) = z_azb(nd, :) + ca*ct*hb
+        sab = sab + ct*sum(y_az*hb)
+        cab = cab + ct*sum(z_az*hb)
+        ctb = ctb + sum((y_az*sa + z_az*ca)*hb)
+        stb = stb - sum(x_az*hb)
+
+        coneb(nd, :) = cc*scb - sc*ccb
+
+        yawb(nd) = cy*syb - sy*cyb
+        tiltb(nd) = ct*stb - st*ctb
+        azimuthb(nd) = ca*sab - sa*cab
+        OmegaRPMb(nd) = pi/30.0_dp*Omegab
+
+    end do
+
+    ! cone and z_az through the curvature (x_azb is only used internally there)
+    sb = 0.0_dp
+    call DEFINECURVATURE_BV(n, r, rb, precurve, precurveb, presweep, presweepb, &
+        precone, preconeb, x_az, x_azb, y_az, z_az, z_azb, cone, coneb, sint, sb, nbdirs)
+
+    ! direct dependence on x_az and y_az = presweep
+    do nd = 1, nbdirs
+        rb(nd, :) = rb(nd, :) - sin(precone)*x_azh(nd, :)
+        precurveb(nd, :) = precurveb(nd, :) + cos(precone)*x_azh(nd, :)
+        preconeb(nd) = preconeb(nd) - sum((r*cos(precone) + precurve*sin(precone))*x_azh(nd, :))
+        presweepb(nd, :) = presweepb(nd, :) + y_azb(nd, :)
+    end do
+
+end subroutine windComponents_bv
+
+
+
+
 !        Generated by TAPENADE     (INRIA, Ecuador team)
 !  Tapenade 3.16 (develop) -  9 Apr 2021 17:40
 !
@@ -375,6 +1481,7 @@ SUBROUTINE INDUCTIONFACTORS_DV(r, rd, chord, chordd, rhub, rhubd, rtip, &
 & rtipd, phi, phid, cl, cld, cd, cdd, b, vx, vxd, vy, vyd, usecd, &
 & hubloss, tiploss, wakerotation, fzero, fzerod, a, ad, ap, apd, nbdirs)
   IMPLICIT NONE
+  !F2PY THREADSAFE
   INTRINSIC KIND
   INTEGER, PARAMETER :: dp=KIND(0.d0)
 ! in
@@ -628,6 +1735,7 @@ SUBROUTINE RELATIVEWIND_DV(phi, phid, a, ad, ap, apd, vx, vxd, vy, vyd, &
 & pitch, pitchd, chord, chordd, theta, thetad, rho, mu, alpha, alphad, w&
 & , wd, re, red, nbdirs)
   IMPLICIT NONE
+  !F2PY THREADSAFE
   INTRINSIC KIND
   INTEGER, PARAMETER :: dp=KIND(0.d0)
 ! in
@@ -723,6 +1831,7 @@ SUBROUTINE WINDCOMPONENTS_DV(n, r, rd, precurve, precurved, presweep, &
 & azimuthd, uinf, uinfd, omegarpm, omegarpmd, hubht, hubhtd, shearexp, &
 & shearexpd, vx, vxd, vy, vyd, nbdirs)
   IMPLICIT NONE
+  !F2PY THREADSAFE
   INTRINSIC KIND
   INTEGER, PARAMETER :: dp=KIND(0.d0)
 ! in
@@ -845,6 +1954,7 @@ SUBROUTINE DEFINECURVATURE_DV(n, r, rd, precurve, precurved, presweep, &
 & presweepd, precone, preconed, x_az, x_azd, y_az, y_azd, z_az, z_azd, &
 & cone, coned, s, nbdirs)
   IMPLICIT NONE
+  !F2PY THREADSAFE
   INTRINSIC KIND
   INTEGER, PARAMETER :: dp=KIND(0.d0)
 ! in
@@ -957,6 +2067,7 @@ SUBROUTINE THRUSTTORQUE_BV(n, np, npb, tp, tpb, r, rb, precurve, &
 & rtipb, precurvetip, precurvetipb, presweeptip, presweeptipb, &
 & tb, yb, zb, qb, mb, nbdirs)
   IMPLICIT NONE
+  !F2PY THREADSAFE
   INTRINSIC KIND
   INTEGER, PARAMETER :: dp=KIND(0.d0)
 ! in
@@ -1100,6 +2211,7 @@ SUBROUTINE DEFINECURVATURE_BV(n, r, rb, precurve, precurveb, presweep, &
 & coneb, s, sb, nbdirs)
 !  Hint: nbdirsmax should be the maximum number of differentiation directions
   IMPLICIT NONE
+  !F2PY THREADSAFE
   INTEGER, PARAMETER :: dp=KIND(0.d0)
 ! in
   INTEGER, INTENT(IN) :: n, nbdirs
@@ -1224,6 +2336,7 @@ SUBROUTINE DEFINECURVATURE_DV2(n, r, rd, precurve, precurved, presweep, &
 & presweepd, precone, preconed, x_az, x_azd, y_az, y_azd, z_az, z_azd, &
 & cone, coned, s, sd, nbdirs)
   IMPLICIT NONE
+  !F2PY THREADSAFE
   INTRINSIC KIND
   INTEGER, PARAMETER :: dp=KIND(0.d0)
 ! in
@@ -1,8 +1,13 @@
+import os
+import shutil
+import tempfile
 import unittest
 from math import pi
 
 import numpy as np
-from ccblade.airfoilprep import Polar, Airfoil
+
+import ccblade.airfoilprep as airfoilprep
+from ccblade.airfoilprep import Polar, Airfoil, AirfoilFamily, AirfoilLibrary
 
 
 class TestBlend(unittest.TestCase):
@@ -737,6 +742,38 @@ class TestBlend(unittest.TestCase):
         np.testing.assert_allclose(cd3, cd_blend, atol=1e-3)
         np.testing.assert_allclose(cm3, cm_blend, atol=1e-3)
 
+    def test_get_polars(self):
+
+        p = self.polar1
+        scale = {1e6: 1.0, 2e6: 1.1, 4e6: 0.9}
+        af = Airfoil([Polar(Re, p.alpha, s * p.cl, s * p.cd, s * p.cm) for Re, s in scale.items()])
+        Re = [5e5, 1e6, 1.5e6, 2e6, 3e6, 4e6, 1e7]
+        for polar, Rei in zip(af.getPolars(Re), Re):
+            expected = af.getPolar(Rei)
+            self.assertEqual(polar.Re, expected.Re)
+            np.testing.assert_array_equal(polar.alpha, expected.alpha)
+            np.testing.assert_array_equal(polar.cl, expected.cl)
+            np.testing.assert_array_equal(polar.cd, expected.cd)
+            np.testing.assert_array_equal(polar.cm, expected.cm)
+
+        # polars outside the table are shared, and their arrays are read-only
+        self.assertIs(af.getPolar(1e7), af.polars[-1])
+        with self.assertRaises(ValueError):
+            af.getPolar(1e5).cl[0] = 0.0
+
+        # extrapolating a shared polar leaves it unchanged
+        shared = af.getPolar(1e7)
+        state = dict(vars(shared))
+        polar = shared.extrapolate(1.29)
+        self.assertEqual(vars(shared), state)
+        self.assertEqual(polar.cdmax, max(np.max(shared.cd), 1.29))
+
+        # writable inputs are copied
+        cl = np.array(p.cl)
+        polar = Polar(1e6, p.alpha, cl, p.cd, p.cm)
+        cl[0] = 10.0
+        self.assertEqual(polar.cl[0], p.cl[0])
+
 
 class Test3DStall(unittest.TestCase):
     def setUp(self):
@@ -2559,6 +2596,33 @@ class TestExtrap(unittest.TestCase):
         np.testing.assert_allclose(cd, cd_extrap, atol=1.5e-4)
         np.testing.assert_allclose(cm, cm_extrap, atol=5e-3)
 
+    def test_extrap_arrays(self):
+
+        # polars on a common grid, with and without moment coefficients, in a (n_alpha, 2, 2) array
+        scale = np.array([[1.0, 1.1], [0.9, 1.2]])
+        cl = self.polar.cl[:, np.newaxis, np.newaxis] * scale
+        cd = self.polar.cd[:, np.newaxis, np.newaxis] * scale
+        cm = self.polar.cm[:, np.newaxis, np.newaxis] * np.array([[1.0, 0.0], [0.5, 2.0]])
+
+        alpha, cl_ext, cd_ext, cm_ext = Polar.extrapolateArrays(self.polar.alpha, cl, cd, cm, 1.29)
+        self.assertEqual(cl_ext.shape, (len(alpha), 2, 2))
+        for i in range(2):
+            for j in range(2):
+                newpolar = Polar(1, self.polar.alpha, cl[:, i, j], cd[:, i, j], cm[:, i, j]).extrapolate(1.29)
+                np.testing.assert_array_equal(alpha, newpolar.alpha)
+                np.testing.assert_array_equal(cl_ext[:, i, j], newpolar.cl)
+                np.testing.assert_array_equal(cd_ext[:, i, j], newpolar.cd)
+                np.testing.assert_array_equal(cm_ext[:, i, j], newpolar.cm)
+
+        # Airfoil.extrapolate extrapolates its polars together
+        polars = [Polar(Re, self.polar.alpha, cl[:, 0, j], cd[:, 0, j], cm[:, 0, j]) for j, Re in enumerate([1e6, 2e6])]
+        af = Airfoil(polars)
+        for p, p_ext in zip(af.polars, af.extrapolate(1.29).polars):
+            newpolar = p.extrapolate(1.29)
+            self.assertEqual(p_ext.Re, p.Re)
+            np.testing.assert_array_equal(p_ext.cl, newpolar.cl)
+            np.testing.assert_array_equal(p_ext.cm, newpolar.cm)
+
 
 # class TestSpline(unittest.TestCase):
 
@@ -2595,11 +2659,234 @@ class TestExtrap(unittest.TestCase):
 #         self.assertAlmostEqual(cd, 0.0016)
 
 
+class TestPolarCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.cache_dir = airfoilprep.polar_cache_dir
+        airfoilprep.polar_cache_dir = os.path.join(self.tmp, "cache")
+
+        basepath = os.path.join(os.path.dirname(os.path.realpath(__file__)), "5MW_AFFiles")
+        self.filename = os.path.join(self.tmp, "DU25_A17.dat")
+        shutil.copy(os.path.join(basepath, "DU25_A17.dat"), self.filename)
+
+    def tearDown(self):
+        airfoilprep.polar_cache_dir = self.cache_dir
+        shutil.rmtree(self.tmp)
+
+    def test_cache(self):
+
+        grid = Airfoil.dataGridFromAerodynFile(self.filename, cache=False)
+        for k in range(2):  # write, then read the cache
+            af = Airfoil.initFromAerodynFile(self.filename)
+            self.assertEqual(af.polars[0].Re, 1e6)
+            for value, expected in zip(Airfoil.dataGridFromAerodynFile(self.filename), grid):
+                np.testing.assert_array_equal(value, expected)
+        self.assertEqual(len(os.listdir(airfoilprep.polar_cache_dir)), 2)
+
+        # editing the file invalidates (and replaces) its cache
+        with open(self.filename, "r") as f:
+            lines = f.readlines()
+        lines[4] = lines[4].replace("1.0", "2.0", 1)
+        with open(self.filename, "w") as f:
+            f.writelines(lines + ["\n"])
+        self.assertEqual(Airfoil.initFromAerodynFile(self.filename).polars[0].Re, 2e6)
+        self.assertEqual(Airfoil.dataGridFromAerodynFile(self.filename)[1][0], 2e6)
+        self.assertEqual(len(os.listdir(airfoilprep.polar_cache_dir)), 2)
+
+        # so does a new cache version
+        files = set(os.listdir(airfoilprep.polar_cache_dir))
+        version = airfoilprep._polar_cache_version
+        try:
+            airfoilprep._polar_cache_version = version + 1
+            Airfoil.dataGridFromAerodynFile(self.filename)
+        finally:
+            airfoilprep._polar_cache_version = version
+        self.assertEqual(len(os.listdir(airfoilprep.polar_cache_dir)), 2)
+        self.assertFalse(files & set(os.listdir(airfoilprep.polar_cache_dir)))
+
+        # other readers of the same file have their own entries, which are kept
+        class MyAirfoil(Airfoil):
+            pass
+
+        Airfoil.dataGridFromAerodynFile(self.filename)
+        MyAirfoil.dataGridFromAerodynFile(self.filename)
+        files = set(os.listdir(airfoilprep.polar_cache_dir))
+        self.assertEqual(len(files), 3)
+        Airfoil.dataGridFromAerodynFile(self.filename)
+        self.assertEqual(set(os.listdir(airfoilprep.polar_cache_dir)), files)
+
+
+class TestAerodynFile(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        basepath = os.path.join(os.path.dirname(os.path.realpath(__file__)), "5MW_AFFiles")
+        self.polar = Airfoil.initFromAerodynFile(os.path.join(basepath, "DU25_A17.dat"), cache=False).polars[0]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_v13(self):
+
+        p = self.polar
+        self.assertEqual(p.Re, 1e6)
+        self.assertEqual(len(p.alpha), 141)
+        np.testing.assert_array_equal(p.alpha[:2], [-180.0, -175.0])
+        np.testing.assert_array_equal([p.cl[1], p.cd[1], p.cm[1]], [0.368, 0.0324, 0.1845])
+
+        # rows with missing columns
+        filename = os.path.join(self.tmp, "bad.dat")
+        with open(filename, "w") as f:
+            f.write("header\ndescription\nline\n1 Number of airfoil tables in this file\n1.0 Re\n")
+            f.write("0.0 param\n" * 8 + "-10.0 0.1 0.01 0.0\n0.0 0.5 0.01\nEOT\n")
+        with self.assertRaises(ValueError):
+            Airfoil.initFromAerodynFile(filename, cache=False)
+
+    def test_v15(self):
+
+        # AirfoilInfo file with two tables, the second without Cm
+        p = self.polar
+        rows = [np.c_[p.alpha, p.cl, p.cd, p.cm], np.c_[p.alpha, 1.1 * p.cl, p.cd]]
+        lines = ["! ------------ AirfoilInfo v1.01.x Input File ----------------------------------", "! DU25"]
+        lines += ['"DEFAULT"     InterpOrd         ! Interpolation order', "1             NonDimArea", "0  NumCoords"]
+        lines += ["2             NumTabs           ! Number of airfoil tables in this file"]
+        for Re, table in zip([0.75, 1.5], rows):
+            lines += ["! ------------------------------------------------------------------------------"]
+            lines += [f"{Re}          Re                ! Reynolds number in millions", "0  UserProp"]
+            lines += ["False         InclUAdata        ! Is unsteady aerodynamics data included in this table?"]
+            lines += [f"{len(table)}           NumAlf            ! Number of data lines in the following table"]
+            lines += ["!    Alpha      Cl      Cd        Cm", "!    (deg)      (-)     (-)       (-)"]
+            lines += ["  ".join(f"{x:.6f}" for x in row) for row in table]
+        filename = os.path.join(self.tmp, "DU25_v15.dat")
+        with open(filename, "w") as f:
+            f.write("\n".join(lines) + "\n")
+
+        af = Airfoil.initFromAerodynFile(filename, cache=False)
+        self.assertEqual([q.Re for q in af.polars], [0.75e6, 1.5e6])
+        np.testing.assert_array_equal(af.polars[0].alpha, p.alpha)
+        np.testing.assert_allclose(af.polars[0].cl, p.cl, atol=1e-6)
+        np.testing.assert_allclose(af.polars[0].cm, p.cm, atol=1e-6)
+        np.testing.assert_allclose(af.polars[1].cl, 1.1 * p.cl, atol=1e-6)
+        np.testing.assert_array_equal(af.polars[1].cm, 0.0)
+
+    def test_write(self):
+
+        p = self.polar
+        af = Airfoil([p, Polar(3e6, p.alpha[::2], 1.1 * p.cl[::2], p.cd[::2], p.cm[::2])])
+        filenames = [os.path.join(self.tmp, f"out_v{version}.dat") for version in (13, 15)]
+        for version, filename in zip((13, 15), filenames):
+            Airfoil.writeAerodynFiles([af], [filename], version)
+
+        for filename in filenames:
+            af2 = Airfoil.initFromAerodynFile(filename, cache=False)
+            self.assertEqual([q.Re for q in af2.polars], [1e6, 3e6])
+            for q, q2 in zip(af.interpToCommonAlpha().polars, af2.polars):
+                np.testing.assert_array_equal(q2.alpha, q.alpha)
+                np.testing.assert_allclose(q2.cl, q.cl, rtol=0, atol=5e-7)
+                np.testing.assert_allclose(q2.cd, q.cd, rtol=0, atol=5e-7)
+                np.testing.assert_allclose(q2.cm, q.cm, rtol=0, atol=5e-7)
+
+        # unsteady aero parameters of the v13 file
+        with open(filenames[0]) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(int(lines[3].split()[0]), 2)
+        param = [float(line.split()[0]) for line in lines[5:13]]
+        np.testing.assert_allclose(param, p.unsteadyparam(), rtol=0, atol=5e-7)
+
+        with self.assertRaises(ValueError):
+            af.writeToAerodynFile(filenames[0], version=14)
+
+
+class TestAirfoilFamily(unittest.TestCase):
+    def setUp(self):
+
+        # DU airfoils of the NREL 5MW, with a second (scaled) polar at Re = 3e6
+        basepath = os.path.join(os.path.dirname(os.path.realpath(__file__)), "5MW_AFFiles")
+        self.thickness = [0.40, 0.21, 0.30, 0.25, 0.35]
+        self.airfoils = []
+        for t in self.thickness:
+            p = Airfoil.initFromAerodynFile(os.path.join(basepath, f"DU{int(100 * t)}_A17.dat")).polars[0]
+            self.airfoils.append(Airfoil([p, Polar(3e6, p.alpha, 1.1 * p.cl, 0.9 * p.cd, p.cm)]))
+        self.family = AirfoilFamily(self.airfoils, self.thickness, Re=[1e6, 2e6, 3e6])
+
+    def test_family(self):
+
+        family = self.family
+        thickness = np.array([0.18, 0.21, 0.27, 0.3, 0.33, 0.45])
+        cl, cd, cm = family.evaluate(thickness)
+        self.assertEqual(cl.shape, (len(thickness), len(family.alpha), 3))
+
+        # Airfoil.blend of the neighbouring reference airfoils on the common grid
+        af25, af30 = (self.airfoils[self.thickness.index(t)].interpToCommonAlpha(family.alpha) for t in (0.25, 0.3))
+        af = af25.blend(af30, (0.27 - 0.25) / (0.3 - 0.25))
+        for j, p in enumerate(af.getPolars(family.Re)):
+            np.testing.assert_allclose(cl[2, :, j], p.cl, rtol=0, atol=1e-14)
+            np.testing.assert_allclose(cd[2, :, j], p.cd, rtol=0, atol=1e-14)
+            np.testing.assert_allclose(cm[2, :, j], p.cm, rtol=0, atol=1e-14)
+
+        # reference thicknesses, and clipped outside
+        for k, t in enumerate(family.thickness):
+            af = self.airfoils[self.thickness.index(t)].interpToCommonAlpha(family.alpha)
+            np.testing.assert_array_equal(family.cl[k, :, 1], af.getPolar(2e6).cl)
+        np.testing.assert_array_equal(cl[1], family.cl[0])
+        np.testing.assert_array_equal(cl[3], family.cl[2])
+        np.testing.assert_array_equal(cl[0], family.cl[0])
+        np.testing.assert_array_equal(cl[-1], family.cl[-1])
+
+
+class TestAirfoilLibrary(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.basepath = os.path.join(os.path.dirname(os.path.realpath(__file__)), "5MW_AFFiles")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_library(self):
+
+        archive = os.path.join(self.tmp, "5MW.aflib")
+        library = AirfoilLibrary.build(self.basepath, archive, nproc=2)
+        self.assertEqual(len(library), 8)
+        self.assertIn("DU25_A17", library)
+
+        for name, filename in zip(library.names, library.files):
+            grid = Airfoil.initFromAerodynFile(filename, cache=False).createDataGrid()
+            for x, y in zip(library.dataGrid(name), grid):
+                np.testing.assert_array_equal(x, y)
+                self.assertFalse(x.flags.writeable)
+
+        # serial build, reopened archive
+        AirfoilLibrary.build([os.path.join(self.basepath, "DU25_A17.dat")], archive, nproc=1)
+        library = AirfoilLibrary(archive)
+        self.assertEqual(library.names, ["DU25_A17"])
+        p = library.getAirfoil("DU25_A17").polars[0]
+        np.testing.assert_array_equal([p.cl[1], p.cd[1], p.cm[1]], [0.368, 0.0324, 0.1845])
+
+    def test_pipeline(self):
+
+        filename = os.path.join(self.basepath, "DU25_A17.dat")
+        archive = os.path.join(self.tmp, "3D.aflib")
+        correction3D = dict(r_over_R=0.5, chord_over_r=0.15, tsr=5.0)
+        library = AirfoilLibrary.build([filename], archive, correction3D=correction3D)
+
+        af = Airfoil.initFromAerodynFile(filename, cache=False).correction3D(**correction3D)
+        for x, y in zip(library.dataGrid("DU25_A17"), af.createDataGrid()):
+            np.testing.assert_array_equal(x, y)
+
+        with open(filename) as f, open(archive, "w") as g:
+            g.write(f.read())
+        with self.assertRaises(ValueError):
+            AirfoilLibrary(archive)
+
+
 def suite():
     suite = unittest.TestSuite()
     suite.addTest(unittest.makeSuite(TestBlend))
     suite.addTest(unittest.makeSuite(Test3DStall))
     suite.addTest(unittest.makeSuite(TestExtrap))
+    suite.addTest(unittest.makeSuite(TestPolarCache))
+    suite.addTest(unittest.makeSuite(TestAerodynFile))
+    suite.addTest(unittest.makeSuite(TestAirfoilFamily))
+    suite.addTest(unittest.makeSuite(TestAirfoilLibrary))
     return suite
 
 
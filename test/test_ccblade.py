@@ -13,11 +13,17 @@ limitations under the License.
 """
 
 import math
+import tempfile
 import unittest
 from os import path
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
-from ccblade.ccblade import CCBlade, CCAirfoil
+from scipy.interpolate import RectBivariateSpline
+
+import ccblade._bem as _bem
+from ccblade.ccblade import CCBlade, CCAirfoil, CCAirfoilSet, CCAirfoilFlap, _packSplines, airfoilOperatingPoints
+from ccblade.airfoilprep import Airfoil, AirfoilLibrary
 
 
 class TestNREL5MW(unittest.TestCase):
@@ -122,7 +128,9 @@ class TestNREL5MW(unittest.TestCase):
         yaw = 0.0
 
         # create CCBlade object
-        self.rotor = CCBlade(r, chord, theta, af, Rhub, Rtip, B, rho, mu, precone, tilt, yaw, shearExp=0.2, hubHt=90.0)
+        self.args = (r, chord, theta, af, Rhub, Rtip, B, rho, mu, precone, tilt, yaw)
+        self.kwargs = dict(shearExp=0.2, hubHt=90.0)
+        self.rotor = CCBlade(*self.args, **self.kwargs)
 
     def test_thrust_torque(self):
 
@@ -285,6 +293,497 @@ class TestNREL5MW(unittest.TestCase):
         np.testing.assert_allclose(P[idx] / 1e6, Pref[idx] / 1e3, atol=0.2)  # within 0.2 of 1MW
         np.testing.assert_allclose(T[idx] / 1e6, Tref[idx] / 1e3, atol=0.15)
 
+    def test_vectorized_solver(self):
+
+        rotor = CCBlade(*self.args, solver="vectorized", **self.kwargs)
+
+        for azimuth in [0.0, 90.0, 180.0, 270.0]:
+            loads, _ = self.rotor.distributedAeroLoads(10.0, 11.431, 0.0, azimuth)
+            loads_vec, _ = rotor.distributedAeroLoads(10.0, 11.431, 0.0, azimuth)
+            for key in ("Np", "Tp", "a", "ap", "alpha", "W"):
+                np.testing.assert_allclose(loads_vec[key], loads[key], rtol=1e-9, atol=1e-9)
+
+        Uinf = np.array([4.0, 11.0, 20.0])
+        Omega = np.array([7.183, 11.890, 12.1])
+        pitch = np.array([0.0, 0.0, 17.47])
+
+        outputs, _ = self.rotor.evaluate(Uinf, Omega, pitch)
+        outputs_vec, _ = rotor.evaluate(Uinf, Omega, pitch)
+        for key in ("P", "T", "Q", "Mb"):
+            np.testing.assert_allclose(outputs_vec[key], outputs[key], rtol=1e-9)
+
+        # the vectorized phi also feeds the derivative path
+        outputs_vec, derivs_vec = CCBlade(*self.args, solver="vectorized", derivatives=True, **self.kwargs).evaluate(
+            Uinf, Omega, pitch
+        )
+        outputs, derivs = CCBlade(*self.args, derivatives=True, **self.kwargs).evaluate(Uinf, Omega, pitch)
+        np.testing.assert_allclose(outputs_vec["P"], outputs["P"], rtol=1e-9)
+        np.testing.assert_allclose(derivs_vec["dP"]["dr"], derivs["dP"]["dr"], rtol=1e-6, atol=1e-6)
+
+        with self.assertRaises(ValueError):
+            CCBlade(*self.args, solver="newton", **self.kwargs)
+
+    def test_vectorized_evaluate(self):
+
+        rotor = CCBlade(*self.args, solver="vectorized", **self.kwargs)
+
+        # includes a parked condition
+        Uinf = np.array([4.0, 8.0, 11.0, 16.0, 25.0])
+        Omega = np.array([0.0, 9.156, 11.890, 12.1, 12.1])
+        pitch = np.array([90.0, 0.0, 0.0, 12.06, 23.47])
+
+        outputs, _ = self.rotor.evaluate(Uinf, Omega, pitch, coefficients=True)
+        outputs_vec, _ = rotor.evaluate(Uinf, Omega, pitch, coefficients=True)
+        for key in outputs:
+            np.testing.assert_allclose(outputs_vec[key], outputs[key], rtol=1e-9, atol=1e-6)
+
+    def test_fortran_solver(self):
+
+        rotor = CCBlade(*self.args, solver="fortran", **self.kwargs)
+
+        for azimuth in [0.0, 90.0, 180.0, 270.0]:
+            loads, _ = self.rotor.distributedAeroLoads(10.0, 11.431, 0.0, azimuth)
+            loads_f, _ = rotor.distributedAeroLoads(10.0, 11.431, 0.0, azimuth)
+            for key in loads:
+                np.testing.assert_allclose(loads_f[key], loads[key], rtol=1e-9, atol=1e-9)
+
+        Uinf = np.array([4.0, 8.0, 11.0, 16.0, 25.0])
+        Omega = np.array([0.0, 9.156, 11.890, 12.1, 12.1])
+        pitch = np.array([90.0, 0.0, 0.0, 12.06, 23.47])
+
+        outputs, _ = self.rotor.evaluate(Uinf, Omega, pitch)
+        outputs_f, _ = rotor.evaluate(Uinf, Omega, pitch)
+        for key in outputs:
+            np.testing.assert_allclose(outputs_f[key], outputs[key], rtol=1e-9, atol=1e-6)
+
+    def test_vectorized_derivatives(self):
+
+        # all stations in one batched pass, against the per-station derivatives
+        rotor = CCBlade(*self.args, derivatives=True, **self.kwargs)
+        for solver in ["vectorized", "fortran"]:
+            rotor_vec = CCBlade(*self.args, solver=solver, derivatives=True, **self.kwargs)
+            for Omega in [11.431, 0.0]:
+                loads, derivs = rotor.distributedAeroLoads(10.0, Omega, 2.0, 30.0)
+                loads_vec, derivs_vec = rotor_vec.distributedAeroLoads(10.0, Omega, 2.0, 30.0)
+                np.testing.assert_allclose(loads_vec["Np"], loads["Np"], rtol=1e-9, atol=1e-9)
+                for key in derivs["dNp"]:
+                    np.testing.assert_allclose(derivs_vec["dNp"][key], derivs["dNp"][key], rtol=1e-9, atol=1e-9)
+                    np.testing.assert_allclose(derivs_vec["dTp"][key], derivs["dTp"][key], rtol=1e-9, atol=1e-9)
+
+    def test_sparse_derivatives(self):
+
+        precurve = 0.01 * self.args[0] ** 2 / 10
+        kwargs = dict(self.kwargs, precurve=precurve, precurveTip=1.05 * precurve[-1], derivatives=True)
+        _, derivs = CCBlade(*self.args, **kwargs).distributedAeroLoads(10.0, 11.431, 2.0, 30.0)
+        _, derivs_sp = CCBlade(*self.args, sparse=True, **kwargs).distributedAeroLoads(10.0, 11.431, 2.0, 30.0)
+
+        for key in ["dr", "dchord", "dtheta", "dpresweep", "dprecurve"]:
+            self.assertEqual(derivs_sp["dNp"][key].format, "dia")
+            np.testing.assert_array_equal(derivs_sp["dNp"][key].toarray(), derivs["dNp"][key])
+            np.testing.assert_array_equal(derivs_sp["dTp"][key].toarray(), derivs["dTp"][key])
+        np.testing.assert_array_equal(derivs_sp["dNp"]["dRhub"], derivs["dNp"]["dRhub"])
+
+    def test_adjoint_derivatives(self):
+
+        presweep = 0.01 * self.args[0] ** 2 / 10
+        args = self.args[:11] + (5.0,)
+        kwargs = dict(self.kwargs, presweep=presweep, presweepTip=1.05 * presweep[-1], derivatives=True)
+        Uinf = np.array([5.0, 11.0, 20.0])
+        Omega = np.array([7.506, 11.890, 12.1])
+        pitch = np.array([0.0, 0.0, 17.47])
+
+        outputs, derivs = CCBlade(*args, **kwargs).evaluate(Uinf, Omega, pitch, coefficients=True)
+        outputs_adj, derivs_adj = CCBlade(*args, adjoint=True, **kwargs).evaluate(Uinf, Omega, pitch, coefficients=True)
+
+        for key in outputs:
+            np.testing.assert_allclose(outputs_adj[key], outputs[key], rtol=1e-12)
+        for name in derivs:
+            for key in derivs[name]:
+                scale = np.max(np.abs(derivs[name][key]))
+                np.testing.assert_allclose(derivs_adj[name][key], derivs[name][key], rtol=1e-10, atol=1e-10 * scale)
+
+    def test_warmstart(self):
+
+        for solver in ["brentq", "vectorized", "fortran"]:
+            rotor = CCBlade(*self.args, solver=solver, **self.kwargs)
+            rotor_warm = CCBlade(*self.args, solver=solver, warmstart=True, **self.kwargs)
+
+            for Uinf, Omega, pitch in [(8.0, 9.156, 0.0), (11.0, 11.890, 0.0), (20.0, 12.1, 17.47)]:
+                for azimuth in [0.0, 90.0, 180.0, 270.0]:
+                    loads, _ = rotor.distributedAeroLoads(Uinf, Omega, pitch, azimuth)
+                    loads_warm, _ = rotor_warm.distributedAeroLoads(Uinf, Omega, pitch, azimuth)
+                    for key in ("Np", "Tp", "a", "ap", "alpha"):
+                        np.testing.assert_allclose(loads_warm[key], loads[key], rtol=1e-8, atol=1e-8)
+
+    def test_symmetric_sectors(self):
+
+        # no tilt or yaw: mirrored sectors are skipped unless derivatives are requested
+        args = self.args[:10] + (0.0, 0.0)
+        rotor = CCBlade(*args, **self.kwargs)
+        rotor_full = CCBlade(*args, derivatives=True, **self.kwargs)
+
+        Uinf = np.array([4.0, 11.0, 20.0])
+        Omega = np.array([7.183, 11.890, 12.1])
+        pitch = np.array([0.0, 0.0, 17.47])
+
+        outputs, _ = rotor.evaluate(Uinf, Omega, pitch)
+        outputs_full, _ = rotor_full.evaluate(Uinf, Omega, pitch)
+        for key in ("P", "T", "Y", "Z", "Q", "My", "Mz", "Mb", "W"):
+            np.testing.assert_allclose(outputs[key], outputs_full[key], rtol=1e-10, atol=1e-6)
+
+    def test_parallel_evaluate(self):
+
+        rotor = CCBlade(*self.args, derivatives=True, **self.kwargs)
+
+        Uinf = np.array([4.0, 8.0, 11.0, 16.0, 20.0])
+        Omega = np.array([7.183, 9.156, 11.890, 12.1, 12.1])
+        pitch = np.array([0.0, 0.0, 0.0, 12.06, 17.47])
+
+        outputs, derivs = rotor.evaluate(Uinf, Omega, pitch, coefficients=True)
+        outputs_par, derivs_par = rotor.evaluate(Uinf, Omega, pitch, coefficients=True, nproc=2)
+
+        self.assertEqual(list(outputs_par), list(outputs))
+        for key in outputs:
+            np.testing.assert_allclose(outputs_par[key], outputs[key], rtol=1e-12)
+        for name in derivs:
+            for key in derivs[name]:
+                np.testing.assert_allclose(derivs_par[name][key], derivs[name][key], rtol=1e-12, atol=1e-12)
+
+    def test_threads(self):
+
+        Uinf = np.array([4.0, 8.0, 11.0, 16.0, 20.0])
+        Omega = np.array([7.183, 9.156, 11.890, 12.1, 12.1])
+        pitch = np.array([0.0, 0.0, 0.0, 12.06, 17.47])
+
+        # the threads share the airfoils, so the results must be identical to the serial ones
+        for solver in ["brentq", "fortran"]:
+            rotor = CCBlade(*self.args, solver=solver, **self.kwargs)
+            rotor_threads = CCBlade(*self.args, solver=solver, nthreads=3, **self.kwargs)
+
+            loads, _ = rotor.distributedAeroLoads(11.0, 11.890, 0.0, 90.0)
+            outputs, _ = rotor.evaluate(Uinf, Omega, pitch)
+            for _ in range(3):
+                loads_threads, _ = rotor_threads.distributedAeroLoads(11.0, 11.890, 0.0, 90.0)
+                for key in loads:
+                    np.testing.assert_array_equal(loads_threads[key], loads[key])
+
+                outputs_threads, _ = rotor_threads.evaluate(Uinf, Omega, pitch)
+                for key in outputs:
+                    np.testing.assert_array_equal(outputs_threads[key], outputs[key])
+
+    def test_tabulated_spline(self):
+
+        # a table with bilinear interpolation is a degree-1 spline on the grid
+        x = np.array([-1.0, 0.0, 0.5, 2.0])
+        y = np.array([1e5, 1e6, 1e7])
+        z = np.outer(x**2, [1.0, 2.0, 3.0])
+        tx = np.r_[x[0], x, x[-1]]
+        ty = np.r_[y[0], y, y[-1]]
+        splint, knots, coefs = _packSplines([(tx, ty, z.ravel(), 1, 1)])
+
+        for xi, yi in [(0.25, 1e5), (1.0, 5.5e6), (-0.5, 1e7), (3.0, 2e6)]:
+            zx = [np.interp(xi, x, z[:, j]) for j in range(len(y))]
+            zi = _bem.splinelookup(1, splint, knots, coefs, xi, yi)
+            self.assertAlmostEqual(zi, np.interp(yi, y, zx), places=12)
+
+    def test_airfoil_evaluate(self):
+
+        af = self.args[3][11]
+        rng = np.random.default_rng(0)
+        alpha = rng.uniform(-4.0, 4.0, 200)
+        Re = np.exp(rng.uniform(10.0, 18.0, 200))
+
+        # scalars in random order (the knot interval guess moves both ways) and arrays.  This is a
+        # single-Re airfoil: a spline in alpha only, with zero Re derivatives.
+        self.assertEqual(af.cl_spline.degrees[1], 0)
+        for i in range(len(alpha)):
+            cl, cd, cm = af.evaluate(alpha[i], Re[i], return_cm=True)
+            self.assertEqual(cl, af.cl_spline.ev(alpha[i], Re[i]))
+            self.assertEqual(cd, af.cd_spline.ev(alpha[i], Re[i]))
+            self.assertEqual(cm, af.cm_spline.ev(alpha[i], Re[i]))
+        cl, cd = af.evaluate(alpha.reshape(20, 10), 1e6)
+        np.testing.assert_array_equal(cl, af.cl_spline.ev(alpha, 1e6).reshape(20, 10))
+        np.testing.assert_array_equal(cd, af.cd_spline.ev(alpha, 1e6).reshape(20, 10))
+        _, _, _, dcl_dRe, _, dcd_dRe = af.evaluate_derivatives(alpha, Re)
+        np.testing.assert_array_equal(dcl_dRe, 0.0)
+        np.testing.assert_array_equal(dcd_dRe, 0.0)
+
+        # the same fit as the bivariate spline of the table duplicated on two Reynolds numbers, up
+        # to where the smoothing places its knots
+        basepath = path.join(path.dirname(path.realpath(__file__)), "5MW_AFFiles")
+        alpha, _, cl, cd, _ = Airfoil.dataGridFromAerodynFile(path.join(basepath, "NACA64_A17.dat"))
+        alpha = np.deg2rad(alpha)
+        cl2 = RectBivariateSpline(alpha, [1e1, 1e15], np.c_[cl, cl], kx=3, ky=1, s=0.1)
+        cd2 = RectBivariateSpline(alpha, [1e1, 1e15], np.c_[cd, cd], kx=3, ky=1, s=0.001)
+        np.testing.assert_allclose(af.cl_spline(alpha, [1e6]), cl2(alpha, [1e6]), rtol=0, atol=2e-4)
+        np.testing.assert_allclose(af.cd_spline(alpha, [1e6]), cd2(alpha, [1e6]), rtol=0, atol=2e-5)
+
+    def test_airfoil_evaluate_derivatives(self):
+
+        alpha = np.linspace(-180.0, 180.0, 73)
+        Re = np.array([1e5, 1e6, 5e6, 1e7])
+        cl = np.outer(np.sin(2 * np.deg2rad(alpha)), [1.0, 1.1, 1.2, 1.25])
+        cd = np.outer(1.0 - np.cos(2 * np.deg2rad(alpha)), [0.6, 0.55, 0.5, 0.48]) + 0.01
+        af = CCAirfoil(alpha, Re, cl, cd)
+
+        rng = np.random.default_rng(1)
+        alpha = rng.uniform(-3.0, 3.0, 100)
+        Re = np.exp(rng.uniform(np.log(1e5), np.log(1e7), 100))
+        values = af.evaluate_derivatives(alpha, Re)
+        expected = [
+            af.cl_spline.ev(alpha, Re),
+            af.cd_spline.ev(alpha, Re),
+            af.cl_spline.ev(alpha, Re, dx=1),
+            af.cl_spline.ev(alpha, Re, dy=1),
+            af.cd_spline.ev(alpha, Re, dx=1),
+            af.cd_spline.ev(alpha, Re, dy=1),
+        ]
+        for value, ref in zip(values, expected):
+            np.testing.assert_allclose(value, ref, rtol=1e-12, atol=1e-12 * np.max(np.abs(ref)))
+        np.testing.assert_array_equal(af.derivatives(alpha, Re), values[2:])
+
+        # scalars give floats, as evaluate does
+        scalar = af.evaluate_derivatives(alpha[0], Re[0])
+        self.assertEqual(scalar, tuple(value[0] for value in values))
+        self.assertTrue(all(type(value) is float for value in scalar + af.derivatives(alpha[0], Re[0])))
+
+    def test_operating_points(self):
+
+        af = self.args[3]
+        Re = np.linspace(1e6, 8e6, len(af))
+        margin = np.linspace(2.0, 4.0, len(af))
+        max_eff, stall = airfoilOperatingPoints(af, Re, margin)
+
+        for i in range(len(af)):
+            np.testing.assert_array_equal([x[i] for x in max_eff], af[i].max_eff(Re[i]))
+            np.testing.assert_array_equal([x[i] for x in stall], af[i].awayfromstall(Re[i], margin[i]))
+
+    def test_airfoil_cache(self):
+
+        af = self.args[3][11]
+        alpha = np.rad2deg(af.alpha)
+        cl = af.cl_spline(af.alpha, [1e6])
+        cd = af.cd_spline(af.alpha, [1e6])
+
+        af1 = CCAirfoil.initCached(alpha, [1e6], cl, cd)
+        self.assertIs(CCAirfoil.initCached(alpha.copy(), [1e6], cl.copy(), cd.copy()), af1)
+        self.assertIsNot(CCAirfoil.initCached(alpha, [1e6], cl, 2 * cd), af1)
+        cl1, cd1 = af1.evaluate(0.1, 1e6)
+        cl2, cd2 = CCAirfoil(alpha, [1e6], cl, cd).evaluate(0.1, 1e6)
+        self.assertEqual((cl1, cd1), (cl2, cd2))
+
+        # a holder of the shared airfoil cannot change what the others evaluate
+        af1.tabulate(41)
+        self.assertEqual(CCAirfoil.initCached(alpha, [1e6], cl, cd).evaluate(0.1, 1e6), (cl1, cd1))
+        with self.assertRaises(ValueError):
+            af1._coefs[0] = 0.0
+
+        # least recently used airfoils are dropped
+        cache_size = CCAirfoil.cache_size
+        try:
+            CCAirfoil.cache_size = 2
+            CCAirfoil.initCached(alpha, [1e6], cl, 3 * cd)
+            CCAirfoil.initCached(alpha, [1e6], cl, 4 * cd)
+            self.assertIsNot(CCAirfoil.initCached(alpha, [1e6], cl, cd), af1)
+        finally:
+            CCAirfoil.cache_size = cache_size
+
+    def test_airfoil_unsteady_params(self):
+
+        basepath = path.join(path.dirname(path.realpath(__file__)), "5MW_AFFiles")
+        alpha, Re, cl, cd, cm = Airfoil.dataGridFromAerodynFile(path.join(basepath, "DU25_A17.dat"))
+        cl, cd, cm = cl[:, 0], cd[:, 0], cm[:, 0]
+
+        # same coefficients as eval_unsteady, without storing them on a (possibly shared) airfoil
+        af = CCAirfoil(alpha, Re, cl, cd, cm)
+        af.eval_unsteady(alpha, cl, cd, cm)
+        af_shared = CCAirfoil.initCached(alpha, Re, cl, cd, cm)
+        unsteady = CCAirfoil.unsteady_params(alpha, cl, cd, cm)
+        self.assertEqual(unsteady.keys(), af.unsteady.keys())
+        for key in unsteady:
+            np.testing.assert_array_equal(unsteady[key], af.unsteady[key])
+        self.assertFalse(hasattr(af_shared, "unsteady"))
+
+    def test_airfoil_table(self):
+
+        alpha = np.linspace(-180.0, 180.0, 73)
+        Re = np.array([1e5, 1e6, 5e6, 1e7])
+        cl = np.outer(np.sin(2 * np.deg2rad(alpha)), [1.0, 1.1, 1.2, 1.25])
+        cd = np.outer(1.0 - np.cos(2 * np.deg2rad(alpha)), [0.6, 0.55, 0.5, 0.48]) + 0.01
+        af = CCAirfoil(alpha, Re, cl, cd)
+
+        rng = np.random.default_rng(2)
+        alpha = rng.uniform(-3.0, 3.0, 100)
+        Re = np.exp(rng.uniform(np.log(1e5), np.log(1e7), 100))
+        cl0, cd0 = af.evaluate(alpha, Re)
+
+        for order in (1, 3):
+            af_t = af.tabulate(721, 33, order=order)
+            error = af_t.table_error
+            self.assertEqual(set(error), {"cl", "cd"})
+
+            # the table reproduces the splines at the grid points
+            alpha_t = np.linspace(af.alpha[0], af.alpha[-1], 721)[300:420]
+            Re_t = np.geomspace(1e5, 1e7, 33)[np.arange(len(alpha_t)) % 33]
+            cl, cd = af_t.evaluate(alpha_t, Re_t)
+            np.testing.assert_allclose(cl, af.cl_spline.ev(alpha_t, Re_t), rtol=0, atol=1e-12)
+            np.testing.assert_allclose(cd, af.cd_spline.ev(alpha_t, Re_t), rtol=0, atol=1e-12)
+
+            # and stays within the reported error elsewhere
+            cl, cd = af_t.evaluate(alpha, Re)
+            self.assertLessEqual(np.max(np.abs(cl - cl0)), error["cl"] * (1 + 1e-9))
+            self.assertLessEqual(np.max(np.abs(cd - cd0)), error["cd"] * (1 + 1e-9))
+
+            # derivatives of the table (in log(Re)) against finite differences
+            _, _, dcl_dalpha, dcl_dRe, _, _ = af_t.evaluate_derivatives(alpha, Re)
+            h = 1e-7
+            np.testing.assert_allclose(
+                dcl_dRe, (af_t.evaluate(alpha, Re * (1 + h))[0] - cl) / (Re * h), rtol=1e-4, atol=1e-12
+            )
+
+        # the original airfoil is unchanged
+        cl, cd = af.evaluate(alpha, Re)
+        np.testing.assert_array_equal(cl, cl0)
+        np.testing.assert_array_equal(cd, cd0)
+
+        # the solvers use the tables as well
+        rotor = CCBlade(*self.args, solver="fortran", **self.kwargs)
+        loads, _ = rotor.distributedAeroLoads(10.0, 11.431, 0.0, 0.0)
+        tables = {airfoil: airfoil.tabulate() for airfoil in set(self.args[3])}
+        args = list(self.args)
+        args[3] = [tables[airfoil] for airfoil in self.args[3]]
+        rotor_t = CCBlade(*args, solver="fortran", **self.kwargs)
+        loads_t, _ = rotor_t.distributedAeroLoads(10.0, 11.431, 0.0, 0.0)
+        for key in ("Np", "Tp"):
+            np.testing.assert_allclose(loads_t[key], loads[key], rtol=1e-3)
+
+    def test_airfoil_threads(self):
+
+        # one airfoil evaluated concurrently from many threads (the _bem routines release the GIL)
+        af = self.args[3][5]
+        rng = np.random.default_rng(4)
+        alpha = [rng.uniform(-np.pi, np.pi, 2000) for _ in range(64)]
+        Re = np.exp(rng.uniform(np.log(1e6), np.log(1e7), 2000))
+
+        values = [af.evaluate(a, Re) + af.evaluate_derivatives(a, Re) for a in alpha]
+        with ThreadPoolExecutor(8) as executor:
+            values_t = list(executor.map(lambda a: af.evaluate(a, Re) + af.evaluate_derivatives(a, Re), alpha))
+        for v, v_t in zip(values, values_t):
+            np.testing.assert_array_equal(v_t, v)
+
+    def test_airfoil_library(self):
+
+        basepath = path.join(path.dirname(path.realpath(__file__)), "5MW_AFFiles")
+        alpha = np.linspace(-0.3, 0.3, 25)
+        Re = np.full(25, 5e6)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            library = AirfoilLibrary.build(basepath, path.join(tmp, "5MW.aflib"))
+            for name in library.names:
+                af = CCAirfoil.initFromLibrary(library, name)
+                af0 = CCAirfoil.initFromAerodynFile(path.join(basepath, name + ".dat"))
+                self.assertEqual(af.AFName, name)
+                np.testing.assert_array_equal(af.evaluate(alpha, Re), af0.evaluate(alpha, Re))
+
+    def test_airfoil_set(self):
+
+        af = self.args[3]
+        n = len(af)
+        afset = CCAirfoilSet(af)
+        self.assertEqual(len(afset.airfoils), 8)
+
+        rng = np.random.default_rng(3)
+        alpha = rng.uniform(-0.3, 0.3, (50, n))
+        Re = np.exp(rng.uniform(np.log(1e6), np.log(1e7), (50, n)))
+        values = afset.evaluate_derivatives(alpha, Re)
+        np.testing.assert_array_equal(afset.evaluate(alpha, Re), values[:2])
+        for i in range(n):
+            expected = af[i].evaluate_derivatives(alpha[:, i], Re[:, i])
+            for value, ref in zip(values, expected):
+                np.testing.assert_array_equal(value[:, i], ref)
+
+        # explicit station of each point
+        s = rng.integers(0, n, 100)
+        cl, cd = afset.evaluate(alpha.ravel()[:100], Re.ravel()[:100], s)
+        for j in range(100):
+            self.assertEqual((cl[j], cd[j]), af[s[j]].evaluate(alpha.ravel()[j], Re.ravel()[j]))
+
+        # concurrent evaluation of one set
+        alpha_t = [rng.uniform(-np.pi, np.pi, (500, n)) for _ in range(64)]
+        values = [afset.evaluate_derivatives(a, Re[0]) for a in alpha_t]
+        with ThreadPoolExecutor(8) as executor:
+            values_t = list(executor.map(lambda a: afset.evaluate_derivatives(a, Re[0]), alpha_t))
+        for v, v_t in zip(values, values_t):
+            np.testing.assert_array_equal(v_t, v)
+
+        # repacked when an airfoil changes its splines
+        af_flap = CCAirfoilFlap(
+            np.linspace(-180.0, 180.0, 73),
+            [1e6],
+            np.sin(np.deg2rad(np.linspace(-180.0, 180.0, 73)))[:, np.newaxis, np.newaxis] + [[0.0, 0.1]],
+            np.full((73, 1, 2), 0.01),
+            delta=0.0,
+        )
+        afset = CCAirfoilSet([af_flap] + af[1:])
+        af_flap.set_flap(0.5)
+        cl, cd = afset.evaluate(alpha, Re)
+        np.testing.assert_array_equal(cl[:, 0], af_flap.evaluate(alpha[:, 0], Re[:, 0])[0])
+
+    def test_airfoil_flap(self):
+
+        alpha = np.linspace(-180.0, 180.0, 73)
+        Re = np.array([1e5, 1e6, 5e6, 1e7])
+        flap = np.array([-10.0, 0.0, 5.0, 10.0])
+        a = np.deg2rad(alpha)[:, np.newaxis, np.newaxis]
+        cl = (np.sin(2 * a) + 0.02 * flap) * np.array([1.0, 1.1, 1.2, 1.25])[:, np.newaxis]
+        cd = (1.0 - np.cos(2 * a)) * np.array([0.6, 0.55, 0.5, 0.48])[:, np.newaxis] + 0.01 + 1e-3 * flap**2
+        af = CCAirfoilFlap(alpha, Re, cl, cd, flap=flap)
+        self.assertEqual(af.delta, 5.0)
+
+        rng = np.random.default_rng(4)
+        alpha = rng.uniform(-3.0, 3.0, 100)
+        Re = np.exp(rng.uniform(np.log(1e5), np.log(1e7), 100))
+
+        # the tabs (refined to common knots) and linear interpolation in between
+        for k in range(len(flap)):
+            af.set_flap(flap[k])
+            np.testing.assert_allclose(af.evaluate(alpha, Re), af.tabs[k].evaluate(alpha, Re), rtol=0, atol=1e-14)
+        af.set_flap(-2.5)
+        expected = 0.25 * np.array(af.tabs[0].evaluate(alpha, Re)) + 0.75 * np.array(af.tabs[1].evaluate(alpha, Re))
+        np.testing.assert_allclose(af.evaluate(alpha, Re), expected, rtol=0, atol=1e-14)
+        values = af.evaluate_derivatives(alpha, Re)
+        np.testing.assert_allclose(values[0], af.cl_spline.ev(alpha, Re), rtol=0, atol=1e-12)
+        np.testing.assert_allclose(values[2], af.cl_spline.ev(alpha, Re, dx=1), rtol=0, atol=1e-12)
+        np.testing.assert_allclose(values[5], af.cd_spline.ev(alpha, Re, dy=1), rtol=1e-10, atol=0)
+        af.set_flap(20.0)
+        self.assertEqual(af.delta, 10.0)
+
+        # rotor with flap airfoils built from the NREL 5MW polars shifted by -0.1, 0, +0.1 in cl
+        basepath = path.join(path.dirname(path.realpath(__file__)), "5MW_AFFiles")
+        af = []
+        for name in ("DU30_A17.dat", "NACA64_A17.dat"):
+            alpha, Re, cl, cd, cm = Airfoil.dataGridFromAerodynFile(path.join(basepath, name))
+            cl = cl[..., np.newaxis] + np.array([-0.1, 0.0, 0.1])
+            cd = np.repeat(cd[..., np.newaxis], 3, axis=-1)
+            cm = np.repeat(cm[..., np.newaxis], 3, axis=-1)
+            af.append(CCAirfoilFlap(alpha, Re, cl, cd, cm, flap=[-5.0, 0.0, 5.0]))
+        af = [af[0]] * 8 + [af[1]] * 9
+        args = self.args[:3] + (af,) + self.args[4:]
+        rotor = CCBlade(*args, solver="fortran", **self.kwargs)
+        rotor_tab = CCBlade(*args[:3] + ([afi.tabs[1] for afi in af],) + args[4:], **self.kwargs)
+
+        loads, _ = rotor.distributedAeroLoads(10.0, 11.431, 0.0, 0.0)
+        loads_tab, _ = rotor_tab.distributedAeroLoads(10.0, 11.431, 0.0, 0.0)
+        np.testing.assert_allclose(loads["Np"], loads_tab["Np"], rtol=1e-9)
+
+        for afi in (af[0], af[8]):
+            afi.set_flap(2.5)
+            a = np.linspace(-0.2, 0.3, 5)
+            np.testing.assert_allclose(afi.evaluate_derivatives(a, 1e6)[2], afi.cl_spline.ev(a, 1e6, dx=1), atol=1e-12)
+            np.testing.assert_array_equal(afi.cl_spline.ev(a, 1e6, dy=1), 0.0)
+        loads_flap, _ = rotor.distributedAeroLoads(10.0, 11.431, 0.0, 0.0)
+        self.assertTrue(np.all(loads_flap["Np"][1:-1] > loads["Np"][1:-1]))
+
 
 def suite():
     suite = unittest.TestSuite()
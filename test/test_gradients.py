@@ -174,6 +174,16 @@ class TestGradients(unittest.TestCase):
         self.n = len(self.r)
         self.npts = 1  # len(Uinf)
 
+    def test_single_Re_airfoils(self):
+
+        # the gradients below are checked on single-Re airfoils, fitted and evaluated in alpha only
+        for af in self.af:
+            self.assertTrue(af.one_Re)
+            np.testing.assert_array_equal(af._splint[6], 0)
+            _, _, _, dcl_dRe, _, dcd_dRe = af.evaluate_derivatives(np.linspace(-0.5, 0.5, 11), 1e6)
+            np.testing.assert_array_equal(dcl_dRe, 0.0)
+            np.testing.assert_array_equal(dcd_dRe, 0.0)
+
     def test_dr1(self):
 
         dNp_dr = self.dNp["dr"]
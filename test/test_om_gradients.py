@@ -4,6 +4,8 @@ import unittest
 import numpy as np
 import openmdao.api as om
 from openmdao.utils.assert_utils import assert_check_partials
+
+from ccblade.ccblade import CCBlade, CCAirfoil
 from ccblade.ccblade_component import CCBladeLoads, CCBladeTwist, CCBladeEvaluate, CCBladeGeometry
 
 np.random.seed(314)
@@ -112,6 +114,116 @@ class Test(unittest.TestCase):
 
         assert_check_partials(new_check, rtol=5e-5, atol=10.)
 
+    def test_ccblade_loads_sparse_partials(self):
+        # compute_partials reads the banded (sparse=True) Jacobians into the declared rows/cols.  The
+        # component methods are called directly, with scalar inputs as floats, and compared to the
+        # dense Jacobians of the same rotor.
+        npzfile = np.load(
+            os.path.dirname(os.path.abspath(__file__)) + os.path.sep + "smaller_dataset.npz", allow_pickle=True
+        )
+
+        # 12 stations, with the airfoil of the nearest of the 3 stations of the data set
+        n_span = 12
+        r = np.linspace(npzfile["r"][0], npzfile["r"][-1], n_span)
+        idx = np.abs(r[:, np.newaxis] - npzfile["r"]).argmin(axis=1)
+
+        modeling_options = {
+            "WISDEM": {"RotorSE": {"n_span": n_span, "n_aoa": npzfile["aoa"].size, "n_Re": 1, "n_tab": 1}}
+        }
+        prob = om.Problem()
+        comp = CCBladeLoads(modeling_options=modeling_options)
+        prob.model.add_subsystem("comp", comp, promotes=["*"])
+        prob.setup()
+
+        inputs = {
+            "airfoils_aoa": npzfile["aoa"],
+            "airfoils_Re": npzfile["Re"],
+            "r": r,
+            "chord": np.interp(r, npzfile["r"], npzfile["chord"]),
+            "theta": np.interp(r, npzfile["r"], npzfile["theta"]),
+            "V_load": 12.0,
+            "Omega_load": 7.0,
+            "pitch_load": 2.0,
+            "azimuth_load": 30.0,
+            "Rhub": 1.0,
+            "Rtip": 70.0,
+            "hub_height": 100.0,
+            "precone": 2.5,
+            "tilt": 5.0,
+            "yaw": 3.0,
+            "precurve": 0.001 * (r - r[0]) ** 2,
+            "precurveTip": 0.001 * (70.0 - r[0]) ** 2,
+            "rho": 1.225,
+            "mu": 1.81206e-5,
+            "shearExp": 0.25,
+        }
+        for name in ("cl", "cd", "cm"):
+            inputs["airfoils_" + name] = np.moveaxis(npzfile[name][:, idx, :, np.newaxis], 0, 1)
+        discrete_inputs = {
+            "nBlades": 3,
+            "nSector": 4,
+            "tiploss": True,
+            "hubloss": True,
+            "wakerotation": True,
+            "usecd": True,
+        }
+        outputs = {"loads_Pz": np.zeros(n_span)}
+        J = {}
+        comp.compute(inputs, outputs, discrete_inputs, {})
+        comp.compute_partials(inputs, J, discrete_inputs)
+
+        af = [
+            CCAirfoil(
+                inputs["airfoils_aoa"],
+                inputs["airfoils_Re"],
+                *(inputs["airfoils_" + name][i, :, :, 0] for name in ("cl", "cd", "cm")),
+            )
+            for i in range(n_span)
+        ]
+        rotor = CCBlade(
+            r,
+            inputs["chord"],
+            inputs["theta"],
+            af,
+            inputs["Rhub"],
+            inputs["Rtip"],
+            3,
+            inputs["rho"],
+            inputs["mu"],
+            inputs["precone"],
+            inputs["tilt"],
+            inputs["yaw"],
+            inputs["shearExp"],
+            inputs["hub_height"],
+            4,
+            inputs["precurve"],
+            inputs["precurveTip"],
+            derivatives=True,
+            sparse=False,
+        )
+        loads, derivs = rotor.distributedAeroLoads(12.0, 7.0, 2.0, 30.0)
+        np.testing.assert_array_equal(outputs["loads_Px"], loads["Np"])
+
+        rows, cols = comp.rows_tri, comp.cols_tri
+        for output, key, sign in (("loads_Px", "dNp", 1.0), ("loads_Py", "dTp", -1.0)):
+            dense = derivs[key]
+            for name, wrt in (("dr", "r"), ("dchord", "chord"), ("dtheta", "theta"), ("dprecurve", "precurve")):
+                # the declared entries hold the dense Jacobian, which is zero elsewhere
+                jac = np.zeros((n_span, n_span))
+                if wrt == "precurve":
+                    jac[rows, cols] = J[output, wrt]
+                else:
+                    jac[np.diag_indices(n_span)] = J[output, wrt]
+                np.testing.assert_allclose(jac, sign * dense[name], rtol=1e-12, atol=0.0)
+            for name, wrt in (
+                ("dRhub", "Rhub"),
+                ("dprecone", "precone"),
+                ("dUinf", "V_load"),
+                ("dazimuth", "azimuth_load"),
+            ):
+                np.testing.assert_allclose(J[output, wrt], sign * np.squeeze(dense[name]), rtol=1e-12, atol=0.0)
+        self.assertTrue(np.all(derivs["dNp"]["dprecurve"][rows, cols] != 0.0))
+
     @unittest.skip("Not useful and now OpenMDAO complains")
     def test_ccblade_twist(self):
         """